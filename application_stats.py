@@ -0,0 +1,189 @@
+"""
+Application Statistics for Reports
+
+Hourly aggregates of the job bots' applications table, keyed by hour, platform
+and status. SQLite triggers keep them current on every insert, upsert and delete,
+so the bots need no changes and a 24-hour report reads a few dozen aggregate rows
+no matter how long the application history grows. The first call on an existing
+database creates the triggers and backfills the aggregates once.
+"""
+
+import os
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = 'jobautomation/logs/job_applications.db'
+
+# Outcome statuses written by the job bots
+VISITED = 'visited'
+SUBMITTED = 'submitted'
+UNVERIFIED = 'unverified'
+FAILED = 'failed'
+OUTCOMES = (SUBMITTED, UNVERIFIED, FAILED)
+
+# Local-time hour bucket ('YYYY-MM-DDTHH') and display platform of a row
+_HOUR = "replace(substr(coalesce({row}.timestamp, {row}.created_at), 1, 13), ' ', 'T')"
+_PLATFORM = "coalesce(nullif({row}.platform_name, ''), {row}.platform, '')"
+
+_ADD = '''
+    INSERT INTO application_hourly (hour, platform, status, applications, duration_total, duration_count)
+    VALUES ({hour}, {platform}, coalesce({row}.status, ''), 1,
+            coalesce({row}.duration_seconds, 0), {row}.duration_seconds IS NOT NULL)
+    ON CONFLICT(hour, platform, status) DO UPDATE SET
+        applications = applications + 1,
+        duration_total = duration_total + excluded.duration_total,
+        duration_count = duration_count + excluded.duration_count;
+'''
+
+_REMOVE = '''
+    UPDATE application_hourly SET
+        applications = applications - 1,
+        duration_total = duration_total - coalesce({row}.duration_seconds, 0),
+        duration_count = duration_count - ({row}.duration_seconds IS NOT NULL)
+    WHERE hour = {hour} AND platform = {platform} AND status = coalesce({row}.status, '');
+'''
+
+
+def _statement(template: str, row: str) -> str:
+    return template.format(row=row, hour=_HOUR.format(row=row), platform=_PLATFORM.format(row=row))
+
+
+_TRIGGERS = ('application_hourly_insert', 'application_hourly_update', 'application_hourly_delete')
+
+
+def _aggregates_ready(cursor: sqlite3.Cursor) -> bool:
+    """The triggers are created last, in the same transaction as the backfill"""
+    found = cursor.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN ({', '.join('?' * len(_TRIGGERS))})",
+        _TRIGGERS
+    ).fetchone()[0]
+    return found == len(_TRIGGERS)
+
+
+def ensure_hourly_aggregates(conn: sqlite3.Connection) -> bool:
+    """
+    Create the aggregate table and its triggers, backfilling from existing rows.
+
+    Everything runs in one write transaction, so an interrupted setup leaves nothing
+    behind and a concurrent first call waits, then finds the work done.
+
+    Args:
+        conn: Connection to a database that has an applications table
+
+    Returns:
+        True if the aggregates were (re)built from the applications table
+    """
+    cursor = conn.cursor()
+    if _aggregates_ready(cursor):
+        return False
+
+    cursor.execute('BEGIN IMMEDIATE')
+    try:
+        if _aggregates_ready(cursor):  # Another process finished while we waited for the lock
+            conn.rollback()
+            return False
+
+        # A table without triggers is left over from an older, non-transactional setup
+        cursor.execute('DROP TABLE IF EXISTS application_hourly')
+        cursor.execute('''
+            CREATE TABLE application_hourly (
+                hour TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                status TEXT NOT NULL,
+                applications INTEGER NOT NULL DEFAULT 0,
+                duration_total REAL NOT NULL DEFAULT 0,
+                duration_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, platform, status)
+            )
+        ''')
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(applications)')}
+        duration = 'duration_seconds' if 'duration_seconds' in columns else 'NULL'
+        cursor.execute(f'''
+            INSERT INTO application_hourly (hour, platform, status, applications, duration_total, duration_count)
+            SELECT {_HOUR.format(row='a')}, {_PLATFORM.format(row='a')}, coalesce(a.status, ''),
+                   COUNT(*), coalesce(SUM({duration}), 0), COUNT({duration})
+            FROM applications a
+            GROUP BY 1, 2, 3
+        ''')
+        if duration == 'NULL':
+            cursor.execute('ALTER TABLE applications ADD COLUMN duration_seconds REAL')
+
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS application_hourly_insert AFTER INSERT ON applications
+            BEGIN {_statement(_ADD, 'NEW')} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS application_hourly_update
+            AFTER UPDATE OF platform, platform_name, status, timestamp, duration_seconds ON applications
+            BEGIN {_statement(_REMOVE, 'OLD')} {_statement(_ADD, 'NEW')} END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS application_hourly_delete AFTER DELETE ON applications
+            BEGIN {_statement(_REMOVE, 'OLD')} END
+        ''')
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    logger.info("Application hourly aggregates created and backfilled")
+    return True
+
+
+def last_24h(db_path: str = DEFAULT_DB_PATH, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+    """
+    Summarize the last 24 hourly buckets (the current hour and the 23 before it).
+
+    Args:
+        db_path: Job applications database
+        now: Report time (defaults to now, local time like the stored timestamps)
+
+    Returns:
+        {'since', 'platforms': {name: counts}, 'totals': counts}, where counts holds
+        visited/submitted/unverified/failed/attempted, yield (submitted / attempted)
+        and avg_duration; None if the database has no applications table
+    """
+    if not os.path.exists(db_path):
+        return None
+    now = now or datetime.now()
+    since = (now - timedelta(hours=23)).strftime('%Y-%m-%dT%H')
+
+    conn = sqlite3.connect(db_path)
+    try:
+        if not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'applications'").fetchone():
+            return None
+        ensure_hourly_aggregates(conn)
+        rows = conn.execute('''
+            SELECT platform, status, SUM(applications), SUM(duration_total), SUM(duration_count)
+            FROM application_hourly
+            WHERE hour >= ?
+            GROUP BY platform, status
+        ''', (since,)).fetchall()
+    finally:
+        conn.close()
+
+    def empty() -> Dict[str, float]:
+        return {VISITED: 0, SUBMITTED: 0, UNVERIFIED: 0, FAILED: 0, 'duration_total': 0.0, 'duration_count': 0}
+
+    platforms: Dict[str, Dict[str, float]] = {}
+    totals = empty()
+    for platform, status, count, duration_total, duration_count in rows:
+        if not count or status not in totals:
+            continue
+        for bucket in (platforms.setdefault(platform or 'Unknown', empty()), totals):
+            bucket[status] += count
+            bucket['duration_total'] += duration_total
+            bucket['duration_count'] += duration_count
+
+    for bucket in list(platforms.values()) + [totals]:
+        bucket['attempted'] = sum(bucket[status] for status in OUTCOMES)
+        bucket['yield'] = bucket[SUBMITTED] / bucket['attempted'] if bucket['attempted'] else 0.0
+        duration_count = bucket.pop('duration_count')
+        duration_total = bucket.pop('duration_total')
+        bucket['avg_duration'] = duration_total / duration_count if duration_count else 0.0
+
+    return {'since': since.replace('T', ' ') + ':00', 'platforms': platforms, 'totals': totals}
@@ -0,0 +1,230 @@
+"""
+Async Email Automation
+
+asyncio counterpart of EmailAutomation for code that already runs an event loop.
+Validation, message preparation and retry rules are shared with EmailAutomation.
+Blocking SMTP I/O runs on a small dedicated thread pool sized to the connection
+pool, so at most pool_size connections are busy while any number of sends wait
+as coroutines. Retry backoff and rate limiting await asyncio.sleep and never
+hold a thread or a connection.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from email_automation import EmailAutomation
+from prepared_message import PreparedMessage
+from rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncEmailAutomation:
+    """
+    Non-blocking email sender with EmailAutomation's semantics
+
+    Inside a running loop:
+
+        async with AsyncEmailAutomation() as mailer:
+            await mailer.send_email('someone@example.com', 'Subject', 'Body')
+
+    From synchronous code (such as a browser worker) that keeps a loop running in a
+    background thread, schedule sends with
+    asyncio.run_coroutine_threadsafe(mailer.send_email(...), loop) and carry on.
+
+    Cancelling a send only cancels the wait: a message already handed to the
+    SMTP thread finishes sending.
+    """
+
+    def __init__(self, client: Optional[EmailAutomation] = None, **kwargs):
+        """
+        Initialize the async sender.
+
+        Args:
+            client: Existing EmailAutomation to share (its pool is reused and left
+                open on close); when omitted one is created from kwargs
+            **kwargs: EmailAutomation arguments (credentials, server, port,
+                max_retries, pool_size, size limits)
+        """
+        self._owns_client = client is None
+        self.client = client or EmailAutomation(**kwargs)
+        # One worker per pooled connection: extra sends queue as coroutines, not threads
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.client.pool.max_size,
+            thread_name_prefix='smtp-async'
+        )
+
+        logger.info("AsyncEmailAutomation initialized successfully")
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the SMTP thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def close(self) -> None:
+        """Close pooled connections (when owned) and stop the SMTP threads."""
+        if self._owns_client:
+            await self._run(self.client.close)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def send_email(
+        self,
+        recipient_email: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send an email with optional HTML content and attachments.
+
+        Args:
+            recipient_email: Recipient's email address
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
+            cc: Optional list of CC recipients
+            bcc: Optional list of BCC recipients
+            attachments: Optional list of file paths to attach
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        if not self.client.validate_recipients(recipient_email, cc, bcc):
+            return False
+
+        # Attachment reads happen off the loop
+        prepared = await self._run(self.client.prepare_message, subject, body, html_body, attachments)
+        if prepared is None:
+            logger.error(f"Email to {recipient_email} not sent")
+            return False
+        return await self.send_prepared(prepared, recipient_email, cc, bcc)
+
+    async def send_prepared(
+        self,
+        prepared: PreparedMessage,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send an already-built message to one recipient, retrying with non-blocking backoff.
+
+        Args:
+            prepared: Message built once for the whole send or batch
+            recipient_email: Recipient's email address
+            cc: Optional list of CC recipients
+            bcc: Optional list of BCC recipients
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        recipients = [recipient_email] + list(cc or []) + list(bcc or [])
+
+        for attempt in range(1, self.client.max_retries + 1):
+            try:
+                logger.info(f"Attempt {attempt} of {self.client.max_retries} to send email to {recipient_email}")
+                await self._run(
+                    self.client.pool.send_data,
+                    self.client.sender_email,
+                    recipients,
+                    lambda: prepared.iter_data(recipient_email, cc),
+                    size=prepared.size
+                )
+                logger.info(f"Email sent successfully to {recipient_email}")
+                return True
+
+            except Exception as e:
+                wait_time = self.client._retry_delay(attempt, e)
+                if wait_time is None:
+                    return False
+                await asyncio.sleep(wait_time)
+
+        return False
+
+    async def send_batch_emails(
+        self,
+        recipients: List[str],
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        per_second: Optional[float] = None,
+        per_minute: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None
+    ) -> dict:
+        """
+        Send one message to many recipients concurrently.
+
+        Every valid recipient gets its own task; the connection pool bounds how many
+        are on the wire at once, and the optional rate limits are awaited rather than
+        slept.
+
+        Args:
+            recipients: List of recipient email addresses
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
+            per_second: Sustained send rate
+            per_minute: Hard cap on sends in any 60 seconds
+            progress_callback: Called as (completed, total, result) after each recipient
+
+        Returns:
+            Same shape as EmailAutomation.send_batch_emails in concurrent mode
+        """
+        prepared = await self._run(self.client.prepare_message, subject, body, html_body)
+        if prepared is None:
+            logger.error("Batch not sent")
+            return self.client._unsent_batch(recipients)
+
+        total = len(recipients)
+        results = {'success': 0, 'failed': 0, 'invalid': 0, 'results': [None] * total}
+        limiter = RateLimiter(per_second, per_minute)
+        started = time.perf_counter()
+        completed = 0
+
+        async def send_one(index: int, recipient: str):
+            nonlocal completed
+            wait = limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            send_started = time.perf_counter()
+            try:
+                success = await self.send_prepared(prepared, recipient)
+            except Exception as e:
+                logger.error(f"Unexpected error sending to {recipient}: {str(e)}")
+                success = False
+            result = {'recipient': recipient, 'status': 'sent' if success else 'failed',
+                      'seconds': time.perf_counter() - send_started}
+            results['results'][index] = result
+            results['success' if success else 'failed'] += 1
+            completed += 1
+            if progress_callback:
+                progress_callback(completed, total, result)
+
+        tasks = []
+        for index, recipient in enumerate(recipients):
+            if not self.client.validate_email(recipient):
+                logger.warning(f"Skipping invalid email: {recipient}")
+                results['invalid'] += 1
+                results['results'][index] = {'recipient': recipient, 'status': 'invalid', 'seconds': 0.0}
+                completed += 1
+                continue
+            tasks.append(send_one(index, recipient))
+        await asyncio.gather(*tasks)
+
+        results['elapsed_seconds'] = time.perf_counter() - started
+        results['rate_limited_seconds'] = limiter.waited_seconds
+        self.client._log_batch_summary(results)
+        return results
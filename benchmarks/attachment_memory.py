@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Attachment Encoding Memory Benchmark
+
+Compares peak Python heap usage (via tracemalloc) of the old attachment path,
+which read the whole file, base64-encoded it with MIMEBase and serialized the
+message with as_string(), against PreparedMessage, which streams large files
+through an incremental encoder in fixed-size chunks. The serialized message is
+fed into a hash instead of a socket so only encoding cost is measured.
+
+Usage:
+    python benchmarks/attachment_memory.py --size-mb 200
+"""
+
+import os
+import sys
+import time
+import argparse
+import hashlib
+import tempfile
+import tracemalloc
+from email import encoders
+from email.mime.base import MIMEBase
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prepared_message import PreparedMessage  # noqa: E402
+
+SENDER = 'sender@example.com'
+RECIPIENTS = ['first@example.com', 'second@example.com']
+
+
+def make_attachment(directory: str, size_mb: int) -> str:
+    """Write size_mb MiB of random bytes to a file and return its path."""
+    path = os.path.join(directory, 'report.bin')
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(os.urandom(1024 * 1024))
+    return path
+
+
+def send_legacy(path: str) -> int:
+    """Old send_email path: rebuild and fully serialize the message per recipient."""
+    sent = 0
+    for recipient in RECIPIENTS:
+        msg = MIMEMultipart('alternative')
+        msg['From'] = SENDER
+        msg['To'] = recipient
+        msg['Subject'] = 'Report'
+        msg.attach(MIMEText('See attached.', 'plain'))
+        with open(path, 'rb') as attachment:
+            part = MIMEBase('application', 'octet-stream')
+            part.set_payload(attachment.read())
+        encoders.encode_base64(part)
+        part.add_header('Content-Disposition', f'attachment; filename= {os.path.basename(path)}')
+        msg.attach(part)
+        sink = hashlib.sha256()
+        data = msg.as_string().encode('utf-8')
+        sink.update(data)
+        sent += len(data)
+    return sent
+
+
+def send_streamed(path: str) -> int:
+    """PreparedMessage path: build once, stream chunks per recipient."""
+    prepared = PreparedMessage(SENDER, 'Report', 'See attached.', attachments=[path])
+    sent = 0
+    for recipient in RECIPIENTS:
+        sink = hashlib.sha256()
+        for chunk in prepared.iter_data(recipient):
+            sink.update(chunk)
+            sent += len(chunk)
+    return sent
+
+
+def measure(name: str, func, path: str) -> dict:
+    """Run func under tracemalloc and return its peak memory and timing."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    sent = func(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'name': name, 'bytes_sent': sent, 'seconds': elapsed, 'peak_mib': peak / (1024 * 1024)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=int, default=100, help='Attachment size in MiB (default 100)')
+    parser.add_argument('--skip-legacy', action='store_true', help='Only run the streamed path')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = make_attachment(directory, args.size_mb)
+        results = []
+        if not args.skip_legacy:
+            results.append(measure('legacy (read + as_string)', send_legacy, path))
+        results.append(measure('streamed (PreparedMessage)', send_streamed, path))
+
+    print("=" * 70)
+    print(f" ATTACHMENT ENCODING: {args.size_mb} MiB file, {len(RECIPIENTS)} recipients")
+    print("=" * 70)
+    print(f"{'Path':<30} {'Peak MiB':>10} {'Seconds':>10} {'MiB sent':>10}")
+    for result in results:
+        print(f"{result['name']:<30} {result['peak_mib']:>10.1f} {result['seconds']:>10.2f} "
+              f"{result['bytes_sent'] / (1024 * 1024):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
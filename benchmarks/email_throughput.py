@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Email Sending Throughput Benchmark
+
+Runs EmailAutomation against the in-process SMTP stand-in in smtp_stub.py, so no
+Gmail account or network is involved. Two groups of scenarios are measured:
+
+    send_email   one call per message, for each body size and attachment count
+    batch        send_batch_emails for each batch size, sequential (no delay)
+                 and concurrent (--workers)
+
+Each scenario reports messages per second, p50/p99 per-message latency and
+tracemalloc peak (which also covers the stand-in's threads). Retries after
+injected failures skip the exponential backoff sleep, so the numbers measure
+sending work rather than waiting. Results are written as JSON; pass a previous
+file with --compare to print the change in throughput per scenario.
+
+Usage:
+    python benchmarks/email_throughput.py --latency 0.002 --output results.json
+    python benchmarks/email_throughput.py --compare results.json
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+import tempfile
+import subprocess
+import tracemalloc
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from email_automation import EmailAutomation  # noqa: E402
+from smtp_stub import LocalSMTPServer  # noqa: E402
+
+SENDER = 'bench@example.com'
+
+
+class NoBackoffEmailAutomation(EmailAutomation):
+    """EmailAutomation that keeps its retry decisions but does not sleep between attempts"""
+
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        delay = super()._retry_delay(attempt, error)
+        return None if delay is None else 0
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def make_attachments(directory: str, count: int, size_kb: int) -> List[str]:
+    """Write `count` files of random bytes and return their paths."""
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f'attachment_{i}.bin')
+        with open(path, 'wb') as f:
+            f.write(os.urandom(size_kb * 1024))
+        paths.append(path)
+    return paths
+
+
+def make_body(size_kb: int) -> str:
+    line = 'The quick brown fox jumps over the lazy dog. ' * 2 + '\n'
+    return (line * (size_kb * 1024 // len(line) + 1))[:size_kb * 1024]
+
+
+def run_scenario(server: LocalSMTPServer, args, name: str, params: Dict[str, Any], send) -> Dict[str, Any]:
+    """Run one scenario with a fresh client and collect its measurements."""
+    server.reset_stats()
+    client = NoBackoffEmailAutomation(
+        SENDER, 'benchmark', server.host, server.port,
+        max_retries=args.max_retries, use_starttls=False, pool_size=max(4, args.workers)
+    )
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        latencies, sent, failed = send(client)
+    finally:
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        client.close()
+
+    messages = sent + failed
+    return {
+        'scenario': name,
+        **params,
+        'messages': messages,
+        'sent': sent,
+        'failed': failed,
+        'seconds': round(elapsed, 4),
+        'messages_per_second': round(messages / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        'p99_ms': round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        'peak_mib': round(peak / (1024 * 1024), 3),
+        'server': dict(server.stats),
+    }
+
+
+def bench_send_email(server, args, directory: str) -> List[Dict[str, Any]]:
+    """One send_email call per message for each body size and attachment count."""
+    results = []
+    for body_kb in args.body_kb:
+        body = make_body(body_kb)
+        for count in args.attachments:
+            attachments = make_attachments(directory, count, args.attachment_kb) if count else None
+
+            def send(client):
+                latencies, sent = [], 0
+                for i in range(args.messages):
+                    started = time.perf_counter()
+                    ok = client.send_email(f'user{i}@example.com', 'Benchmark', body, attachments=attachments)
+                    latencies.append(time.perf_counter() - started)
+                    sent += ok
+                return latencies, sent, args.messages - sent
+
+            name = f'send_email body={body_kb}KiB attachments={count}x{args.attachment_kb}KiB'
+            params = {'api': 'send_email', 'body_kb': body_kb, 'attachments': count,
+                      'attachment_kb': args.attachment_kb if count else 0}
+            results.append(run_scenario(server, args, name, params, send))
+            print(f"  {name}: {results[-1]['messages_per_second']:,.1f} msg/s")
+    return results
+
+
+def bench_batches(server, args) -> List[Dict[str, Any]]:
+    """send_batch_emails for each batch size, sequentially and with a worker pool."""
+    results = []
+    body = make_body(args.body_kb[0])
+    for batch_size in args.batch_sizes:
+        recipients = [f'user{i}@example.com' for i in range(batch_size)]
+        for workers in sorted({1, args.workers}):
+
+            def send(client):
+                if workers > 1:
+                    outcome = client.send_batch_emails(recipients, 'Benchmark', body, max_workers=workers)
+                else:
+                    outcome = client.send_batch_emails(recipients, 'Benchmark', body, rate_limit_delay=0)
+                latencies = [r['seconds'] for r in outcome['results'] if r['status'] != 'invalid']
+                return latencies, outcome['success'], outcome['failed']
+
+            name = f'send_batch_emails size={batch_size} workers={workers}'
+            params = {'api': 'send_batch_emails', 'body_kb': args.body_kb[0],
+                      'batch_size': batch_size, 'workers': workers}
+            results.append(run_scenario(server, args, name, params, send))
+            print(f"  {name}: {results[-1]['messages_per_second']:,.1f} msg/s")
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: Dict[str, Any], baseline: Optional[Dict[str, Any]]):
+    previous = {r['scenario']: r for r in baseline['results']} if baseline else {}
+    print("=" * 100)
+    print(f" EMAIL THROUGHPUT: latency {report['config']['latency'] * 1000:.1f} ms, "
+          f"failure rate {report['config']['failure_rate']:.1%}")
+    print("=" * 100)
+    print(f"{'Scenario':<56} {'msg/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'peak MiB':>9}"
+          + (f" {'vs base':>8}" if previous else ''))
+    for result in report['results']:
+        line = (f"{result['scenario']:<56} {result['messages_per_second']:>9,.1f} "
+                f"{result['p50_ms'] or 0:>8.2f} {result['p99_ms'] or 0:>8.2f} {result['peak_mib']:>9.2f}")
+        before = previous.get(result['scenario'])
+        if before and before['messages_per_second']:
+            change = result['messages_per_second'] / before['messages_per_second'] - 1
+            line += f" {change:>+8.1%}"
+        elif previous:
+            line += f" {'new':>8}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--latency', type=float, default=0.002, help='Server delay per message in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Fraction of messages rejected with 451')
+    parser.add_argument('--max-retries', type=int, default=3, help='EmailAutomation max_retries')
+    parser.add_argument('--messages', type=int, default=100, help='Messages per send_email scenario')
+    parser.add_argument('--body-kb', type=int, nargs='+', default=[1, 64], help='Body sizes in KiB')
+    parser.add_argument('--attachments', type=int, nargs='+', default=[0, 1, 4], help='Attachment counts')
+    parser.add_argument('--attachment-kb', type=int, default=256, help='Size of each attachment in KiB')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[10, 100, 1000], help='Batch sizes')
+    parser.add_argument('--workers', type=int, default=4, help='max_workers for the concurrent batches')
+    parser.add_argument('--output', default='email_throughput.json', help='Where to write the JSON results')
+    parser.add_argument('--compare', help='Previous JSON results to compare against')
+    parser.add_argument('--verbose', action='store_true', help='Keep EmailAutomation logging enabled')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    report = {
+        'benchmark': 'email_throughput',
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'verbose')},
+        'results': [],
+    }
+
+    with LocalSMTPServer(latency=args.latency, failure_rate=args.failure_rate) as server:
+        with tempfile.TemporaryDirectory() as directory:
+            report['results'].extend(bench_send_email(server, args, directory))
+        report['results'].extend(bench_batches(server, args))
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print_report(report, baseline)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
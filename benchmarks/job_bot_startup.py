@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Job Bot Startup Benchmark
+
+Measures cold start of the job automation entry points in fresh interpreters: the
+bot module import every invocation used to pay (Selenium, the bot's helpers and
+their dependencies) against the job_bot.py subcommands that do not need a browser.
+Each command runs --runs times; the median wall time and the number of modules
+imported (from -X importtime) are reported, and the slowest imports can be listed.
+
+Usage:
+    python benchmarks/job_bot_startup.py --runs 10 --top 10
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import sqlite3
+import argparse
+import tempfile
+import statistics
+import subprocess
+import time
+
+JOB_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'jobautomation')
+IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def make_fixtures(directory: str) -> dict:
+    """A config and .env from the shipped templates, plus a small applications database."""
+    config = os.path.join(directory, 'config.json')
+    env = os.path.join(directory, '.env')
+    shutil.copy(os.path.join(JOB_DIR, 'config', 'config.template.json'), config)
+    shutil.copy(os.path.join(JOB_DIR, 'config', '.env.example'), env)
+
+    db = os.path.join(directory, 'job_applications.db')
+    conn = sqlite3.connect(db)
+    conn.execute('CREATE TABLE applications (id INTEGER PRIMARY KEY, platform TEXT, platform_name TEXT, '
+                 'status TEXT, timestamp TEXT)')
+    conn.executemany('INSERT INTO applications (platform, platform_name, status, timestamp) VALUES (?, ?, ?, ?)',
+                     [('dice', 'Dice.com', 'submitted', '2024-01-01T10:00:00')] * 100)
+    conn.commit()
+    conn.close()
+    return {'config': config, 'env': env, 'db': db}
+
+
+def commands(fixtures: dict) -> dict:
+    cli = os.path.join(JOB_DIR, 'job_bot.py')
+    return {
+        'import job_apply_all_platforms': ['-c', 'import job_apply_all_platforms'],
+        'import job_autoapply': ['-c', 'import job_autoapply'],
+        'job_bot.py --help': [cli, '--help'],
+        'job_bot.py plan': [cli, 'plan', '--config', fixtures['config'], '--env', fixtures['env']],
+        'job_bot.py stats': [cli, 'stats', '--db', fixtures['db']],
+    }
+
+
+def measure(args: list, runs: int) -> dict:
+    """Median wall time of `python <args>`, and its imports from one -X importtime run."""
+    times = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=JOB_DIR, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        times.append(time.perf_counter() - started)
+
+    traced = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=JOB_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    imports = []
+    for line in traced.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            imports.append({'module': match.group(4), 'cumulative_us': int(match.group(2)),
+                            'top_level': len(match.group(3)) <= 1})
+    top_level = sorted((i for i in imports if i['top_level']), key=lambda i: -i['cumulative_us'])
+    return {
+        'median_ms': statistics.median(times) * 1000,
+        'min_ms': min(times) * 1000,
+        'modules': len(imports),
+        'slowest': [(i['module'], i['cumulative_us'] / 1000) for i in top_level],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (default 5)')
+    parser.add_argument('--top', type=int, default=0, help='List the N slowest top-level imports per command')
+    parser.add_argument('--output', help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        fixtures = make_fixtures(directory)
+        results = {name: measure(command, args.runs) for name, command in commands(fixtures).items()}
+
+    baseline = max(results.values(), key=lambda r: r['median_ms'])['median_ms']
+    print("=" * 78)
+    print(f" JOB BOT STARTUP: median of {args.runs} cold interpreter runs")
+    print("=" * 78)
+    print(f"{'Command':<34} {'Median ms':>10} {'Min ms':>9} {'Modules':>8} {'vs slowest':>11}")
+    for name, result in results.items():
+        print(f"{name:<34} {result['median_ms']:>10.0f} {result['min_ms']:>9.0f} {result['modules']:>8} "
+              f"{result['median_ms'] / baseline:>10.0%}")
+        for module, ms in result['slowest'][:args.top]:
+            print(f"    {module:<40} {ms:>8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'runs': args.runs, 'python': sys.version.split()[0], 'results': results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+In-process SMTP Stand-in for Benchmarks
+
+A minimal ESMTP server on a random localhost port that speaks just enough of the
+protocol for SMTPConnectionPool: EHLO (advertising AUTH and SIZE), AUTH, MAIL,
+RCPT, DATA, RSET, NOOP and QUIT. Message data is counted and discarded, never
+stored. Latency and failures can be injected to mimic a remote relay:
+
+    with LocalSMTPServer(latency=0.005, failure_rate=0.02) as server:
+        EmailAutomation('bench@example.com', 'x', server.host, server.port, use_starttls=False)
+"""
+
+import random
+import threading
+import time
+import socketserver
+from typing import Dict, Optional
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """One SMTP session per client connection"""
+
+    def reply(self, line: str):
+        self.wfile.write((line + '\r\n').encode('ascii'))
+        self.wfile.flush()
+
+    def handle(self):
+        server = self.server
+        server.count('connections')
+        self.reply('220 localhost ESMTP benchmark stand-in')
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode('ascii', 'replace').strip()
+            verb = command[:4].upper()
+
+            if verb in ('EHLO', 'HELO'):
+                self.wfile.write(b'250-localhost\r\n250-AUTH PLAIN LOGIN\r\n'
+                                 + f'250 SIZE {server.max_size}\r\n'.encode('ascii'))
+                self.wfile.flush()
+            elif verb == 'AUTH':
+                server.count('logins')
+                self.reply('535 5.7.8 Authentication rejected' if server.reject_auth else '235 2.7.0 Accepted')
+            elif verb in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self.reply('250 2.0.0 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                # Read in bulk and only look for the terminator, so the stand-in's own
+                # cost stays small next to the client's
+                size, tail = 0, b'\r\n'
+                while True:
+                    data = self.rfile.read1(65536)
+                    if not data:
+                        return
+                    size += len(data)
+                    if (tail + data).find(b'\r\n.\r\n') != -1:
+                        break
+                    tail = (tail + data)[-4:]
+                server.count('data_commands')
+                server.count('bytes_received', size)
+                if server.latency:
+                    time.sleep(server.latency)
+                if server.should_fail():
+                    server.count('rejected')
+                    self.reply(f'{server.fail_code} 4.3.0 Injected failure')
+                else:
+                    server.count('accepted')
+                    self.reply('250 2.0.0 Queued')
+            elif verb == 'QUIT':
+                self.reply('221 2.0.0 Bye')
+                return
+            else:
+                self.reply('502 5.5.2 Command not implemented')
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """
+    Threaded SMTP stand-in bound to 127.0.0.1 on a free port
+
+    Counters in `stats` (connections, logins, data_commands, accepted, rejected,
+    bytes_received) are cumulative; call reset_stats() between scenarios.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        fail_code: int = 451,
+        reject_auth: bool = False,
+        max_size: int = 100 * 1024 * 1024,
+        seed: Optional[int] = 42
+    ):
+        """
+        Initialize the server (call start() or use it as a context manager).
+
+        Args:
+            latency: Seconds to wait after each message's data before replying
+            failure_rate: Fraction of messages answered with fail_code instead of 250
+            fail_code: SMTP reply code for injected failures (4xx transient, 5xx permanent)
+            reject_auth: Answer every AUTH with 535
+            max_size: SIZE limit advertised in the EHLO reply
+            seed: Seed for the failure injection, so runs are repeatable
+        """
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.fail_code = fail_code
+        self.reject_auth = reject_auth
+        self.max_size = max_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    @property
+    def host(self) -> str:
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def should_fail(self) -> bool:
+        if not self.failure_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.failure_rate
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {'connections': 0, 'logins': 0, 'data_commands': 0,
+                          'accepted': 0, 'rejected': 0, 'bytes_received': 0}
+
+    def start(self) -> 'LocalSMTPServer':
+        """Serve from a daemon thread"""
+        self._thread = threading.Thread(target=self.serve_forever, name='smtp-stand-in', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> 'LocalSMTPServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
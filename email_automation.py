@@ -8,16 +8,23 @@ Credentials are managed through environment variables for security.
 import smtplib
 import logging
 import os
-import re
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
-from typing import Optional, List
+import uuid
+import html
+import sqlite3
+from string import Template
+from typing import Any, Callable, Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import datetime
 from dotenv import load_dotenv
 import time
 
+from smtp_pool import SMTPConnectionPool
+from rate_limiter import RateLimiter
+from prepared_message import PreparedMessage, MessageTooLarge
+from outbox import Outbox, content_hash, is_permanent_error, SENT, PENDING
+from recipient_source import EMAIL_PATTERN, RecipientReader
+import application_stats
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -51,7 +58,13 @@ class EmailAutomation:
         sender_password: Optional[str] = None,
         smtp_server: str = "smtp.gmail.com",
         smtp_port: int = 587,
-        max_retries: int = 3
+        max_retries: int = 3,
+        use_starttls: bool = True,
+        pool_size: int = 4,
+        max_messages_per_connection: int = 100,
+        max_attachment_size: Optional[int] = None,
+        max_message_size: Optional[int] = None,
+        outbox: Optional[Outbox] = None
     ):
         """
         Initialize the EmailAutomation instance.
@@ -62,12 +75,22 @@ class EmailAutomation:
             smtp_server: SMTP server address
             smtp_port: SMTP port (587 for TLS, 465 for SSL)
             max_retries: Maximum number of retry attempts for failed sends
+            use_starttls: Upgrade the connection with STARTTLS (disable only for local test servers)
+            pool_size: Maximum persistent SMTP connections kept open
+            max_messages_per_connection: Reconnect after this many messages on one connection
+            max_attachment_size: Reject attachments larger than this many bytes
+            max_message_size: Reject messages whose encoded body exceeds this many bytes
+            outbox: Durable queue; when set, sends that run out of retries are queued
+                for a later drain and batches are sent through it (resumable)
         """
         self.sender_email = sender_email or os.getenv('SENDER_EMAIL')
         self.sender_password = sender_password or os.getenv('SENDER_PASSWORD')
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.max_retries = max_retries
+        self.max_attachment_size = max_attachment_size
+        self.max_message_size = max_message_size
+        self.outbox = outbox
 
         # Validate credentials
         if not self.sender_email or not self.sender_password:
@@ -76,8 +99,30 @@ class EmailAutomation:
                 "Set SENDER_EMAIL and SENDER_PASSWORD in .env file or pass as arguments."
             )
 
+        # Authenticated sessions are reused across sends instead of reconnecting per message
+        self.pool = SMTPConnectionPool(
+            self.smtp_server,
+            self.smtp_port,
+            username=self.sender_email,
+            password=self.sender_password,
+            use_starttls=use_starttls,
+            use_ssl=(self.smtp_port == 465),
+            max_size=pool_size,
+            max_messages_per_connection=max_messages_per_connection
+        )
+
         logger.info("EmailAutomation initialized successfully")
 
+    def close(self) -> None:
+        """Close all pooled SMTP connections."""
+        self.pool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def validate_email(self, email: str) -> bool:
         """
         Enhanced email validation with regex pattern.
@@ -91,9 +136,7 @@ class EmailAutomation:
         if not email:
             return False
 
-        # RFC 5322 compliant email regex (simplified)
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return EMAIL_PATTERN.match(email) is not None
 
     def send_email(
         self,
@@ -120,6 +163,38 @@ class EmailAutomation:
         Returns:
             True if email sent successfully, False otherwise
         """
+        if not self.validate_recipients(recipient_email, cc, bcc):
+            return False
+
+        prepared = self.prepare_message(subject, body, html_body, attachments)
+        if prepared is None:
+            logger.error(f"Email to {recipient_email} not sent")
+            return False
+        error = self._send_with_retries(prepared, recipient_email, cc, bcc)
+        if error is None:
+            return True
+
+        # Only a transient failure is worth keeping for a later drain; a rejected address,
+        # an oversized message or bad credentials would fail again the same way
+        if self.outbox is not None and not is_permanent_error(error):
+            # Keep the message instead of dropping it; Outbox.drain retries it later
+            self.outbox.enqueue(f'retry:{uuid.uuid4().hex}', recipient_email, subject, body,
+                                html_body, cc, bcc, attachments)
+            logger.info(f"Email to {recipient_email} queued in the outbox for a later attempt")
+        return False
+
+    def validate_recipients(
+        self,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Validate the To, CC and BCC addresses of one send, logging the first invalid one.
+
+        Returns:
+            True if every address is valid, False otherwise
+        """
         # Validate email addresses
         if not self.validate_email(recipient_email):
             logger.error(f"Invalid recipient email: {recipient_email}")
@@ -139,98 +214,129 @@ class EmailAutomation:
                     logger.error(f"Invalid BCC email: {email}")
                     return False
 
+        return True
+
+    def prepare_message(
+        self,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> Optional[PreparedMessage]:
+        """
+        Encode the shared body and attachments once for a send or batch.
+
+        Retries and additional recipients only resend the prepared parts; large
+        attachments are streamed from disk in fixed-size chunks.
+
+        Returns:
+            The prepared message, or None if it exceeds the configured size limits
+        """
+        try:
+            return PreparedMessage(
+                self.sender_email, subject, body, html_body, attachments,
+                max_attachment_size=self.max_attachment_size,
+                max_message_size=self.max_message_size
+            )
+        except MessageTooLarge as e:
+            logger.error(str(e))
+            return None
+
+    def send_prepared(
+        self,
+        prepared: PreparedMessage,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Send an already-built message to one recipient, retrying with backoff.
+
+        Only the header block is formatted per recipient; the encoded body and
+        attachments are streamed from the shared prepared message. Addresses are
+        expected to be validated by the caller.
+
+        Args:
+            prepared: Message built once for the whole send or batch
+            recipient_email: Recipient's email address
+            cc: Optional list of CC recipients
+            bcc: Optional list of BCC recipients
+
+        Returns:
+            True if email sent successfully, False otherwise
+        """
+        return self._send_with_retries(prepared, recipient_email, cc, bcc) is None
+
+    def _send_with_retries(
+        self,
+        prepared: PreparedMessage,
+        recipient_email: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None
+    ) -> Optional[Exception]:
+        """
+        Send with retries and backoff, as send_prepared.
+
+        Returns:
+            None if the email was sent, otherwise the error from the last attempt
+        """
+        # Prepare recipient list
+        recipients = [recipient_email]
+        if cc:
+            recipients.extend(cc)
+        if bcc:
+            recipients.extend(bcc)
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.info(f"Attempt {attempt} of {self.max_retries} to send email to {recipient_email}")
 
-                # Create message
-                msg = MIMEMultipart('alternative')
-                msg['From'] = self.sender_email
-                msg['To'] = recipient_email
-                msg['Subject'] = subject
-
-                # Add CC recipients
-                if cc:
-                    msg['Cc'] = ', '.join(cc)
-
-                # Attach plain text body
-                msg.attach(MIMEText(body, 'plain'))
-
-                # Attach HTML body if provided
-                if html_body:
-                    msg.attach(MIMEText(html_body, 'html'))
-
-                # Attach files if provided
-                if attachments:
-                    for file_path in attachments:
-                        if os.path.exists(file_path):
-                            self._attach_file(msg, file_path)
-                        else:
-                            logger.warning(f"Attachment not found: {file_path}")
-
-                # Prepare recipient list
-                recipients = [recipient_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-
-                # Connect to server and send email
-                with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30) as server:
-                    server.starttls()
-                    server.login(self.sender_email, self.sender_password)
-                    server.sendmail(self.sender_email, recipients, msg.as_string())
+                # Stream over a pooled, already-authenticated connection
+                self.pool.send_data(
+                    self.sender_email,
+                    recipients,
+                    lambda: prepared.iter_data(recipient_email, cc),
+                    size=prepared.size
+                )
 
                 logger.info(f"Email sent successfully to {recipient_email}")
-                return True
-
-            except smtplib.SMTPAuthenticationError as e:
-                logger.error(f"Authentication failed: {str(e)}")
-                logger.error("Note: Gmail requires App Passwords. See class docstring for setup instructions.")
-                return False  # Don't retry on auth errors
-
-            except smtplib.SMTPException as e:
-                logger.error(f"SMTP error on attempt {attempt}: {str(e)}")
-                if attempt < self.max_retries:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error("Max retries reached. Email not sent.")
-                    return False
+                return None
 
             except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt}: {str(e)}")
-                if attempt < self.max_retries:
-                    time.sleep(2)
-                else:
-                    return False
+                wait_time = self._retry_delay(attempt, e)
+                if wait_time is None:
+                    return e
+                time.sleep(wait_time)
 
-        return False
+        return RuntimeError("Email not sent: max_retries allows no attempts")
 
-    def _attach_file(self, msg: MIMEMultipart, file_path: str) -> None:
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
         """
-        Attach a file to the email message.
+        Log a failed attempt and decide whether to retry.
 
         Args:
-            msg: Email message object
-            file_path: Path to file to attach
-        """
-        try:
-            with open(file_path, 'rb') as attachment:
-                part = MIMEBase('application', 'octet-stream')
-                part.set_payload(attachment.read())
-
-            encoders.encode_base64(part)
-            part.add_header(
-                'Content-Disposition',
-                f'attachment; filename= {os.path.basename(file_path)}'
-            )
-            msg.attach(part)
-            logger.info(f"Attached file: {file_path}")
+            attempt: The attempt that failed (1-based)
+            error: The exception it raised
 
-        except Exception as e:
-            logger.error(f"Failed to attach file {file_path}: {str(e)}")
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            logger.error(f"Authentication failed: {str(error)}")
+            logger.error("Note: Gmail requires App Passwords. See class docstring for setup instructions.")
+            return None  # Don't retry on auth errors
+
+        if isinstance(error, smtplib.SMTPException):
+            logger.error(f"SMTP error on attempt {attempt}: {str(error)}")
+            if attempt < self.max_retries:
+                wait_time = 2 ** attempt  # Exponential backoff
+                logger.info(f"Retrying in {wait_time} seconds...")
+                return wait_time
+            logger.error("Max retries reached. Email not sent.")
+            return None
+
+        logger.error(f"Unexpected error on attempt {attempt}: {str(error)}")
+        return 2 if attempt < self.max_retries else None
 
     def send_batch_emails(
         self,
@@ -238,22 +344,65 @@ class EmailAutomation:
         subject: str,
         body: str,
         html_body: Optional[str] = None,
-        rate_limit_delay: int = 2
+        rate_limit_delay: int = 2,
+        max_workers: int = 1,
+        per_second: Optional[float] = None,
+        per_minute: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]] = None,
+        batch_id: Optional[str] = None
     ) -> dict:
         """
         Send emails to multiple recipients with rate limiting.
 
+        With the defaults this sends one at a time and sleeps rate_limit_delay between
+        sends. Passing max_workers > 1, per_second or per_minute switches to concurrent
+        mode: a worker pool sends in parallel over pooled connections and a token bucket
+        (plus an optional per-minute quota) paces the sends, so wall-clock time is bounded
+        by the quota rather than by network latency plus a fixed sleep.
+
+        With an outbox configured, the batch is recorded before anything is sent and
+        sent through Outbox.drain, so re-running it after a crash (same batch_id)
+        only sends to recipients that have not been sent to yet. Failed sends are
+        rescheduled in the outbox instead of retried in place.
+
         Args:
             recipients: List of recipient email addresses
             subject: Email subject
             body: Plain text email body
             html_body: Optional HTML email body
-            rate_limit_delay: Seconds to wait between emails (default 2)
+            rate_limit_delay: Seconds to wait between emails in sequential mode (default 2)
+            max_workers: Concurrent senders in concurrent mode
+            per_second: Sustained send rate in concurrent mode
+            per_minute: Hard cap on sends in any 60 seconds in concurrent mode
+            progress_callback: Called as (completed, total, result) after each recipient
+            batch_id: Outbox batch key (defaults to a hash of the content)
 
         Returns:
-            Dictionary with success and failure counts
+            Dictionary with success, failure and invalid counts, plus per-recipient
+            'results' ({'recipient', 'status', 'seconds'}) in input order
         """
-        results = {'success': 0, 'failed': 0, 'invalid': 0}
+        if self.outbox is not None:
+            if max_workers > 1 or per_second or per_minute:
+                limiter = RateLimiter(per_second, per_minute)
+            else:
+                limiter = RateLimiter(per_second=1 / rate_limit_delay) if rate_limit_delay else None
+            return self._send_batch_outbox(
+                recipients, subject, body, html_body,
+                batch_id, limiter, max_workers, progress_callback
+            )
+
+        prepared = self.prepare_message(subject, body, html_body)
+        if prepared is None:
+            logger.error("Batch not sent")
+            return self._unsent_batch(recipients)
+
+        if max_workers > 1 or per_second or per_minute:
+            return self._send_batch_concurrent(
+                recipients, prepared, max_workers,
+                RateLimiter(per_second, per_minute), progress_callback
+            )
+
+        results = {'success': 0, 'failed': 0, 'invalid': 0, 'results': []}
 
         for i, recipient in enumerate(recipients, 1):
             logger.info(f"Sending email {i}/{len(recipients)} to {recipient}")
@@ -262,90 +411,389 @@ class EmailAutomation:
             if not self.validate_email(recipient):
                 logger.warning(f"Skipping invalid email: {recipient}")
                 results['invalid'] += 1
+                results['results'].append({'recipient': recipient, 'status': 'invalid', 'seconds': 0.0})
                 continue
 
             # Send email
-            success = self.send_email(
-                recipient_email=recipient,
-                subject=subject,
-                body=body,
-                html_body=html_body
-            )
+            started = time.perf_counter()
+            success = self.send_prepared(prepared, recipient)
+            result = {'recipient': recipient, 'status': 'sent' if success else 'failed',
+                      'seconds': time.perf_counter() - started}
+            results['results'].append(result)
 
             if success:
                 results['success'] += 1
             else:
                 results['failed'] += 1
+            if progress_callback:
+                progress_callback(i, len(recipients), result)
 
             # Rate limiting - wait between sends
             if i < len(recipients):
                 time.sleep(rate_limit_delay)
 
-        logger.info(f"Batch send complete: {results['success']} sent, "
-                   f"{results['failed']} failed, {results['invalid']} invalid")
+        self._log_batch_summary(results)
         return results
 
+    def _send_batch_concurrent(
+        self,
+        recipients: List[str],
+        prepared: PreparedMessage,
+        max_workers: int,
+        limiter: RateLimiter,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]]
+    ) -> dict:
+        """Send a batch from a worker pool paced by a token bucket and per-minute quota."""
+        total = len(recipients)
+        results = {'success': 0, 'failed': 0, 'invalid': 0, 'results': [None] * total}
+        started = time.perf_counter()
+        progress_every = max(1, total // 20)
+
+        def send_one(index: int, recipient: str) -> Dict[str, Any]:
+            limiter.acquire()
+            send_started = time.perf_counter()
+            success = self.send_prepared(prepared, recipient)
+            return {'recipient': recipient, 'status': 'sent' if success else 'failed',
+                    'seconds': time.perf_counter() - send_started}
+
+        completed = 0
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='email-batch') as executor:
+            futures = {}
+            for index, recipient in enumerate(recipients):
+                if not self.validate_email(recipient):
+                    logger.warning(f"Skipping invalid email: {recipient}")
+                    results['invalid'] += 1
+                    results['results'][index] = {'recipient': recipient, 'status': 'invalid', 'seconds': 0.0}
+                    completed += 1
+                    continue
+                futures[executor.submit(send_one, index, recipient)] = (index, recipient)
+
+            for future in as_completed(futures):
+                index, recipient = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Unexpected error sending to {recipient}: {str(e)}")
+                    result = {'recipient': recipient, 'status': 'failed', 'seconds': 0.0}
+                results['results'][index] = result
+                results['success' if result['status'] == 'sent' else 'failed'] += 1
+                completed += 1
+
+                if progress_callback:
+                    progress_callback(completed, total, result)
+                if completed % progress_every == 0 or completed == total:
+                    elapsed = time.perf_counter() - started
+                    logger.info(f"Batch progress: {completed}/{total} "
+                                f"({results['success']} sent, {results['failed']} failed, "
+                                f"{completed / elapsed if elapsed else 0:.1f}/s)")
+
+        results['elapsed_seconds'] = time.perf_counter() - started
+        results['rate_limited_seconds'] = limiter.waited_seconds
+        self._log_batch_summary(results)
+        return results
 
-def generate_report() -> tuple[str, str]:
-    """
-    Generate the content for the email report.
+    def send_batch_from_file(
+        self,
+        path: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        column: str = 'email',
+        chunk_size: int = 1000,
+        checkpoint_path: Optional[str] = None,
+        rate_limit_delay: int = 2,
+        max_workers: int = 1,
+        per_second: Optional[float] = None,
+        per_minute: Optional[int] = None,
+        batch_id: Optional[str] = None
+    ) -> dict:
+        """
+        Send to a recipient list streamed from a CSV, JSONL or text file.
 
-    Returns:
-        Tuple of (plain_text_body, html_body)
-    """
-    today = datetime.date.today().strftime('%Y-%m-%d')
+        Recipients are read lazily, validated, deduplicated and sent chunk by chunk
+        with the same modes as send_batch_emails; one rate limiter spans all chunks.
+        Per-recipient results are not kept, so memory stays flat for any list size.
+        With checkpoint_path set, progress is saved after every chunk and a re-run
+        resumes after the last completed chunk. Without an outbox nothing else records
+        failed sends, so the run stops at the first chunk with failures (an auth error
+        or outage fails every send) without checkpointing it; a re-run retries that
+        whole chunk, including the recipients in it that were already sent to.
 
-    # Plain text version
-    plain_body = f"""Daily Report for {today}
+        Args:
+            path: Recipient file (see RecipientReader for formats)
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
+            column: CSV column or JSONL field holding the address
+            chunk_size: Recipients per chunk
+            checkpoint_path: Progress file for resuming
+            rate_limit_delay: Seconds to wait between emails in sequential mode
+            max_workers: Concurrent senders in concurrent mode
+            per_second: Sustained send rate in concurrent mode
+            per_minute: Hard cap on sends in any 60 seconds in concurrent mode
+            batch_id: Outbox batch key, when an outbox is configured
 
-=================================
+        Returns:
+            Dictionary with success and failure counts plus the reader's row, valid,
+            invalid and duplicate counts (cumulative across resumed runs), and
+            'stopped' when a chunk failed and the file was not finished
+        """
+        reader = RecipientReader(path, column, chunk_size, checkpoint_path)
+        concurrent = max_workers > 1 or per_second or per_minute
+        # One limiter spans all chunks; sequential mode without an outbox paces itself
+        # with rate_limit_delay inside send_batch_emails instead
+        limiter = None
+        if concurrent:
+            limiter = RateLimiter(per_second, per_minute)
+        elif self.outbox is not None and rate_limit_delay:
+            limiter = RateLimiter(per_second=1 / rate_limit_delay)
+        prepared = None
+        if self.outbox is not None:
+            batch_id = batch_id or content_hash(subject, body, html_body)
+        elif concurrent:
+            prepared = self.prepare_message(subject, body, html_body)  # None: too large, every send fails
+
+        totals = {'success': 0, 'failed': 0, 'retrying': 0, 'chunks': 0, 'stopped': False}
+        started = time.perf_counter()
+        for chunk in reader:
+            if self.outbox is not None:
+                results = self._send_batch_outbox(chunk, subject, body, html_body,
+                                                  batch_id, limiter, max_workers, None)
+            elif concurrent:
+                results = (self._send_batch_concurrent(chunk, prepared, max_workers, limiter, None)
+                           if prepared is not None else self._unsent_batch(chunk))
+            else:
+                if totals['chunks']:
+                    time.sleep(rate_limit_delay)
+                results = self.send_batch_emails(chunk, subject, body, html_body, rate_limit_delay)
+            for key in ('success', 'failed', 'retrying'):
+                totals[key] += results.get(key, 0)
+            totals['chunks'] += 1
+            if results.get('failed') and self.outbox is None:
+                totals['stopped'] = True
+                logger.error(f"{path}: {results['failed']} of {len(chunk)} sends in chunk {totals['chunks']} "
+                             f"failed; stopping without checkpointing it so a re-run retries the chunk")
+                break
+            reader.checkpoint()
+            logger.info(f"{path}: {reader.stats['rows']} rows read, {totals['success']} sent, "
+                        f"{totals['failed']} failed")
+        else:
+            reader.checkpoint(complete=True)
 
-System Status: Operational
-Reports Generated: 5
-Errors Encountered: 0
+        totals.update(reader.stats)
+        totals['elapsed_seconds'] = time.perf_counter() - started
+        logger.info(f"File batch {'stopped' if totals['stopped'] else 'complete'}: "
+                    f"{totals['success']} sent, {totals['failed']} failed, "
+                    f"{totals['invalid']} invalid, {totals['duplicates']} duplicates")
+        return totals
 
-Summary:
---------
-Here is the content of your daily report...
+    def _send_batch_outbox(
+        self,
+        recipients: List[str],
+        subject: str,
+        body: str,
+        html_body: Optional[str],
+        batch_id: Optional[str],
+        limiter: Optional[RateLimiter],
+        max_workers: int,
+        progress_callback: Optional[Callable[[int, int, Dict[str, Any]], None]]
+    ) -> dict:
+        """Record the batch in the outbox, then send whatever of it is due."""
+        total = len(recipients)
+        results = {'success': 0, 'failed': 0, 'invalid': 0, 'retrying': 0, 'results': []}
+        started = time.perf_counter()
+
+        valid = []
+        for recipient in recipients:
+            if self.validate_email(recipient):
+                valid.append(recipient)
+            else:
+                logger.warning(f"Skipping invalid email: {recipient}")
+                results['invalid'] += 1
 
-You can customize this section with your actual report data.
+        batch_id = batch_id or content_hash(subject, body, html_body)
+        queued = self.outbox.enqueue_batch(batch_id, valid, subject, body, html_body)
+        logger.info(f"Batch {batch_id}: {queued} queued, {len(valid) - queued} already in the outbox")
+
+        drained = self.outbox.drain(
+            self,
+            batch_id=batch_id,
+            limiter=limiter,
+            max_workers=max_workers,
+            progress_callback=(lambda completed, result: progress_callback(completed, total, result))
+            if progress_callback else None
+        )
+        results['success'] = drained['sent']
+        results['failed'] = drained['failed']
+        results['retrying'] = drained['retrying']
 
+        # Recipients not attempted in this run were sent earlier or are waiting to retry
+        by_recipient = {result['recipient'].lower(): result for result in drained['results']}
+        for recipient in recipients:
+            if not self.validate_email(recipient):
+                results['results'].append({'recipient': recipient, 'status': 'invalid', 'seconds': 0.0})
+                continue
+            result = by_recipient.get(recipient.lower())
+            if result is None:
+                results['results'].append({'recipient': recipient, 'status': 'skipped', 'seconds': 0.0})
+            else:
+                status = {SENT: 'sent', PENDING: 'retrying'}.get(result['status'], 'failed')
+                results['results'].append({'recipient': recipient, 'status': status, 'seconds': result['seconds']})
+
+        results['batch_id'] = batch_id
+        results['outbox'] = self.outbox.summary(batch_id)
+        results['elapsed_seconds'] = time.perf_counter() - started
+        self._log_batch_summary(results)
+        return results
+
+    def _unsent_batch(self, recipients: List[str]) -> dict:
+        """Batch results when the message could not be built: every valid recipient failed."""
+        results = {'success': 0, 'failed': 0, 'invalid': 0, 'results': []}
+        for recipient in recipients:
+            status = 'failed' if self.validate_email(recipient) else 'invalid'
+            results[status] += 1
+            results['results'].append({'recipient': recipient, 'status': status, 'seconds': 0.0})
+        self._log_batch_summary(results)
+        return results
+
+    def _log_batch_summary(self, results: dict) -> None:
+        """Log batch totals together with SMTP connection reuse."""
+        pool = self.pool.summary()
+        logger.info(f"Batch send complete: {results['success']} sent, "
+                   f"{results['failed']} failed, {results['invalid']} invalid "
+                   f"({pool['connections_opened']} SMTP connections opened, "
+                   f"{pool['reuse_rate'] * 100:.0f}% reuse)")
+
+
+# Report templates, parsed once at import
+PLAIN_REPORT = Template("""Daily Report for $date
+
+=================================
+
+Job Applications - last 24 hours (since $since)
+
+Jobs Visited: $visited
+Applications Attempted: $attempted
+  Submitted (confirmed): $submitted
+  Unverified: $unverified
+  Failed: $failed
+Yield: $yield_pct confirmed
+Average Application Time: $avg_duration
+
+By Platform:
+------------
+$platform_rows
 =================================
 Generated automatically by Email Automation System
-"""
+""")
+
+PLAIN_PLATFORM_ROW = Template(
+    "$platform: $visited visited, $submitted submitted, $unverified unverified, "
+    "$failed failed (yield $yield_pct, avg $avg_duration)\n"
+)
 
-    # HTML version
-    html_body = f"""
+HTML_REPORT = Template("""
     <html>
       <head>
         <style>
-          body {{ font-family: Arial, sans-serif; line-height: 1.6; }}
-          .header {{ background-color: #4CAF50; color: white; padding: 10px; text-align: center; }}
-          .content {{ padding: 20px; }}
-          .footer {{ background-color: #f1f1f1; padding: 10px; text-align: center; font-size: 12px; }}
-          .stats {{ background-color: #f9f9f9; padding: 15px; border-left: 4px solid #4CAF50; }}
+          body { font-family: Arial, sans-serif; line-height: 1.6; }
+          .header { background-color: #4CAF50; color: white; padding: 10px; text-align: center; }
+          .content { padding: 20px; }
+          .footer { background-color: #f1f1f1; padding: 10px; text-align: center; font-size: 12px; }
+          .stats { background-color: #f9f9f9; padding: 15px; border-left: 4px solid #4CAF50; }
+          table { border-collapse: collapse; }
+          th, td { padding: 4px 10px; border-bottom: 1px solid #ddd; text-align: right; }
+          th:first-child, td:first-child { text-align: left; }
         </style>
       </head>
       <body>
         <div class="header">
-          <h2>Daily Report for {today}</h2>
+          <h2>Daily Report for $date</h2>
         </div>
         <div class="content">
+          <p>Job applications in the last 24 hours (since $since)</p>
           <div class="stats">
-            <p><strong>System Status:</strong> Operational ✓</p>
-            <p><strong>Reports Generated:</strong> 5</p>
-            <p><strong>Errors Encountered:</strong> 0</p>
+            <p><strong>Jobs Visited:</strong> $visited</p>
+            <p><strong>Applications Attempted:</strong> $attempted</p>
+            <p><strong>Submitted (confirmed):</strong> $submitted</p>
+            <p><strong>Unverified:</strong> $unverified</p>
+            <p><strong>Failed:</strong> $failed</p>
+            <p><strong>Yield:</strong> $yield_pct confirmed</p>
+            <p><strong>Average Application Time:</strong> $avg_duration</p>
           </div>
-          <h3>Summary</h3>
-          <p>Here is the content of your daily report...</p>
-          <p>You can customize this section with your actual report data.</p>
+          <h3>By Platform</h3>
+          <table>
+            <tr><th>Platform</th><th>Visited</th><th>Submitted</th><th>Unverified</th>
+                <th>Failed</th><th>Yield</th><th>Avg Time</th></tr>
+$platform_rows
+          </table>
         </div>
         <div class="footer">
           <p>Generated automatically by Email Automation System</p>
         </div>
       </body>
     </html>
+    """)
+
+HTML_PLATFORM_ROW = Template(
+    "            <tr><td>$platform</td><td>$visited</td><td>$submitted</td><td>$unverified</td>"
+    "<td>$failed</td><td>$yield_pct</td><td>$avg_duration</td></tr>\n"
+)
+
+
+def _report_fields(counts: Dict[str, float]) -> Dict[str, Any]:
+    """Format one row of counts for the report templates."""
+    return {
+        'visited': counts['visited'],
+        'attempted': counts['attempted'],
+        'submitted': counts['submitted'],
+        'unverified': counts['unverified'],
+        'failed': counts['failed'],
+        'yield_pct': f"{counts['yield'] * 100:.1f}%",
+        'avg_duration': f"{counts['avg_duration']:.0f}s" if counts['avg_duration'] else 'n/a',
+    }
+
+
+def generate_report(db_path: Optional[str] = None) -> tuple[str, str]:
+    """
+    Generate the content for the email report from the job applications database.
+
+    Reads the hourly aggregates maintained in the database (see application_stats),
+    so generation cost does not grow with the application history.
+
+    Args:
+        db_path: Job applications database (defaults to APPLICATIONS_DB or
+            jobautomation/logs/job_applications.db)
+
+    Returns:
+        Tuple of (plain_text_body, html_body)
     """
+    today = datetime.date.today().strftime('%Y-%m-%d')
+    db_path = db_path or os.getenv('APPLICATIONS_DB', application_stats.DEFAULT_DB_PATH)
+
+    try:
+        stats = application_stats.last_24h(db_path)
+    except sqlite3.Error as e:
+        logger.error(f"Could not read application stats from {db_path}: {str(e)}")
+        stats = None
+    if stats is None:
+        logger.warning(f"No application data in {db_path}; sending an empty report")
+        empty = {'visited': 0, 'attempted': 0, 'submitted': 0, 'unverified': 0, 'failed': 0,
+                 'yield': 0.0, 'avg_duration': 0.0}
+        stats = {'since': 'n/a', 'platforms': {}, 'totals': empty}
+
+    platforms = sorted(stats['platforms'].items(), key=lambda item: (-item[1]['attempted'], item[0]))
+    plain_rows = ''.join(
+        PLAIN_PLATFORM_ROW.substitute(platform=name, **_report_fields(counts)) for name, counts in platforms
+    ) or "No activity.\n"
+    html_rows = ''.join(
+        HTML_PLATFORM_ROW.substitute(platform=html.escape(name), **_report_fields(counts))
+        for name, counts in platforms
+    ) or '            <tr><td colspan="7">No activity</td></tr>\n'
+
+    fields = {'date': today, 'since': stats['since'], **_report_fields(stats['totals'])}
+    plain_body = PLAIN_REPORT.substitute(platform_rows=plain_rows, **fields)
+    html_body = HTML_REPORT.substitute(platform_rows=html_rows, **fields)
 
     return plain_body, html_body
 
@@ -369,12 +817,13 @@ def main():
         plain_body, html_body = generate_report()
 
         # Send the email
-        success = email_client.send_email(
-            recipient_email=recipient_email,
-            subject=subject,
-            body=plain_body,
-            html_body=html_body
-        )
+        with email_client:
+            success = email_client.send_email(
+                recipient_email=recipient_email,
+                subject=subject,
+                body=plain_body,
+                html_body=html_body
+            )
 
         if success:
             logger.info("Daily report email sent successfully!")
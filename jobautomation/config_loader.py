@@ -3,11 +3,10 @@ Configuration Loader for Job Automation
 Securely loads configuration from environment variables and JSON template
 """
 
-import os
 import json
-import re
 from pathlib import Path
-from dotenv import load_dotenv
+
+from settings import load_settings
 
 
 class ConfigLoader:
@@ -25,75 +24,16 @@ class ConfigLoader:
         self.config_path = self.script_dir / config_path
         self.env_file = self.script_dir / env_file
 
-        # Load environment variables
-        self._load_env()
-
-        # Load and parse configuration
-        self.config = self._load_config()
-
-    def _load_env(self):
-        """Load environment variables from .env file"""
-        if not self.env_file.exists():
-            raise FileNotFoundError(
-                f"Environment file not found: {self.env_file}\n"
-                f"Please copy .env.example to .env and fill in your credentials."
-            )
+        # Compile (or reuse) the validated configuration; also exports .env to os.environ
+        self.settings = self._load_settings()
+        self.config = self.settings.as_dict()
 
-        load_dotenv(self.env_file)
+    def _load_settings(self):
+        """Load the compiled configuration for config_path and env_file"""
+        settings = load_settings(str(self.config_path), str(self.env_file))
         print(f"✓ Loaded environment variables from {self.env_file}")
-
-    def _load_config(self):
-        """Load configuration from JSON file with env var substitution"""
-        if not self.config_path.exists():
-            raise FileNotFoundError(
-                f"Configuration file not found: {self.config_path}"
-            )
-
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config_text = f.read()
-
-        # Substitute environment variables
-        config_text = self._substitute_env_vars(config_text)
-
-        # Parse JSON
-        config = json.loads(config_text)
         print(f"✓ Loaded configuration from {self.config_path}")
-
-        return config
-
-    def _substitute_env_vars(self, text):
-        """
-        Replace ${VAR_NAME} with environment variable values
-
-        Args:
-            text: String containing ${VAR_NAME} placeholders
-
-        Returns:
-            String with substituted values
-        """
-        # Find all ${VAR_NAME} patterns
-        pattern = r'\$\{([^}]+)\}'
-
-        def replace_var(match):
-            var_name = match.group(1)
-            value = os.getenv(var_name)
-
-            if value is None:
-                raise ValueError(
-                    f"Environment variable '{var_name}' not found in .env file.\n"
-                    f"Please add it to {self.env_file}"
-                )
-
-            # Return JSON-safe value (add quotes for strings, not for numbers/booleans)
-            if value.lower() in ('true', 'false'):
-                return value.lower()
-            elif value.isdigit():
-                return value
-            else:
-                # Escape quotes in string values
-                return f'"{value}"'
-
-        return re.sub(pattern, replace_var, text)
+        return settings
 
     def get(self, *keys, default=None):
         """
@@ -0,0 +1,285 @@
+"""
+Cover Letter Generator for Job Automation
+Renders tailored cover letters from a template compiled once, caches them on disk per
+canonical job ID, and generates them in the background while the application opens
+"""
+
+import os
+import re
+import time
+import hashlib
+import logging
+import textwrap
+import threading
+from string import Template
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Pattern
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE = """$greeting,
+
+I am excited to apply for $position. $keyword_sentence
+
+I would welcome the chance to discuss how I can contribute to $employer. Thank you for
+your time and consideration.
+
+Sincerely,
+$name
+$email | $phone
+"""
+
+
+class _KeywordMatcher(NamedTuple):
+    keywords: List[str]
+    canonical: Dict[str, str]        # Lowercased keyword -> configured spelling
+    pattern: Optional[Pattern]
+    cache_tag: str                   # Hash of template, personal fields and keywords
+
+
+# --- Minimal single-font PDF writer (so uploads are accepted where .txt is not) ---
+_PAGE_WIDTH, _PAGE_HEIGHT = 612, 792
+_MARGIN, _FONT_SIZE, _LEADING = 72, 11, 15
+_WRAP_COLUMNS = 90
+_LINES_PER_PAGE = (_PAGE_HEIGHT - 2 * _MARGIN) // _LEADING
+_PDF_ESCAPE = str.maketrans({'\\': '\\\\', '(': '\\(', ')': '\\)'})
+
+
+def text_to_pdf(text: str) -> bytes:
+    """
+    Lay out plain text as a Helvetica PDF
+
+    Args:
+        text: Letter text; paragraphs are wrapped to the page width
+
+    Returns:
+        PDF file contents
+    """
+    lines: List[str] = []
+    for paragraph in text.splitlines():
+        lines.extend(textwrap.wrap(paragraph, _WRAP_COLUMNS) or [''])
+    pages = [lines[i:i + _LINES_PER_PAGE] for i in range(0, len(lines), _LINES_PER_PAGE)] or [[]]
+
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None,
+               '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>']
+    page_refs = []
+    for page in pages:
+        body = ''.join(f'({line.translate(_PDF_ESCAPE)}) Tj T*\n' for line in page)
+        stream = (f'BT /F1 {_FONT_SIZE} Tf {_LEADING} TL {_MARGIN} {_PAGE_HEIGHT - _MARGIN} Td\n'
+                  f'{body}ET').encode('latin-1', 'replace').decode('latin-1')
+        objects.append(f'<< /Length {len(stream.encode("latin-1"))} >>\nstream\n{stream}\nendstream')
+        objects.append(f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_PAGE_WIDTH} {_PAGE_HEIGHT}] '
+                       f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>')
+        page_refs.append(f'{len(objects)} 0 R')
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(page_refs)}] /Count {len(page_refs)} >>'
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f'{number} 0 obj\n{obj}\nendobj\n'.encode('latin-1')
+    xref = len(out)
+    out += f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode('latin-1')
+    out += ''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode('latin-1')
+    out += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode('latin-1')
+    return bytes(out)
+
+
+class CoverLetterGenerator:
+    """
+    Tailored cover letters rendered off the apply path
+
+    The template and the keyword matcher are compiled once. prefetch() renders a letter
+    on a background thread as soon as a job passes the filters; the form engine only asks
+    for the file when a cover-letter upload field actually appears. Rendered letters are
+    cached on disk per canonical job ID and a hash of everything that shapes the text
+    (template, name/email/phone, keywords), so retries and re-runs reuse them.
+    """
+
+    def __init__(self, personal_info: Dict[str, Any], keywords: Iterable[str],
+                 template_path: Optional[str] = None, cache_dir: str = 'logs/cover_letters',
+                 output_format: str = 'pdf'):
+        """
+        Compile the template and keyword matcher
+
+        Args:
+            personal_info: personal_info section of config.json
+            keywords: job_preferences.keywords, matched against job descriptions
+            template_path: Text template using $title, $company, $keywords, $keyword_sentence,
+                $name, $email, $phone and the phrases $greeting, $position and $employer,
+                which read naturally when the company is unknown; defaults to the built-in
+                template
+            cache_dir: Directory for rendered letters
+            output_format: 'pdf' or 'txt'
+        """
+        source = DEFAULT_TEMPLATE
+        if template_path and os.path.exists(template_path):
+            with open(template_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+        elif template_path:
+            logger.warning(f"Cover letter template {template_path} not found; using the built-in template")
+        self.template = Template(source)
+        if not self.template.is_valid():
+            raise ValueError(f"Invalid cover letter template: {template_path}")
+        self._source = source
+
+        self.fields = {
+            'name': personal_info.get('name', ''),
+            'email': personal_info.get('email', ''),
+            'phone': personal_info.get('phone', ''),
+        }
+        self.set_keywords(keywords)
+        self.output_format = output_format
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cover-letter')
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'rendered': 0, 'cache_hits': 0, 'render_seconds': 0.0,
+                      'waits': 0, 'wait_seconds': 0.0}
+
+    def set_keywords(self, keywords: Iterable[str]):
+        """
+        Compile the keyword matcher (again, when job_preferences.keywords is reloaded)
+
+        Letters already rendered or queued keep the keywords they were started with.
+
+        Args:
+            keywords: job_preferences.keywords, matched against job descriptions
+        """
+        keywords = [k for k in keywords or [] if k]
+        pattern = re.compile(
+            r'(?<![\w/])(' + '|'.join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)) + r')(?![\w/])',
+            re.IGNORECASE
+        ) if keywords else None
+        key = '\0'.join([self._source, *self.fields.values(), *keywords])
+        # Swapped as one tuple; prefetch() hands the current one to the background
+        # thread, so a letter's text and cache file always come from the same list
+        self._matcher = _KeywordMatcher(keywords, {k.lower(): k for k in keywords}, pattern,
+                                        hashlib.sha256(key.encode('utf-8')).hexdigest()[:12])
+        self.keywords = keywords
+
+    @staticmethod
+    def _matched(matcher: _KeywordMatcher, description: str) -> List[str]:
+        if not matcher.pattern or not description:
+            return []
+        found = {matcher.canonical[m.lower()] for m in matcher.pattern.findall(description)}
+        return [k for k in matcher.keywords if k in found]
+
+    def matched_keywords(self, description: str) -> List[str]:
+        """Return configured keywords found in a job description, in configured order"""
+        return self._matched(self._matcher, description)
+
+    def render(self, title: str, company: str, description: str = '') -> str:
+        """
+        Render a letter for one job
+
+        Args:
+            title: Job title
+            company: Company name
+            description: Job description text used for keyword matching
+
+        Returns:
+            Letter text
+        """
+        return self._render(self._matcher, title, company, description)
+
+    def _render(self, matcher: _KeywordMatcher, title: str, company: str, description: str) -> str:
+        matched = self._matched(matcher, description)
+        if len(matched) > 1:
+            keyword_text = ', '.join(matched[:-1]) + f' and {matched[-1]}'
+        else:
+            keyword_text = ''.join(matched)
+        sentence = (f"My hands-on experience with {keyword_text} lines up closely with what your team "
+                    f"is looking for." if matched else
+                    "My background lines up closely with what your team is looking for.")
+        # Some listings hide the employer; the phrases fall back to neutral wording
+        # rather than leaving a gap ("Dear  Hiring Team")
+        if company:
+            phrases = {'greeting': f"Dear {company} Hiring Team",
+                       'position': f"the {title} position at {company}", 'employer': company}
+        else:
+            phrases = {'greeting': "Dear Hiring Team", 'position': f"the {title} position",
+                       'employer': "your team"}
+        return self.template.safe_substitute(
+            self.fields, title=title, company=company, keywords=keyword_text,
+            keyword_sentence=sentence, **phrases
+        )
+
+    def _path(self, job_id: str, cache_tag: str) -> str:
+        safe = re.sub(r'[^A-Za-z0-9_.-]+', '_', job_id)
+        return os.path.join(self.cache_dir, f"{safe}_{cache_tag}.{self.output_format}")
+
+    def _count(self, key: str, amount=1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _generate(self, matcher: _KeywordMatcher, job_id: str, title: str, company: str,
+                  description: str) -> str:
+        path = self._path(job_id, matcher.cache_tag)
+        if os.path.exists(path):
+            self._count('cache_hits')
+            return path
+
+        started = time.perf_counter()
+        text = self._render(matcher, title, company, description)
+        data = text_to_pdf(text) if self.output_format == 'pdf' else text.encode('utf-8')
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._count('rendered')
+        self._count('render_seconds', time.perf_counter() - started)
+        return path
+
+    def prefetch(self, job_id: str, title: str, company: str, description: str = '') -> Future:
+        """
+        Start rendering a job's letter in the background and return immediately
+
+        Args:
+            job_id: Canonical job ID (cache key)
+            title: Job title
+            company: Company name
+            description: Job description text
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+            if future is None:
+                future = self._executor.submit(self._generate, self._matcher, job_id, title, company,
+                                               description)
+                self._futures[job_id] = future
+        return future
+
+    def path_for(self, job_id: str, timeout: float = 5.0) -> Optional[str]:
+        """
+        Return the rendered letter for a prefetched job, waiting at most timeout seconds
+
+        Returns:
+            File path, or None if the job was never prefetched or rendering failed
+        """
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is None:
+            return None
+        started = time.perf_counter()
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Cover letter for {job_id} unavailable: {e}")
+            return None
+        finally:
+            self._count('waits')
+            self._count('wait_seconds', time.perf_counter() - started)
+
+    def summary(self) -> Dict[str, float]:
+        """Rendering statistics; wait_ms is the only part that lands on the apply path"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats['avg_render_ms'] = (stats['render_seconds'] / stats['rendered'] * 1000) if stats['rendered'] else 0.0
+        stats['avg_wait_ms'] = (stats['wait_seconds'] / stats['waits'] * 1000) if stats['waits'] else 0.0
+        return stats
+
+    def shutdown(self):
+        """Finish queued letters and stop the background thread"""
+        self._executor.shutdown(wait=True)
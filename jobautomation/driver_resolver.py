@@ -0,0 +1,289 @@
+"""
+ChromeDriver Resolution for Job Automation
+Finds a ChromeDriver matching the installed Chrome without network access on the
+normal startup path: the resolved driver is cached together with the browser version
+it was resolved for, and webdriver-manager only runs when Chrome's major version
+changes, a pinned driver version changes, or no compatible driver is known
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import logging
+import subprocess
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = 'logs/chromedriver_cache.json'
+MAX_STARTUP_RECORDS = 50
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+# --- Driver sources ---
+CONFIGURED = 'configured'          # chromedriver_path setting or CHROMEDRIVER_PATH
+BUNDLED = 'bundled'                # chromedriver-<platform>/ folder in the working directory
+CACHED = 'cache'                   # Resolved on an earlier run for the same browser version
+SYSTEM = 'path'                    # chromedriver on PATH with a matching major version
+DOWNLOADED = 'webdriver-manager'   # Resolved (and downloaded if needed) by webdriver-manager
+SELENIUM_MANAGER = 'selenium-manager'  # Left to Selenium's own driver manager
+
+
+class DriverResolution(NamedTuple):
+    """Where the driver came from and what it was resolved for"""
+    path: Optional[str]          # None: let Selenium Manager find one
+    source: str
+    browser_version: Optional[str]
+    seconds: float               # Time spent resolving
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    return version.split('.', 1)[0] if version else None
+
+
+def _run_version(binary: str) -> Optional[str]:
+    """The four-part version printed by `binary --version`"""
+    try:
+        output = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=15).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def _bundled_driver_paths(base_dir: str) -> List[str]:
+    if sys.platform.startswith('win'):
+        names = [('chromedriver-win64', 'chromedriver.exe'), ('chromedriver-win32', 'chromedriver.exe')]
+    elif sys.platform == 'darwin':
+        names = [('chromedriver-mac-arm64', 'chromedriver'), ('chromedriver-mac-x64', 'chromedriver')]
+    else:
+        names = [('chromedriver-linux64', 'chromedriver')]
+    return [os.path.join(base_dir, folder, name) for folder, name in names]
+
+
+def _browser_candidates() -> List[str]:
+    override = os.getenv('CHROME_BINARY')
+    if override:
+        return [override]
+    if sys.platform.startswith('win'):
+        roots = [os.getenv('PROGRAMFILES'), os.getenv('PROGRAMFILES(X86)'), os.getenv('LOCALAPPDATA')]
+        return [os.path.join(root, 'Google', 'Chrome', 'Application', 'chrome.exe') for root in roots if root]
+    if sys.platform == 'darwin':
+        return ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+                os.path.expanduser('~/Applications/Google Chrome.app/Contents/MacOS/Google Chrome')]
+    found = (shutil.which(name) for name in
+             ('google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'))
+    return [path for path in found if path]
+
+
+class ChromeDriverResolver:
+    """
+    Resolves the ChromeDriver for the installed Chrome, caching the result
+
+    Resolution order: configured path, bundled folder, cached driver (same Chrome
+    major version and pin), chromedriver on PATH, webdriver-manager, and finally
+    Selenium Manager. The browser version is itself cached by the Chrome binary's
+    mtime and size, so an unchanged install costs a stat() instead of a subprocess.
+    """
+
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH, driver_path: Optional[str] = None,
+                 driver_version: Optional[str] = None, base_dir: Optional[str] = None):
+        """
+        Initialize the resolver
+
+        Args:
+            cache_path: JSON file holding the resolved driver and startup timings
+            driver_path: Explicit chromedriver to use (skips resolution)
+            driver_version: Pin the driver version given to webdriver-manager
+            base_dir: Directory searched for bundled chromedriver folders (default: cwd)
+        """
+        self.cache_path = cache_path
+        self.driver_path = driver_path or os.getenv('CHROMEDRIVER_PATH') or None
+        self.driver_version = driver_version or None
+        self.base_dir = base_dir or os.getcwd()
+        self._cache = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable driver cache {self.cache_path}: {e}")
+            return {}
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            temp_path = self.cache_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f, indent=2)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save driver cache {self.cache_path}: {e}")
+
+    def browser_version(self) -> Optional[str]:
+        """Installed Chrome version, re-detected only when the Chrome binary changes"""
+        for binary in _browser_candidates():
+            try:
+                stat = os.stat(binary)
+            except OSError:
+                continue
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            cached = self._cache.get('browser', {})
+            if cached.get('path') == binary and cached.get('stamp') == stamp and cached.get('version'):
+                return cached['version']
+
+            version = self._detect_version(binary)
+            if version:
+                self._cache['browser'] = {'path': binary, 'stamp': stamp, 'version': version}
+                self._save_cache()
+                return version
+        return None
+
+    @staticmethod
+    def _detect_version(binary: str) -> Optional[str]:
+        if sys.platform.startswith('win'):
+            # chrome.exe prints nothing for --version; the install keeps a folder per version
+            folder = os.path.dirname(binary)
+            versions = [name for name in os.listdir(folder) if VERSION_PATTERN.fullmatch(name)]
+            if versions:
+                return max(versions, key=lambda v: tuple(int(part) for part in v.split('.')))
+            return None
+        return _run_version(binary)
+
+    def _cached_driver(self, browser_version: Optional[str]) -> Tuple[Optional[str], bool]:
+        """The cached driver path, and whether it still matches the browser and pin"""
+        driver = self._cache.get('driver', {})
+        path = driver.get('path')
+        if not path or not os.path.exists(path):
+            return None, False
+        matches = (
+            (browser_version is None or _major(driver.get('browser_version')) == _major(browser_version))
+            and (self.driver_version is None or driver.get('pinned') == self.driver_version)
+        )
+        return path, matches
+
+    def _remember(self, path: str, source: str, browser_version: Optional[str]):
+        self._cache['driver'] = {
+            'path': path,
+            'source': source,
+            'browser_version': browser_version,
+            'driver_version': _run_version(path),
+            'pinned': self.driver_version,
+            'resolved_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self._save_cache()
+
+    def invalidate(self):
+        """Forget the cached driver (e.g. after it failed to start Chrome)"""
+        if self._cache.pop('driver', None) is not None:
+            self._save_cache()
+
+    def resolve(self) -> DriverResolution:
+        """
+        Find the driver to start Chrome with
+
+        Returns:
+            DriverResolution; path is None when only Selenium Manager is left
+        """
+        started = time.perf_counter()
+
+        def result(path: Optional[str], source: str, version: Optional[str]) -> DriverResolution:
+            return DriverResolution(path, source, version, time.perf_counter() - started)
+
+        if self.driver_path:
+            return result(self.driver_path, CONFIGURED, None)
+        for path in _bundled_driver_paths(self.base_dir):
+            if os.path.exists(path):
+                return result(path, BUNDLED, None)
+
+        browser_version = self.browser_version()
+        cached_path, matches = self._cached_driver(browser_version)
+        if cached_path and matches:
+            return result(cached_path, CACHED, browser_version)
+
+        system_driver = shutil.which('chromedriver')
+        if system_driver and self.driver_version is None and browser_version \
+                and _major(_run_version(system_driver)) == _major(browser_version):
+            self._remember(system_driver, SYSTEM, browser_version)
+            return result(system_driver, SYSTEM, browser_version)
+
+        try:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager(driver_version=self.driver_version).install()
+            self._remember(path, DOWNLOADED, browser_version)
+            logger.info(f"Resolved chromedriver for Chrome {browser_version or '(version unknown)'}: {path}")
+            return result(path, DOWNLOADED, browser_version)
+        except Exception as e:
+            logger.warning(f"webdriver-manager could not resolve a driver: {e}")
+
+        if cached_path:
+            logger.warning(f"Using the cached driver resolved for Chrome "
+                           f"{self._cache['driver'].get('browser_version')}; it may not match Chrome {browser_version}")
+            return result(cached_path, CACHED, browser_version)
+        return result(None, SELENIUM_MANAGER, browser_version)
+
+    def record_startup(self, resolution: DriverResolution, startup_seconds: float) -> Dict[str, Any]:
+        """
+        Append this run's driver startup time to the cache file
+
+        Returns:
+            The recorded entry
+        """
+        entry = {
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'source': resolution.source,
+            'browser_version': resolution.browser_version,
+            'resolve_ms': round(resolution.seconds * 1000, 1),
+            'startup_seconds': round(startup_seconds, 3),
+        }
+        self._cache['startups'] = (self._cache.get('startups', []) + [entry])[-MAX_STARTUP_RECORDS:]
+        self._save_cache()
+        return entry
+
+
+def start_chrome(options, resolver: Optional[ChromeDriverResolver] = None):
+    """
+    Start Chrome with a resolved driver and time the startup
+
+    A cached driver that fails to start Chrome is dropped from the cache and
+    resolution runs once more.
+
+    Args:
+        options: selenium ChromeOptions
+        resolver: Resolver to use (defaults to one with the default cache path)
+
+    Returns:
+        (driver, startup record from ChromeDriverResolver.record_startup)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    resolver = resolver or ChromeDriverResolver()
+    resolution = resolver.resolve()
+    started = time.perf_counter()
+    try:
+        driver = webdriver.Chrome(service=Service(resolution.path) if resolution.path else Service(),
+                                  options=options)
+    except Exception as e:
+        if resolution.source != CACHED:
+            raise
+        logger.warning(f"Cached chromedriver {resolution.path} failed to start Chrome ({e}); resolving again")
+        resolver.invalidate()
+        resolution = resolver.resolve()
+        started = time.perf_counter()
+        driver = webdriver.Chrome(service=Service(resolution.path) if resolution.path else Service(),
+                                  options=options)
+
+    record = resolver.record_startup(resolution, time.perf_counter() - started)
+    logger.info(f"Chrome started in {record['startup_seconds']:.2f}s "
+                f"(driver: {resolution.source}{' ' + resolution.path if resolution.path else ''}, "
+                f"resolved in {record['resolve_ms']:.0f}ms)")
+    return driver, record
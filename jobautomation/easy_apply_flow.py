@@ -0,0 +1,289 @@
+"""
+Easy Apply State Machine for Job Automation
+Drives multi-step application modals through explicit states detected from DOM signals
+and verifies each submission before it is counted
+"""
+
+import re
+import time
+import logging
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from form_engine import FormEngine
+
+logger = logging.getLogger(__name__)
+
+# --- States ---
+STEP = 'step'
+REVIEW = 'review'
+SUBMIT = 'submit'
+CONFIRMATION = 'confirmation'
+BLOCKED = 'blocked'
+
+# --- Recorded outcomes ---
+SUBMITTED = 'submitted'      # Submit clicked and confirmation observed
+UNVERIFIED = 'unverified'    # Submit clicked but no confirmation within the bounded wait
+FAILED = 'failed'            # Never got as far as a successful Submit click
+
+
+class FlowSpec(NamedTuple):
+    """DOM signals that identify each state of a platform's application flow"""
+    root: Optional[str]
+    next_buttons: Tuple[str, ...]
+    review_buttons: Tuple[str, ...]
+    submit_buttons: Tuple[str, ...]
+    confirmation: str
+    confirmation_url: str
+    errors: str
+
+
+LINKEDIN_FLOW = FlowSpec(
+    root='div.jobs-easy-apply-modal',
+    next_buttons=('Continue to next step',),
+    review_buttons=('Review your application',),
+    submit_buttons=('Submit application',),
+    confirmation=r'application was sent|your application was submitted|you applied',
+    confirmation_url=r'/post-apply|/jobs/applied|[?&]applied=true',
+    errors='.artdeco-inline-feedback--error, [data-test-form-element-error-messages]',
+)
+
+INDEED_FLOW = FlowSpec(
+    root=None,
+    next_buttons=('Continue',),
+    review_buttons=('Review your application',),
+    submit_buttons=('Submit your application', 'Submit application'),
+    confirmation=r'application has been submitted|your application was sent|application submitted',
+    confirmation_url=r'/post-apply|/applied|/confirmation',
+    errors='[role="alert"], .ia-FieldError, [data-testid*="error"]',
+)
+
+# Reads every state signal in one round trip. Buttons match on aria-label or visible text.
+SIGNALS_SCRIPT = r"""
+const spec = arguments[0];
+const root = spec.root ? document.querySelector(spec.root) : document.body;
+// Confirmation text only counts inside the flow's own root or a dialog, never the page
+// around it (job descriptions and feeds mention 'you applied' too)
+const scopes = Array.from(document.querySelectorAll('[role="dialog"], [role="alertdialog"], [aria-modal="true"]'));
+if (root) scopes.push(spec.root ? root : (document.querySelector('main') || root));
+const flowText = scopes.map((el) => el.innerText || '').join('\n').toLowerCase();
+let href = location.href;
+try { href = window.top.location.href; } catch (e) { /* cross-origin frame: use our own URL */ }
+const result = {present: !!root, next: false, review: false, submit: false, errors: [],
+                confirmed: new RegExp(spec.confirmation, 'i').test(flowText)
+                    || new RegExp(spec.confirmation_url, 'i').test(href),
+                signature: ''};
+if (!root) return result;
+const buttons = Array.from(root.querySelectorAll('button')).filter((b) => !b.disabled && b.offsetParent !== null);
+const has = (phrases) => buttons.some((b) => {
+    const label = (b.getAttribute('aria-label') || '') + ' ' + (b.innerText || '');
+    return phrases.some((p) => label.includes(p));
+});
+result.submit = has(spec.submit_buttons);
+result.review = !result.submit && has(spec.review_buttons);
+result.next = !result.submit && !result.review && has(spec.next_buttons);
+result.errors = Array.from(root.querySelectorAll(spec.errors))
+    .map((e) => (e.innerText || '').trim()).filter((t) => t).slice(0, 5);
+const progress = root.querySelector('[role="progressbar"], progress');
+const heading = root.querySelector('h3, h2, h1');
+result.signature = [
+    progress ? (progress.getAttribute('aria-valuenow') || progress.value || '') : '',
+    heading ? heading.innerText : '',
+    root.querySelectorAll('input, select, textarea').length,
+].join('|');
+return result;
+"""
+
+# Clicks the first enabled, visible button matching any phrase; returns whether one was clicked.
+CLICK_SCRIPT = r"""
+const root = arguments[0] ? document.querySelector(arguments[0]) : document.body;
+if (!root) return false;
+for (const b of root.querySelectorAll('button')) {
+    if (b.disabled || b.offsetParent === null) continue;
+    const label = (b.getAttribute('aria-label') || '') + ' ' + (b.innerText || '');
+    if (arguments[1].some((p) => label.includes(p))) { b.click(); return true; }
+}
+return false;
+"""
+
+
+class FlowResult(NamedTuple):
+    """Outcome of one application flow"""
+    state: str
+    status: str
+    reason: str
+    steps: int
+    state_seconds: Dict[str, float]
+    unanswered: List[str]
+    elapsed: float
+
+
+class EasyApplyFlow:
+    """
+    State machine for multi-step application modals
+
+    States are STEP (questions, then Next), REVIEW, SUBMIT, CONFIRMATION and BLOCKED.
+    Each transition is detected from DOM signals (buttons present, errors shown,
+    confirmation text, progress/heading change) instead of fixed sleeps, and the flow
+    aborts as soon as a required question cannot be answered. After Submit, success is
+    only reported once a confirmation message or URL is seen within confirm_timeout.
+    """
+
+    def __init__(self, spec: FlowSpec, form_engine: FormEngine, max_steps: int = 10,
+                 transition_timeout: float = 8.0, confirm_timeout: float = 10.0,
+                 poll_interval: float = 0.25):
+        """
+        Initialize the flow
+
+        Args:
+            spec: Platform DOM signals (LINKEDIN_FLOW, INDEED_FLOW)
+            form_engine: Engine used to fill each step
+            max_steps: Maximum transitions before giving up
+            transition_timeout: Seconds to wait for the DOM to change after a click
+            confirm_timeout: Seconds to wait for confirmation after clicking Submit
+            poll_interval: Seconds between signal polls while waiting
+        """
+        self.spec = spec
+        self.form_engine = form_engine
+        self.max_steps = max_steps
+        self.transition_timeout = transition_timeout
+        self.confirm_timeout = confirm_timeout
+        self._confirmation_url = re.compile(spec.confirmation_url, re.IGNORECASE)
+        self.poll_interval = poll_interval
+        self._spec_arg = spec._asdict()
+
+    def signals(self, driver) -> Dict:
+        """Read all DOM state signals in one script call"""
+        return driver.execute_script(SIGNALS_SCRIPT, self._spec_arg)
+
+    @staticmethod
+    def classify(signals: Dict) -> str:
+        """Map DOM signals to a state"""
+        if signals.get('confirmed'):
+            return CONFIRMATION
+        if not signals.get('present'):
+            return BLOCKED
+        if signals.get('submit'):
+            return SUBMIT
+        if signals.get('review'):
+            return REVIEW
+        if signals.get('next'):
+            return STEP
+        return BLOCKED
+
+    def _wait_for_transition(self, driver, before: Dict) -> Dict:
+        """Poll until the flow leaves the current page, shows errors, or times out"""
+        deadline = time.perf_counter() + self.transition_timeout
+        signals = before
+        while time.perf_counter() < deadline:
+            time.sleep(self.poll_interval)
+            signals = self.signals(driver)
+            if (signals.get('confirmed') or not signals.get('present')
+                    or signals.get('signature') != before.get('signature')
+                    or len(signals.get('errors', [])) > len(before.get('errors', []))):
+                return signals
+        return signals
+
+    def verify_submission(self, driver, timeout: Optional[float] = None) -> Tuple[bool, Dict]:
+        """
+        Wait a bounded time for confirmation of a submitted application
+
+        Args:
+            driver: Selenium WebDriver
+            timeout: Seconds to wait (defaults to confirm_timeout)
+
+        Returns:
+            Tuple of (confirmed, last signals read)
+        """
+        deadline = time.perf_counter() + (self.confirm_timeout if timeout is None else timeout)
+        while True:
+            signals = self.signals(driver)
+            if signals.get('confirmed'):
+                return True, signals
+            if signals.get('errors') or time.perf_counter() >= deadline:
+                break
+            time.sleep(self.poll_interval)
+        # The script only sees its own frame's URL when the top window is cross-origin
+        return bool(self._confirmation_url.search(driver.current_url or '')), signals
+
+    def run(self, driver) -> FlowResult:
+        """
+        Drive the application flow to CONFIRMATION or BLOCKED
+
+        Args:
+            driver: Selenium WebDriver positioned on the open application modal/frame
+
+        Returns:
+            FlowResult with final state, outcome status, reason and time spent in each state
+        """
+        started = time.perf_counter()
+        state_seconds: Dict[str, float] = {}
+        signals = self.signals(driver)
+        state = self.classify(signals)
+        reason = {BLOCKED: 'no recognizable controls',
+                  CONFIRMATION: 'confirmation shown before anything was submitted'}.get(state, '')
+        unanswered: List[str] = []
+        steps = 0
+        submitted = False
+
+        while state not in (CONFIRMATION, BLOCKED) and steps < self.max_steps:
+            entered = time.perf_counter()
+            steps += 1
+
+            if state in (STEP, SUBMIT):
+                result = self.form_engine.fill_step(driver, self.spec.root)
+                if result.unanswered:
+                    unanswered = result.unanswered
+                    state_seconds[state] = state_seconds.get(state, 0.0) + time.perf_counter() - entered
+                    state, reason = BLOCKED, 'unanswerable required question'
+                    break
+
+            buttons = {STEP: self.spec.next_buttons, REVIEW: self.spec.review_buttons,
+                       SUBMIT: self.spec.submit_buttons}[state]
+            if not driver.execute_script(CLICK_SCRIPT, self.spec.root, list(buttons)):
+                state_seconds[state] = state_seconds.get(state, 0.0) + time.perf_counter() - entered
+                state, reason = BLOCKED, f'{state} button not clickable'
+                break
+
+            if state == SUBMIT:
+                submitted = True
+                confirmed, new_signals = self.verify_submission(driver)
+                state_seconds[SUBMIT] = state_seconds.get(SUBMIT, 0.0) + time.perf_counter() - entered
+                if confirmed:
+                    state = CONFIRMATION
+                elif new_signals.get('errors'):
+                    submitted = False
+                    state, reason = BLOCKED, 'validation error: ' + '; '.join(new_signals['errors'])
+                else:
+                    state, reason = BLOCKED, f'no confirmation within {self.confirm_timeout:.0f}s of submit'
+                break
+
+            new_signals = self._wait_for_transition(driver, signals)
+            state_seconds[state] = state_seconds.get(state, 0.0) + time.perf_counter() - entered
+
+            if (new_signals.get('signature') == signals.get('signature') and new_signals.get('present')
+                    and not new_signals.get('confirmed')):
+                # Still on the same page: the platform rejected what we entered
+                state = BLOCKED
+                reason = 'validation error: ' + '; '.join(new_signals.get('errors') or ['page did not advance'])
+                break
+
+            signals = new_signals
+            state = self.classify(signals)
+            if state == BLOCKED:
+                reason = 'flow closed without confirmation'
+        else:
+            if state not in (CONFIRMATION, BLOCKED):
+                state, reason = BLOCKED, f'exceeded {self.max_steps} steps'
+
+        # Only a Submit click followed by confirmation counts; confirmation signals seen
+        # without one (e.g. a posting already applied to) are not this run's submission
+        if not submitted:
+            status = FAILED
+            if state == CONFIRMATION and not reason:
+                reason = 'flow confirmed without a Submit click'
+        else:
+            status = SUBMITTED if state == CONFIRMATION else UNVERIFIED
+        if state == BLOCKED or status == FAILED:
+            logger.info(f"Application flow blocked ({status}): {reason}")
+        return FlowResult(state, status, reason, steps, state_seconds, unanswered,
+                          time.perf_counter() - started)
@@ -0,0 +1,411 @@
+"""
+Form Engine for Job Automation
+Reads every field of an application step in one script call, answers it from a
+question/answer knowledge base, and fills the whole step in one batched script
+"""
+
+import os
+import re
+import difflib
+import logging
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+
+# Collects every visible field under a root element in a single round trip.
+# Each field (or radio group) is tagged with data-fe-id so the fill script can find it again.
+COLLECT_FIELDS_SCRIPT = r"""
+const root = (arguments[0] && document.querySelector(arguments[0])) || document;
+const clean = (t) => (t || '').replace(/\s+/g, ' ').trim();
+const labelOf = (el) => {
+    if (el.getAttribute('aria-label')) return el.getAttribute('aria-label');
+    if (el.id) {
+        const l = root.querySelector('label[for="' + CSS.escape(el.id) + '"]');
+        if (l) return l.innerText;
+    }
+    const wrap = el.closest('label');
+    if (wrap) return wrap.innerText;
+    const by = el.getAttribute('aria-labelledby');
+    if (by) {
+        const l = document.getElementById(by.split(' ')[0]);
+        if (l) return l.innerText;
+    }
+    return el.getAttribute('placeholder') || el.name || '';
+};
+const legendOf = (el) => {
+    const fs = el.closest('fieldset');
+    const lg = fs && fs.querySelector('legend');
+    return lg ? lg.innerText : '';
+};
+const fields = [];
+const groups = {};
+let n = 0;
+root.querySelectorAll('input, select, textarea').forEach((el) => {
+    const type = el.tagName === 'INPUT' ? (el.type || 'text').toLowerCase() : el.tagName.toLowerCase();
+    if (['hidden', 'submit', 'button', 'image', 'reset'].includes(type) || el.disabled) return;
+    if (type !== 'file' && el.offsetParent === null) return;
+    const required = el.required || el.getAttribute('aria-required') === 'true';
+    if (type === 'radio') {
+        const key = el.name || legendOf(el);
+        let group = groups[key];
+        if (!group) {
+            group = {id: 'fe' + (n++), label: clean(legendOf(el) || el.name), type: 'radio',
+                     options: [], required: false, value: ''};
+            groups[key] = group;
+            fields.push(group);
+        }
+        const option = clean(labelOf(el));
+        el.setAttribute('data-fe-id', group.id);
+        el.setAttribute('data-fe-option', option);
+        group.options.push(option);
+        group.required = group.required || required;
+        if (el.checked) group.value = option;
+        return;
+    }
+    const id = 'fe' + (n++);
+    el.setAttribute('data-fe-id', id);
+    let label = clean(labelOf(el));
+    if (type === 'checkbox' && legendOf(el)) label = clean(legendOf(el)) + ' ' + label;
+    const field = {id: id, label: label, type: type, options: [], required: required, value: ''};
+    if (type === 'select') {
+        field.options = Array.from(el.options).map((o) => clean(o.text));
+        field.value = el.selectedIndex > 0 ? clean(el.options[el.selectedIndex].text) : '';
+    } else if (type === 'checkbox') {
+        field.value = el.checked ? 'true' : '';
+    } else if (type !== 'file') {
+        field.value = el.value || '';
+    }
+    field.required = field.required || /\*\s*$/.test(label);
+    fields.push(field);
+});
+return fields;
+"""
+
+# Fills all planned fields in a single round trip using native setters so
+# React/Ember-controlled inputs register the change.
+FILL_FIELDS_SCRIPT = r"""
+const setNative = (el, value) => {
+    const proto = el.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype
+        : el.tagName === 'SELECT' ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.dispatchEvent(new Event('blur', {bubbles: true}));
+};
+let filled = 0;
+for (const f of arguments[0]) {
+    const els = document.querySelectorAll('[data-fe-id="' + f.id + '"]');
+    if (!els.length) continue;
+    if (f.type === 'radio') {
+        for (const r of els) {
+            if (r.getAttribute('data-fe-option') === f.value) { r.click(); filled++; break; }
+        }
+    } else if (f.type === 'checkbox') {
+        if (els[0].checked !== (f.value === 'true')) els[0].click();
+        filled++;
+    } else if (f.type === 'select') {
+        const opt = Array.from(els[0].options).find((o) => o.text.replace(/\s+/g, ' ').trim() === f.value);
+        if (opt) { setNative(els[0], opt.value); filled++; }
+    } else {
+        setNative(els[0], f.value);
+        filled++;
+    }
+}
+return filled;
+"""
+
+_NON_WORD = re.compile(r'[^a-z0-9+ ]+')
+_PLACEHOLDER_OPTION = re.compile(r'^(?:select|choose|please select|--)', re.IGNORECASE)
+_NUMBER = re.compile(r'^\d+(?:\.\d+)?$')
+_NUMBER_RANGE_OPTION = re.compile(r'^(\d+(?:\.\d+)?)\s*(?:\+|(?:-|–|to)\s*(\d+(?:\.\d+)?))', re.IGNORECASE)
+_RESUME_LABEL = re.compile(r'\b(?:resume|résumé|cv|curriculum vitae)\b', re.IGNORECASE)
+_COVER_LETTER_LABEL = re.compile(r'\bcover\b', re.IGNORECASE)
+_YES = {'yes', 'y', 'true', '1'}
+
+# Yes/no and eligibility questions carry legal weight; they are only answered on an exact match
+_YES_NO_QUESTION = re.compile(
+    r'^(?:are|is|am|was|were|do|does|did|have|has|had|will|would|can|could|should|may|shall)\b'
+    r'|\b(?:authori[sz]|sponsor|visa|citizen|clearance|legally|eligib|relocat|convict|criminal|felony'
+    r'|background check|drug|veteran|disabilit|gender|race|ethnic|hispanic|agree|consent|certify|acknowledge)'
+)
+# Words a label may add to or drop from a known question without changing what it asks
+_FILLER_WORDS = frozenset({
+    'a', 'an', 'the', 'your', 'my', 'what', 'is', 'please', 'enter', 'provide', 'current',
+    'url', 'link', 'address', 'optional', 'required', 'here',
+})
+
+
+class FormField(NamedTuple):
+    """A field read from an application step"""
+    id: str
+    label: str
+    type: str
+    options: Tuple[str, ...]
+    required: bool
+    value: str
+
+
+class StepResult(NamedTuple):
+    """Outcome of filling one application step"""
+    fields: List[FormField]
+    filled: int
+    unanswered: List[str]
+
+
+def normalize_question(label: str) -> str:
+    """Normalize a field label for lookup: lowercase, no punctuation or required markers"""
+    return ' '.join(_NON_WORD.sub(' ', (label or '').lower()).split())
+
+
+class AnswerBase:
+    """
+    Question/answer knowledge base built from personal_info plus user-supplied answers
+
+    Lookups try an exact normalized match first. Otherwise the longest known question
+    of two or more words is used when the label differs from it only by filler words
+    ('your', 'url', ...) or close spellings. Yes/no and eligibility questions and
+    one-word keys ('email', 'linkedin') only match exactly, so a label that merely
+    mentions them stays unanswered. Results are memoized per label.
+    """
+
+    def __init__(self, personal_info: Dict[str, Any], answers: Optional[Dict[str, Any]] = None,
+                 spelling_cutoff: float = 0.85):
+        """
+        Build the answer base
+
+        Args:
+            personal_info: personal_info section of config.json
+            answers: application_answers section of config.json (question -> answer)
+            spelling_cutoff: Minimum similarity (0-1) for a label word to stand in for a
+                differently spelled question word ('authorised' for 'authorized')
+        """
+        self.spelling_cutoff = spelling_cutoff
+        self.answers: Dict[str, str] = {}
+
+        name = (personal_info.get('name') or '').strip()
+        parts = name.split()
+        first = parts[0] if parts else ''
+        last = parts[-1] if len(parts) > 1 else ''
+        derived = {
+            'full name': name,
+            'your name': name,
+            'legal name': name,
+            'full legal name': name,
+            'first name': first,
+            'given name': first,
+            'last name': last,
+            'family name': last,
+            'surname': last,
+            'email': personal_info.get('email'),
+            'email address': personal_info.get('email'),
+            'phone': personal_info.get('phone'),
+            'phone number': personal_info.get('phone'),
+            'mobile phone number': personal_info.get('phone'),
+            'city': personal_info.get('city'),
+            'location city': personal_info.get('city'),
+            'linkedin': personal_info.get('linkedin_url'),
+            'linkedin profile': personal_info.get('linkedin_url'),
+            'linkedin url': personal_info.get('linkedin_url'),
+            'website': personal_info.get('website'),
+            'personal website': personal_info.get('website'),
+            'website url': personal_info.get('website'),
+            'portfolio': personal_info.get('website'),
+            'portfolio url': personal_info.get('website'),
+            'github': personal_info.get('github_url'),
+            'github profile': personal_info.get('github_url'),
+            'github url': personal_info.get('github_url'),
+        }
+        for question, answer in list(derived.items()) + list((answers or {}).items()):
+            if answer not in (None, ''):
+                self.answers[normalize_question(question)] = str(answer)
+
+        # Longest questions first so 'mobile phone number' wins over 'phone number';
+        # one-word keys are left out, they only ever match exactly
+        self._by_length = sorted((q for q in self.answers if ' ' in q), key=len, reverse=True)
+        self._tokens = {question: frozenset(question.split()) for question in self._by_length}
+        self.answer = lru_cache(maxsize=2048)(self._answer)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'AnswerBase':
+        """Build the answer base from a loaded config dictionary"""
+        return cls(config.get('personal_info', {}), config.get('application_answers', {}))
+
+    def _answer(self, label: str) -> Optional[str]:
+        key = normalize_question(label)
+        if not key:
+            return None
+        if key in self.answers:
+            return self.answers[key]
+        if _YES_NO_QUESTION.search(key):
+            return None
+
+        words = frozenset(key.split())
+        for question in self._by_length:
+            if self._same_question(words, self._tokens[question]):
+                return self.answers[question]
+        return None
+
+    def _same_question(self, label_words: frozenset, question_words: frozenset) -> bool:
+        """Whether every word in which label and question differ is filler or a respelling"""
+        only_label = set(label_words - question_words - _FILLER_WORDS)
+        only_question = set(question_words - label_words - _FILLER_WORDS)
+        if len(only_label) > 1 or len(only_question) > 1:
+            return False
+        for word in only_label:
+            partner = difflib.get_close_matches(word, only_question, n=1, cutoff=self.spelling_cutoff)
+            if not partner:
+                return False
+            only_question.discard(partner[0])
+        return not only_question
+
+
+@lru_cache(maxsize=4096)
+def choose_option(answer: str, options: Tuple[str, ...]) -> Optional[str]:
+    """
+    Pick the option that best matches an answer
+
+    Args:
+        answer: Answer text (e.g. 'Yes', '5')
+        options: Option texts of a select or radio group
+
+    An exact match wins, then the shortest option that starts with the answer as a
+    whole word ('Yes' picks 'Yes' over 'Yes, sponsorship'; '1' never picks '10+').
+    Numbers are matched against ranges like '3-5' or '10+' rather than spelled
+    fuzzily; other answers fall back to a close spelling.
+
+    Returns:
+        The matching option text, or None
+    """
+    choices = [o for o in options if o and not _PLACEHOLDER_OPTION.match(o)]
+    wanted = answer.strip().lower()
+    for option in choices:
+        if option.lower() == wanted:
+            return option
+    prefixed = [o for o in choices if o.lower().startswith(wanted)
+                and not o[len(wanted):len(wanted) + 1].isalnum()]
+    if prefixed:
+        return min(prefixed, key=len)
+    if _NUMBER.match(wanted):
+        value = float(wanted)
+        for option in choices:
+            bounds = _NUMBER_RANGE_OPTION.match(option.strip())
+            if bounds and float(bounds.group(1)) <= value <= float(bounds.group(2) or 'inf'):
+                return option
+        return None
+    close = difflib.get_close_matches(wanted, [o.lower() for o in choices], n=1, cutoff=0.6)
+    if close:
+        return next(o for o in choices if o.lower() == close[0])
+    return None
+
+
+class FormEngine:
+    """Single-pass filler for multi-step application forms"""
+
+    def __init__(self, answer_base: AnswerBase, resume_path: Optional[str] = None,
+                 cover_letter_path: Optional[str] = None):
+        """
+        Initialize the form engine
+
+        Args:
+            answer_base: Knowledge base used to answer fields
+            resume_path: Resume file uploaded to resume/CV file inputs
+            cover_letter_path: Cover letter file uploaded to cover-letter file inputs
+        """
+        self.answer_base = answer_base
+        self.resume_path = os.path.abspath(resume_path) if resume_path else None
+        self.cover_letter_path = os.path.abspath(cover_letter_path) if cover_letter_path else None
+        self._cover_letter_provider: Optional[Callable[[], Optional[str]]] = None
+
+    def use_cover_letter(self, provider: Optional[Callable[[], Optional[str]]]):
+        """
+        Set a per-application cover letter source
+
+        Args:
+            provider: Called only when a cover-letter upload field appears; returns a file
+                path, or None to fall back to personal_info.cover_letter_path
+        """
+        self._cover_letter_provider = provider
+
+    def read_step(self, driver, root_selector: Optional[str] = None) -> List[FormField]:
+        """Read all fields of the current step in one script call"""
+        raw = driver.execute_script(COLLECT_FIELDS_SCRIPT, root_selector) or []
+        return [
+            FormField(f['id'], f['label'], f['type'], tuple(f.get('options') or ()),
+                      bool(f.get('required')), f.get('value') or '')
+            for f in raw
+        ]
+
+    def _file_for(self, field: FormField) -> Optional[str]:
+        """The file for an upload field; only resume/CV and cover-letter fields get one"""
+        if _COVER_LETTER_LABEL.search(field.label):
+            tailored = self._cover_letter_provider() if self._cover_letter_provider else None
+            path = os.path.abspath(tailored) if tailored else self.cover_letter_path
+        elif _RESUME_LABEL.search(field.label):
+            path = self.resume_path
+        else:
+            return None  # Transcripts, portfolios, ID documents: left for the user
+        return path if path and os.path.exists(path) else None
+
+    def plan(self, fields: List[FormField]) -> Tuple[List[Dict[str, str]], List[Tuple[str, str]], List[str]]:
+        """
+        Decide what to put in each field
+
+        Returns:
+            Tuple of (script fills, (field id, path) file uploads, unanswered required labels)
+        """
+        fills, uploads, unanswered = [], [], []
+        for field in fields:
+            if field.type == 'file':
+                path = self._file_for(field)
+                if path:
+                    uploads.append((field.id, path))
+                elif field.required:
+                    unanswered.append(field.label)
+                continue
+
+            if field.value and not _PLACEHOLDER_OPTION.match(field.value):
+                continue  # Already filled (prefilled by the platform or an earlier step)
+
+            answer = self.answer_base.answer(field.label)
+            value = None
+            if answer is not None:
+                if field.type in ('select', 'radio'):
+                    value = choose_option(answer, field.options)
+                elif field.type == 'checkbox':
+                    value = 'true' if answer.strip().lower() in _YES else ''
+                else:
+                    value = answer
+
+            if value is not None:
+                fills.append({'id': field.id, 'type': field.type, 'value': value})
+            elif field.required:
+                unanswered.append(field.label)
+        return fills, uploads, unanswered
+
+    def fill_step(self, driver, root_selector: Optional[str] = None) -> StepResult:
+        """
+        Read, answer and fill every field of the current step
+
+        Args:
+            driver: Selenium WebDriver (already switched into the form's frame, if any)
+            root_selector: CSS selector of the form container; defaults to the whole document
+
+        Returns:
+            StepResult with the fields read, the number filled and unanswered required labels
+        """
+        fields = self.read_step(driver, root_selector)
+        fills, uploads, unanswered = self.plan(fields)
+
+        filled = driver.execute_script(FILL_FIELDS_SCRIPT, fills) if fills else 0
+        for field_id, path in uploads:
+            # File inputs cannot be set from script; send the path directly
+            driver.find_element(By.CSS_SELECTOR, f'[data-fe-id="{field_id}"]').send_keys(path)
+            filled += 1
+
+        if unanswered:
+            logger.info(f"Unanswered required fields: {', '.join(unanswered)}")
+        return StepResult(fields, filled, unanswered)
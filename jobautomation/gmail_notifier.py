@@ -0,0 +1,205 @@
+"""
+Gmail Notifications for Job Automation
+Sends notification emails through the Gmail API without slowing bot startup: the
+Google client libraries are imported, credentials loaded (and refreshed only when
+expired) and the service built on the first send, not at construction. Refreshed
+credentials are cached as JSON next to the old token.pickle. The interactive browser
+consent only ever runs from authorize(), which the bots call at setup when no token
+is cached yet. Passing an OfflineTransport runs the whole path without network access.
+"""
+
+import os
+import json
+import base64
+import pickle
+import logging
+import importlib.util
+from email import message_from_bytes, policy
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ['https://www.googleapis.com/auth/gmail.send']
+
+# Checked without importing: the client libraries take a noticeable time to import,
+# which only the first send should pay
+GMAIL_API_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None
+    for name in ('googleapiclient', 'google.oauth2', 'google_auth_oauthlib')
+)
+
+
+class OfflineTransport:
+    """
+    Local stand-in for the Gmail API's HTTP transport
+
+    Answers messages.send requests the way Gmail does, without network
+    access, and keeps every message it receives in `sent` for inspection. Usable
+    anywhere an httplib2.Http is accepted.
+    """
+
+    def __init__(self):
+        self.sent: List[Any] = []
+        self.requests = 0
+
+    def _accept(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        raw = base64.urlsafe_b64decode(body['raw'].encode('ascii'))
+        self.sent.append(message_from_bytes(raw, policy=policy.default))
+        return {'id': f'offline-{len(self.sent)}', 'labelIds': ['SENT']}
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs) -> Tuple[Any, bytes]:
+        import httplib2
+
+        self.requests += 1
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        result = self._accept(json.loads(body))
+        return httplib2.Response({'status': '200', 'content-type': 'application/json'}), json.dumps(result).encode()
+
+
+class GmailNotifier:
+    """
+    Lazily initialised Gmail API sender
+
+    Construction is free; the first send() loads credentials and builds the service.
+    Sends never open the browser consent flow: without a cached token, authorize()
+    has to run first.
+    """
+
+    def __init__(self, credentials_path: str = 'config/credentials.json',
+                 token_path: str = 'config/token.json',
+                 legacy_token_path: str = 'config/token.pickle',
+                 transport: Optional[Any] = None):
+        """
+        Initialize the notifier (nothing is loaded until the first send)
+
+        Args:
+            credentials_path: OAuth client secrets, used only when no token exists
+            token_path: JSON token cache, rewritten whenever the token is refreshed
+            legacy_token_path: Old pickled token, migrated to token_path once
+            transport: httplib2-compatible transport (e.g. OfflineTransport); skips
+                credentials entirely
+        """
+        self.credentials_path = credentials_path
+        self.token_path = token_path
+        self.legacy_token_path = legacy_token_path
+        self.transport = transport
+        self._service = None
+        self.stats = {'sent': 0, 'failed': 0, 'token_refreshes': 0}
+
+    @property
+    def available(self) -> bool:
+        """Whether sending can work at all (libraries installed and some way to authenticate)"""
+        if self.transport is not None:
+            return True
+        if not GMAIL_API_AVAILABLE:
+            return False
+        return any(os.path.exists(path) for path in
+                   (self.token_path, self.legacy_token_path, self.credentials_path))
+
+    @property
+    def authorized(self) -> bool:
+        """Whether a token is cached, so sending will not need the browser consent flow"""
+        return self.transport is not None or any(
+            os.path.exists(path) for path in (self.token_path, self.legacy_token_path))
+
+    def authorize(self):
+        """
+        Make sure a usable token is cached, running the browser consent flow if needed
+
+        Call this at startup, while someone is at the keyboard; a send at the end of a
+        long unattended run cannot answer a browser prompt.
+        """
+        if self.transport is None:
+            self._load_credentials(interactive=True)
+
+    def _load_credentials(self, interactive: bool = False):
+        """
+        Load cached credentials, refreshing them when expired
+
+        Args:
+            interactive: Run the browser consent flow when no usable token is cached;
+                otherwise that case raises RuntimeError
+        """
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+
+        creds = None
+        if os.path.exists(self.token_path):
+            creds = Credentials.from_authorized_user_file(self.token_path, SCOPES)
+        elif os.path.exists(self.legacy_token_path):
+            with open(self.legacy_token_path, 'rb') as token:
+                creds = pickle.load(token)
+            logger.info(f"Migrating {self.legacy_token_path} to {self.token_path}")
+            self._save_credentials(creds)
+
+        if creds and creds.valid:
+            return creds
+
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+            self.stats['token_refreshes'] += 1
+        elif not interactive:
+            raise RuntimeError(f"No usable Gmail token in {self.token_path}; "
+                               f"restart the bot to authorize Gmail again")
+        else:
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            flow = InstalledAppFlow.from_client_secrets_file(self.credentials_path, SCOPES)
+            creds = flow.run_local_server(port=0)
+        self._save_credentials(creds)
+        return creds
+
+    def _save_credentials(self, creds):
+        temp_path = self.token_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as token:
+            token.write(creds.to_json())
+        os.replace(temp_path, self.token_path)
+
+    def service(self):
+        """The Gmail API service, built on first use"""
+        if self._service is None:
+            # Static discovery: the client ships the Gmail discovery document, so building
+            # reads it from disk instead of fetching it
+            from googleapiclient.discovery import build
+            if self.transport is not None:
+                self._service = build('gmail', 'v1', http=self.transport, static_discovery=True)
+            else:
+                self._service = build('gmail', 'v1', credentials=self._load_credentials(),
+                                      static_discovery=True)
+            logger.info("Gmail API service ready")
+        return self._service
+
+    @staticmethod
+    def _raw_message(to: str, subject: str, body: str, html_body: Optional[str] = None) -> str:
+        message = MIMEMultipart('alternative') if html_body else MIMEMultipart()
+        message['to'] = to
+        message['subject'] = subject
+        message.attach(MIMEText(body, 'plain'))
+        if html_body:
+            message.attach(MIMEText(html_body, 'html'))
+        return base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
+
+    def send(self, to: str, subject: str, body: str, html_body: Optional[str] = None) -> bool:
+        """
+        Send one message
+
+        Args:
+            to: Recipient address
+            subject: Subject line
+            body: Plain text body
+            html_body: Optional HTML alternative
+
+        Returns:
+            True if Gmail accepted the message
+        """
+        try:
+            message = {'raw': self._raw_message(to, subject, body, html_body)}
+            self.service().users().messages().send(userId='me', body=message).execute()
+        except Exception as e:
+            logger.error(f"Error sending email notification: {e}")
+            self.stats['failed'] += 1
+            return False
+        self.stats['sent'] += 1
+        return True
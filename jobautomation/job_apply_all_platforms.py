@@ -8,8 +8,6 @@ It can automatically perform "Easy Apply" on supported platforms and send an ema
 """
 
 import os
-import pickle
-import base64
 import time
 import json
 import logging
@@ -17,152 +15,57 @@ import uuid
 import sqlite3
 import random
 from datetime import datetime
-from urllib.parse import quote_plus, urlencode
 from typing import Dict, Any, List, Optional
 
 # Securely load configuration from .env and config.json
 # Ensure simple_config_loader.py is in the same directory or accessible
 from simple_config_loader import load_config, print_config_summary
+from settings import ConfigError, ConfigWatcher
+from search_plan import PLATFORM_CONFIGS, build_search_plan
+from salary_parser import parse_salary, is_below_minimum
+from page_parser import ParserPool, LXML_AVAILABLE
+from page_cache import DetailPageCache
+from job_ids import canonical_job_id
+from location_normalizer import LocationPreferences
+from form_engine import AnswerBase, FormEngine
+from cover_letter import CoverLetterGenerator
+from negative_cache import NegativeCache, NO_EASY_APPLY, CLOSED, INELIGIBLE, APPLIED
+from easy_apply_flow import EasyApplyFlow, LINKEDIN_FLOW, INDEED_FLOW, SUBMITTED, UNVERIFIED, FAILED
+from gmail_notifier import GmailNotifier
+from driver_resolver import ChromeDriverResolver, start_chrome
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-# Gmail API imports for email notifications (optional)
-try:
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-    GMAIL_API_AVAILABLE = True
-except ImportError:
-    GMAIL_API_AVAILABLE = False
-    logger = logging.getLogger(__name__)
-
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-
-# --- Logging Configuration ---
-os.makedirs('logs', exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/job_automation_all_platforms.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging(log_file: str = 'logs/job_automation_all_platforms.log'):
+    """Log to the console and to log_file (called by entry points, not on import)"""
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file, encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+
 class ComprehensiveJobAutoApply:
     """
     A job application bot that automates searching on multiple platforms.
     It generates search URLs based on config, visits them, and allows for manual application.
     """
 
-    # --- Platform Configuration ---
-    # This dictionary drives the search logic for each platform.
-    # To add a new platform, add an entry here and enable it in config.json.
-    PLATFORM_CONFIGS = {
-        'dice': {
-            'url_template': 'https://www.dice.com/jobs?q={title}&location={location}&radius=30',
-            'name': 'Dice.com'
-        },
-        'ziprecruiter': {
-            'url_template': 'https://www.ziprecruiter.com/jobs/search?search={title}&location={location}',
-            'name': 'ZipRecruiter'
-        },
-        'glassdoor': {
-            'url_template': 'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={title}',
-            'name': 'Glassdoor'
-        },
-        'indeed': {
-            'url_template': 'https://www.indeed.com/jobs?q={title}&l={location}',
-            'name': 'Indeed'
-        },
-        'linkedin': {
-            'url_template': 'https://www.linkedin.com/jobs/search/?keywords={title}&location={location}',
-            'name': 'LinkedIn'
-        },
-        'builtin': {
-            'url_template': 'https://builtin.com/jobs?search={title}',
-            'name': 'BuiltIn'
-        },
-        'jobright_ai': {
-            'url_template': 'https://jobright.ai/jobs?q={title}&location={location}',
-            'name': 'JobRight.AI'
-        },
-        'weworkremotely': {
-            'url_template': 'https://weworkremotely.com/remote-jobs/search?term={title}',
-            'name': 'WeWorkRemotely'
-        },
-        'remotive': {
-            'url_template': 'https://remotive.com/remote-jobs/software-dev', # This one doesn't take search terms in URL
-            'name': 'Remotive.io'
-        },
-        'letsworkremotely': {
-            'url_template': 'https://letsworkremotely.com/remote-jobs/search?term={title}',
-            'name': 'LetsWorkRemotely'
-        },
-        'toptal': {
-            'url_template': 'https://www.toptal.com/jobs',
-            'name': 'Toptal'
-        },
-        'hired': {
-            'url_template': 'https://hired.com/jobs',
-            'name': 'Hired.com'
-        },
-        'wellfound': { # Formerly AngelList
-            'url_template': 'https://wellfound.com/jobs?query={title}',
-            'name': 'Wellfound (AngelList)'
-        },
-        'theladders': {
-            'url_template': 'https://www.theladders.com/jobs/search-jobs?keywords={title}',
-            'name': 'TheLadders.com'
-        },
-        'flexa': {
-            'url_template': 'https://flexa.careers/search?query={title}',
-            'name': 'Flexa.com'
-        },
-        'zapier': {
-            'url_template': 'https://zapier.com/jobs',
-            'name': 'Zapier Jobs'
-        },
-        'nodesk': {
-            'url_template': 'https://nodesk.co/remote-jobs/search/?query={title}',
-            'name': 'NoDesk.co'
-        },
-        'dynamitejobs': {
-            'url_template': 'https://dynamitejobs.com/remote-jobs?q={title}',
-            'name': 'DynamiteJobs.com'
-        },
-        'monster': {
-            'url_template': 'https://www.monster.com/jobs/search?q={title}&where={location}',
-            'name': 'Monster.com'
-        },
-        'careerbuilder': {
-            'url_template': 'https://www.careerbuilder.com/jobs?keywords={title}&location={location}',
-            'name': 'CareerBuilder'
-        },
-        'remote_co': {
-            'url_template': 'https://remote.co/remote-jobs/search/?search_keywords={title}',
-            'name': 'Remote.co'
-        },
-        'flexjobs': {
-            'url_template': 'https://www.flexjobs.com/search?search={title}&location={location}',
-            'name': 'FlexJobs'
-        },
-        'angellist': {
-            'url_template': 'https://angel.co/jobs?query={title}',
-            'name': 'AngelList'
-        }
-    }
+    # Search URL templates per platform (see search_plan.py)
+    PLATFORM_CONFIGS = PLATFORM_CONFIGS
 
     def __init__(self, config_file: str = 'config/config.json'):
         logger.info("="*70)
@@ -189,16 +92,45 @@ class ComprehensiveJobAutoApply:
         if print_config_summary:
             print_config_summary(self.config)
         logger.info(f"Config loaded for: {self.personal_info.get('name')}")
+        # Picks up config.json edits between searches (reuses the compiled config, no re-parse)
+        self.config_watcher = (
+            ConfigWatcher(config_file) if self.automation_settings.get('config_reload_enabled', True) else None
+        )
 
         # Initialize database
         self.db_path = 'logs/job_applications.db'
         self._init_database()
 
+        self.parser_pool = self._setup_parser_pool()
+        self.page_cache = self._setup_page_cache()
+        self.negative_cache = self._setup_negative_cache()
+        self.driver_startup = None
         self.driver = self._setup_selenium()
-        self.gmail_service = self._setup_gmail_api() if self.automation_settings.get('send_email_notifications') else None
+        self.notifier = self._setup_notifier() if self.automation_settings.get('send_email_notifications') else None
+
+        self.salary_min = self.job_preferences.get('salary_min', 0)
+        self.form_engine = FormEngine(
+            AnswerBase.from_config(self.config),
+            resume_path=self.personal_info.get('resume_path'),
+            cover_letter_path=self.personal_info.get('cover_letter_path')
+        )
+        self.cover_letters = self._setup_cover_letters()
+        self.linkedin_flow = EasyApplyFlow(LINKEDIN_FLOW, self.form_engine)
+        self.indeed_flow = EasyApplyFlow(INDEED_FLOW, self.form_engine)
+        self.location_preferences = (
+            LocationPreferences(self.job_preferences.get('locations', []))
+            if self.automation_settings.get('location_filter_enabled', True) else None
+        )
 
         self.jobs_visited = []
+        self.jobs_parsed = []
+        self.jobs_skipped = []
+        self.seen_job_ids = set()
+        self.duplicates_skipped = {}
+        self.page_load_times = []
+        self.flow_timings = {}
         self.applications_submitted = []
+        self.applications_unverified = []
         self.applications_failed = []
 
         logger.info("Bot initialized successfully\n")
@@ -238,6 +170,29 @@ class ComprehensiveJobAutoApply:
                 CREATE INDEX IF NOT EXISTS idx_timestamp ON applications(timestamp)
             ''')
 
+            # Older databases predate verified outcomes; add the duration column in place
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(applications)')}
+            if 'duration_seconds' not in columns:
+                cursor.execute('ALTER TABLE applications ADD COLUMN duration_seconds REAL')
+
+            # Create salaries table for pay analytics (one row per job posting URL)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS salaries (
+                    url TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    platform TEXT,
+                    job_title TEXT,
+                    company TEXT,
+                    salary_min INTEGER,
+                    salary_max INTEGER,
+                    currency TEXT,
+                    period TEXT,
+                    raw_text TEXT,
+                    below_minimum INTEGER,
+                    timestamp TEXT
+                )
+            ''')
+
             conn.commit()
             conn.close()
             logger.info(f"Database initialized: {self.db_path}")
@@ -285,38 +240,325 @@ class ComprehensiveJobAutoApply:
         except Exception as e:
             logger.error(f"Error saving to database: {e}")
 
-    def _setup_gmail_api(self):
-        """Set up Gmail API for sending notifications if enabled."""
-        if not GMAIL_API_AVAILABLE:
-            logger.info("Gmail API not available (install google-auth packages). Email notifications disabled.")
+    def _save_outcome_to_db(self, job_data: Dict[str, Any]):
+        """Save a verified application outcome (submitted, unverified or failed) with its duration"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO applications
+                (session_id, platform, platform_name, job_title, company, url, status, error_message,
+                 timestamp, duration_seconds)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    session_id = excluded.session_id,
+                    status = excluded.status,
+                    error_message = excluded.error_message,
+                    timestamp = excluded.timestamp,
+                    duration_seconds = excluded.duration_seconds
+            ''', (
+                self.session_id,
+                job_data.get('platform', ''),
+                job_data.get('platform_name', ''),
+                job_data.get('title', ''),
+                job_data.get('company', ''),
+                job_data.get('url') or None,  # NULL, not '', so link-less postings do not collide
+                job_data['status'],
+                job_data.get('error', ''),
+                job_data.get('timestamp', datetime.now().isoformat()),
+                job_data.get('duration_seconds')
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error saving application outcome: {e}")
+
+    def _record_outcome(self, platform: str, job_title: str, company: str, url: str,
+                        status: str, duration: float, error: str = '', ineligible: bool = False):
+        """Track an application by its verified outcome in memory and in the database"""
+        job_data = {
+            'platform': platform,
+            'platform_name': self.PLATFORM_CONFIGS.get(platform, {}).get('name', platform),
+            'title': job_title,
+            'company': company,
+            'url': url,
+            'status': status,
+            'error': error,
+            'duration_seconds': round(duration, 3),
+            'timestamp': datetime.now().isoformat()
+        }
+        job_id = canonical_job_id(platform, url) if url else ''
+        if status in (SUBMITTED, UNVERIFIED):
+            self._remember_negative(platform, job_id, APPLIED, url)
+        elif ineligible:
+            self._remember_negative(platform, job_id, INELIGIBLE, url)
+
+        if status == SUBMITTED:
+            logger.info(f"SUCCESS: Application for '{job_title}' submitted and confirmed ({duration:.1f}s).")
+            self.applications_submitted.append(job_data)
+        elif status == UNVERIFIED:
+            logger.warning(f"UNVERIFIED: Submitted '{job_title}' but saw no confirmation ({duration:.1f}s).")
+            self.applications_unverified.append(job_data)
+        else:
+            logger.warning(f"FAILED: Application for '{job_title}' did not go through: {error}")
+            self.jobs_skipped.append({
+                'platform': platform,
+                'title': job_title,
+                'company': company,
+                'url': url,
+                'reason': 'application_failed',
+                'detail': error
+            })
+        self._save_outcome_to_db(job_data)
+
+    def _save_salary_to_db(self, platform: str, job_title: str, company: str, url: str, salary):
+        """Save a parsed salary to the database for analytics"""
+        if not url:
+            return  # Rows are keyed by posting URL; link-less cards would overwrite each other
+        try:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT OR REPLACE INTO salaries
+                (url, session_id, platform, job_title, company, salary_min, salary_max, currency, period, raw_text, below_minimum, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                url,
+                self.session_id,
+                platform,
+                job_title,
+                company,
+                salary.min_annual,
+                salary.max_annual,
+                salary.currency,
+                salary.period,
+                salary.raw,
+                int(is_below_minimum(salary, self.salary_min)),
+                datetime.now().isoformat()
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error saving salary to database: {e}")
+
+    def _check_salary(self, platform: str, job_title: str, company: str, url: str, *texts: str) -> bool:
+        """
+        Parse salary from card/description text, record it, and apply the salary_min filter
+
+        Returns:
+            True if the job may be applied to, False if it pays below salary_min
+        """
+        salary = None
+        for text in texts:
+            salary = parse_salary(text or '')
+            if salary:
+                break
+
+        if salary is None:
+            return True
+
+        self._save_salary_to_db(platform, job_title, company, url, salary)
+
+        if is_below_minimum(salary, self.salary_min):
+            logger.info(f"SKIPPED: {job_title} at {company} pays up to {salary.currency} {salary.max_annual:,}/yr "
+                        f"(below salary_min {self.salary_min:,})")
+            self.jobs_skipped.append({
+                'platform': platform,
+                'title': job_title,
+                'company': company,
+                'url': url,
+                'reason': 'salary_below_minimum',
+                'salary_max': salary.max_annual
+            })
+            return False
+        return True
+
+    def _setup_parser_pool(self) -> Optional[ParserPool]:
+        """Start the offline HTML parser process pool if enabled"""
+        if not self.automation_settings.get('offline_parsing', True):
+            return None
+        if not LXML_AVAILABLE:
+            logger.info("lxml not available (pip install lxml). Offline page parsing disabled.")
             return None
 
-        logger.info("Setting up Gmail API for email notifications...")
-        SCOPES = ['https://www.googleapis.com/auth/gmail.send']
-        creds = None
-        token_path = 'config/token.pickle'
-        creds_path = 'config/credentials.json'
+        pool = ParserPool(
+            max_workers=self.automation_settings.get('parser_workers'),
+            on_result=self._on_page_parsed
+        )
+        logger.info(f"Offline page parser started with {pool.max_workers} worker(s)")
+        return pool
 
-        if not os.path.exists(creds_path):
-            logger.warning(f"Gmail 'credentials.json' not found at '{creds_path}'. Email notifications disabled.")
+    def _setup_page_cache(self) -> Optional[DetailPageCache]:
+        """Open the on-disk job detail page cache if enabled"""
+        if not self.automation_settings.get('page_cache_enabled', True):
             return None
+        cache = DetailPageCache(
+            cache_dir='logs/page_cache',
+            ttl_seconds=int(self.automation_settings.get('page_cache_ttl_days', 7) * 24 * 3600),
+            max_bytes=int(self.automation_settings.get('page_cache_max_mb', 200) * 1024 * 1024)
+        )
+        logger.info(f"Detail page cache: {len(cache)} entries ({cache.codec})")
+        return cache
 
-        if os.path.exists(token_path):
-            with open(token_path, 'rb') as token:
-                creds = pickle.load(token)
+    def _setup_negative_cache(self) -> Optional[NegativeCache]:
+        """Load the persistent cache of postings to skip if enabled"""
+        if not self.automation_settings.get('negative_cache_enabled', True):
+            return None
+        return NegativeCache(self.db_path, self.automation_settings.get('negative_cache_ttl_days'))
+
+    def _check_seen(self, platform: str, job_id: str) -> bool:
+        """
+        Skip postings already handled by an earlier search in this run
+
+        Returns:
+            True the first time a posting is seen, False for duplicates
+        """
+        if not job_id:
+            return True
+        if job_id in self.seen_job_ids:
+            self.duplicates_skipped[platform] = self.duplicates_skipped.get(platform, 0) + 1
+            return False
+        self.seen_job_ids.add(job_id)
+        return True
+
+    def _check_negative_cache(self, platform: str, job_title: str, job_id: str, url: str) -> bool:
+        """
+        Skip postings an earlier run found to be external-apply, closed, ineligible or already applied
+
+        Returns:
+            True if the card should be opened, False if it is in the negative cache
+        """
+        reason = self.negative_cache.get(job_id) if self.negative_cache and job_id else None
+        if reason is None:
+            return True
+        logger.info(f"SKIPPED: {job_title} is cached as '{reason}'")
+        self.jobs_skipped.append({
+            'platform': platform,
+            'title': job_title,
+            'company': '',
+            'url': url,
+            'reason': 'negative_cache',
+            'cached_reason': reason
+        })
+        return False
 
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(creds_path, SCOPES)
-                creds = flow.run_local_server(port=0)
-            with open(token_path, 'wb') as token:
-                pickle.dump(creds, token)
+    def _remember_negative(self, platform: str, job_id: str, reason: str, url: str):
+        """Add a posting to the negative cache so later runs skip it before clicking"""
+        if self.negative_cache and job_id:
+            self.negative_cache.add(job_id, platform, reason, url)
 
-        logger.info("Gmail API setup successful.")
-        return build('gmail', 'v1', credentials=creds)
+    def _setup_cover_letters(self) -> Optional[CoverLetterGenerator]:
+        """Compile the cover letter template if tailored letters are enabled"""
+        if not self.automation_settings.get('generate_cover_letters', True):
+            return None
+        template_path = self.personal_info.get('cover_letter_template')
+        cover_letter_path = self.personal_info.get('cover_letter_path') or ''
+        if not template_path and cover_letter_path.lower().endswith(('.txt', '.md')):
+            template_path = cover_letter_path  # A text cover letter doubles as the template
+            # ...so it is never uploaded as it stands, with its $placeholders unfilled
+            self.form_engine.cover_letter_path = None
+        try:
+            return CoverLetterGenerator(
+                self.personal_info,
+                self.job_preferences.get('keywords', []),
+                template_path=template_path,
+                output_format=self.automation_settings.get('cover_letter_format', 'pdf')
+            )
+        except Exception as e:
+            logger.warning(f"Tailored cover letters disabled: {e}")
+            return None
 
+    def _prefetch_cover_letter(self, job_id: str, job_title: str, company: str, description: str):
+        """Render this job's cover letter in the background while the application opens"""
+        if not self.cover_letters or not job_id:
+            return
+        self.cover_letters.prefetch(job_id, job_title, company, description)
+        self.form_engine.use_cover_letter(lambda: self.cover_letters.path_for(job_id))
+
+    def _cached_description(self, job_id: str) -> Optional[str]:
+        """Return cached description text for a job, or None on a cache miss"""
+        return self.page_cache.get_text(job_id) if self.page_cache and job_id else None
+
+    def _job_description(self, job_id: str, url: str, selector: str, cached: Optional[str] = None) -> str:
+        """
+        Return a job's description text, reading the detail pane only on a cache miss
+
+        Args:
+            job_id: Canonical job ID
+            url: Job posting URL
+            selector: CSS selector of the description container in the detail pane
+            cached: Text already fetched from the cache, if any
+        """
+        if cached is not None:
+            return cached
+
+        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+        if not elements:
+            return ''
+        text = elements[0].text
+        if self.page_cache and job_id:
+            self.page_cache.put(job_id, url, elements[0].get_attribute('outerHTML') or '', text)
+        return text
+
+    def _on_page_parsed(self, result: Dict[str, Any]):
+        """Collect normalized job records from the parser pool for the run log"""
+        self.jobs_parsed.extend(result['records'])
+        logger.info(f"Parsed {len(result['records'])} job records from {result['platform']} "
+                    f"in {result['parse_seconds'] * 1000:.0f}ms")
+
+    def _capture_page(self, platform: str):
+        """Capture a results page's source once and hand it to the parser pool without waiting"""
+        if not self.parser_pool:
+            return
+        try:
+            html = self.driver.page_source
+            url = self.driver.current_url
+        except Exception as e:
+            logger.warning(f"Could not capture page source: {e}")
+            return
+        self.parser_pool.submit_listing(platform, url, html)
+
+    def _check_location(self, platform: str, job_title: str, company: str, url: str, location_text: str) -> bool:
+        """
+        Match a card's location against job_preferences.locations
+
+        Returns:
+            True if the job may be applied to, False if it is in the wrong place or work mode
+        """
+        if not self.location_preferences or not location_text:
+            return True
+
+        matches, location = self.location_preferences.matches(location_text)
+        if not matches:
+            logger.info(f"SKIPPED: {job_title} at {company} is {location.mode} in '{location_text}' "
+                        f"(not in preferred locations)")
+            self.jobs_skipped.append({
+                'platform': platform,
+                'title': job_title,
+                'company': company,
+                'url': url,
+                'reason': 'location_mismatch',
+                'location': location_text,
+                'work_mode': location.mode
+            })
+        return matches
+
+    def _setup_notifier(self) -> Optional[GmailNotifier]:
+        """Set up Gmail notifications; authorizes now if no token is cached, the rest loads on first send."""
+        notifier = GmailNotifier()
+        if not notifier.available:
+            logger.warning("Gmail API packages or 'config/credentials.json' missing. Email notifications disabled.")
+            return None
+        if not notifier.authorized:
+            # Authorize now: the first send comes at the end of the run, when nobody may be
+            # around to complete the browser consent
+            logger.info("No Gmail token cached yet - opening the browser to authorize Gmail")
+            try:
+                notifier.authorize()
+            except Exception as e:
+                logger.warning(f"Gmail authorization failed ({e}). Email notifications disabled.")
+                return None
+        return notifier
 
     def _setup_selenium(self):
         """Setup Chrome WebDriver with unique profile per session"""
@@ -346,24 +588,17 @@ class ComprehensiveJobAutoApply:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
-        local_chromedriver = os.path.join(os.getcwd(), 'chromedriver-win64', 'chromedriver.exe')
-        if os.path.exists(local_chromedriver):
-            service = Service(local_chromedriver)
-        else:
-            try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-            except Exception as e:
-                logger.error(f"Could not use webdriver-manager: {e}")
-                service = Service()
-
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Cached driver resolution: webdriver-manager only runs when Chrome's version changes
+        resolver = ChromeDriverResolver(
+            driver_path=self.automation_settings.get('chromedriver_path'),
+            driver_version=self.automation_settings.get('chromedriver_version')
+        )
+        driver, self.driver_startup = start_chrome(chrome_options, resolver)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         return driver
 
     def generate_search_urls(self) -> List[Dict[str, Any]]:
         """Generate URLs for all enabled platforms"""
-        urls = []
         job_titles = self.job_preferences.get('job_titles', [])
         locations = self.job_preferences.get('locations', [])
 
@@ -377,31 +612,66 @@ class ComprehensiveJobAutoApply:
         logger.info(f"Job Titles: {', '.join(job_titles)}")
         logger.info(f"Locations: {', '.join(locations)}")
 
-        # Generate URLs for each combination
-        for platform_key in enabled_platforms:
-            if platform_key not in self.PLATFORM_CONFIGS:
-                logger.warning(f"Platform '{platform_key}' is enabled but not configured in PLATFORM_CONFIGS, skipping.")
-                continue
+        urls = build_search_plan(self.platforms, job_titles, locations)
 
-            config = self.PLATFORM_CONFIGS[platform_key]
+        logger.info(f"Generated {len(urls)} search URLs\n")
+        return urls
 
-            for title in job_titles:
-                for location in locations:
-                    url = config['url_template'].format(
-                        title=quote_plus(title),
-                        location=quote_plus(location)
-                    )
+    def _reload_config(self, pending: List[Dict[str, Any]], visited_urls: set,
+                       searches_done: int) -> List[Dict[str, Any]]:
+        """
+        Apply config.json changes at a search boundary, without restarting the driver
+
+        Platforms, titles, locations, keywords (including the cover letter matcher) and
+        delays are updated in place; the remaining searches are regenerated so removed
+        ones are dropped and new ones are merged in. Other changes are reported and wait
+        for the next run.
+
+        Args:
+            pending: Searches not yet visited
+            visited_urls: URLs already visited this run
+            searches_done: Searches visited so far (counts against max_searches_per_run)
+
+        Returns:
+            The searches still to visit
+        """
+        if not self.config_watcher:
+            return pending
+        reload = self.config_watcher.poll()
+        if reload is None:
+            return pending
+        if reload.restart_required:
+            logger.warning(f"Config changes that need a restart were not applied: "
+                           f"{', '.join(reload.restart_required)}")
+        if not reload.changed:
+            return pending
+
+        new_config = reload.settings.as_dict()
+        sections = {
+            'platforms': self.platforms,
+            'job_preferences': self.job_preferences,
+            'automation_settings': self.automation_settings,
+        }
+        for path in reload.changed:
+            section, key = path.split('.', 1)
+            values = new_config.get(section) or {}
+            if key in values:
+                sections[section][key] = values[key]
+            else:
+                sections[section].pop(key, None)
 
-                    urls.append({
-                        'platform': platform_key,
-                        'platform_name': config['name'],
-                        'title': title,
-                        'location': location,
-                        'url': url
-                    })
+        self.salary_min = self.job_preferences.get('salary_min', 0)
+        if self.location_preferences is not None:
+            self.location_preferences = LocationPreferences(self.job_preferences.get('locations', []))
+        if self.cover_letters and 'job_preferences.keywords' in reload.changed:
+            self.cover_letters.set_keywords(self.job_preferences.get('keywords', []))
 
-        logger.info(f"Generated {len(urls)} search URLs\n")
-        return urls
+        pending = [search for search in self.generate_search_urls() if search['url'] not in visited_urls]
+        max_searches = self.automation_settings.get('max_searches_per_run', 25)
+        if max_searches:
+            pending = pending[:max(0, max_searches - searches_done)]
+        logger.info(f"Config reloaded ({', '.join(reload.changed)}): {len(pending)} searches remaining")
+        return pending
 
     def visit_job_search(self, search_info: Dict[str, Any], retry_count: int = 0):
         """Visit a job search URL with retry logic and duplicate checking"""
@@ -423,6 +693,7 @@ class ComprehensiveJobAutoApply:
 
         max_retries = 3
         try:
+            load_started = time.perf_counter()
             self.driver.get(url)
 
             # Intelligent wait for page load instead of fixed sleep
@@ -430,13 +701,19 @@ class ComprehensiveJobAutoApply:
                 WebDriverWait(self.driver, 15).until(
                     lambda d: d.execute_script('return document.readyState') == 'complete'
                 )
+                load_seconds = time.perf_counter() - load_started
                 # Add random delay to appear more human-like
                 time.sleep(random.uniform(2, 4))
             except TimeoutException:
+                load_seconds = time.perf_counter() - load_started
                 logger.warning("Page load timeout, continuing anyway...")
+            self.page_load_times.append(load_seconds)
 
             page_title = self.driver.title
-            logger.info(f"Page loaded: {page_title}")
+            logger.info(f"Page loaded: {page_title} ({load_seconds:.1f}s)")
+
+            # Hand the results page to the parser pool and keep navigating
+            self._capture_page(platform)
 
             # --- Attempt "Easy Apply" if enabled ---
             easy_apply_enabled = self.automation_settings.get('easy_apply_enabled', False)
@@ -538,21 +815,51 @@ class ComprehensiveJobAutoApply:
             for i, card in enumerate(job_cards[:10]): # Limit to first 10 jobs per search
                 try:
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", card)
+
+                    # Pre-filter on salary shown on the card before opening the job
+                    card_text = card.text
+                    job_url = self._card_link(card, 'a.base-card__full-link')
+                    job_id = canonical_job_id('linkedin', job_url) if job_url else ''
+                    card_title = card_text.split('\n')[0]
+                    if not self._check_seen('linkedin', job_id):
+                        continue
+                    if not self._check_negative_cache('linkedin', card_title, job_id, job_url):
+                        continue
+                    if not self._check_location('linkedin', card_title, '', job_url,
+                                                self._card_field(card, 'span.job-search-card__location')):
+                        continue
+                    cached_description = self._cached_description(job_id)
+                    if not self._check_salary('linkedin', card_title, '', job_url,
+                                              card_text, cached_description or ''):
+                        continue
+
                     card.click()
                     time.sleep(2) # Wait for job details to load
 
                     # Get job details from the right-hand pane
                     job_title = self.driver.find_element(By.CSS_SELECTOR, 'h2.top-card-layout__title').text
                     company = self.driver.find_element(By.CSS_SELECTOR, 'a.topcard__org-name-link').text
+
+                    # Salary is often only in the description; check it before clicking Easy Apply
+                    description = self._job_description(job_id, job_url, 'div.show-more-less-html__markup',
+                                                         cached_description)
+                    if not self._check_salary('linkedin', job_title, company, job_url, card_text, description):
+                        continue
                     
                     # Find the "Easy Apply" button in the details pane
-                    easy_apply_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'jobs-apply-button')]//span[text()='Easy Apply']")
-                    easy_apply_button.click()
+                    easy_apply_buttons = self.driver.find_elements(By.XPATH, "//button[contains(@class, 'jobs-apply-button')]//span[text()='Easy Apply']")
+                    if not easy_apply_buttons:
+                        closed = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'No longer accepting applications')]")
+                        self._remember_negative('linkedin', job_id, CLOSED if closed else NO_EASY_APPLY, job_url)
+                        logger.info(f"[{i+1}/{len(job_cards)}] Job is not 'Easy Apply', skipping.")
+                        continue
+                    self._prefetch_cover_letter(job_id, job_title, company, description)
+                    easy_apply_buttons[0].click()
                     
                     logger.info(f"[{i+1}/{len(job_cards)}] Applying to: {job_title} at {company}")
                     
                     # Fill the application form
-                    self._fill_linkedin_form(job_title, company)
+                    self._fill_linkedin_form(job_title, company, job_url)
 
                 except NoSuchElementException:
                     logger.info(f"[{i+1}/{len(job_cards)}] Job is not 'Easy Apply', skipping.")
@@ -565,49 +872,58 @@ class ComprehensiveJobAutoApply:
         except Exception as e:
             logger.error(f"Error finding LinkedIn job cards: {e}")
 
-    def _fill_linkedin_form(self, job_title: str, company: str):
-        """Fills out the multi-step LinkedIn 'Easy Apply' modal."""
+    def _card_link(self, card, selector: str) -> str:
+        """Return the job link href from a card, or '' if it has none"""
+        links = card.find_elements(By.CSS_SELECTOR, selector)
+        return (links[0].get_attribute('href') or '') if links else ''
+
+    def _card_field(self, card, selector: str) -> str:
+        """Return the text of a field inside a card, or '' if the card has none"""
+        elements = card.find_elements(By.CSS_SELECTOR, selector)
+        return elements[0].text if elements else ''
+
+    def _fill_linkedin_form(self, job_title: str, company: str, job_url: str):
+        """Fills out the multi-step LinkedIn 'Easy Apply' modal and records the verified outcome."""
+        started = time.perf_counter()
+        status, error, ineligible = FAILED, '', False
         try:
             # Wait for the modal to appear
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'div.jobs-easy-apply-modal'))
             )
 
-            # Navigate through the form pages
-            for _ in range(5): # Max 5 pages
-                # Fill phone number if requested
-                try:
-                    phone_field = self.driver.find_element(By.CSS_SELECTOR, 'input[id*="phoneNumber"]')
-                    if not phone_field.get_attribute('value'):
-                        phone_field.send_keys(self.personal_info.get('phone', ''))
-                except NoSuchElementException:
-                    pass
-
-                # Check for "Next" or "Submit" button
-                try:
-                    next_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Continue to next step')]")
-                    next_button.click()
-                    time.sleep(2)
-                except NoSuchElementException:
-                    # If "Next" not found, try to submit
-                    submit_button = self.driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Submit application')]")
-                    submit_button.click()
-                    logger.info(f"SUCCESS: Application for '{job_title}' submitted.")
-                    self.applications_submitted.append({'platform': 'LinkedIn', 'title': job_title, 'company': company})
-                    time.sleep(3) # Wait for confirmation
-                    return # Exit after successful submission
-
-            logger.warning("Exceeded max pages in LinkedIn form, closing modal.")
+            # Drive the modal through step -> review -> submit -> confirmation
+            result = self.linkedin_flow.run(self.driver)
+            self._record_flow(result)
+            status, error, ineligible = result.status, result.reason, bool(result.unanswered)
+            if result.unanswered:
+                error = f"{error}: {', '.join(result.unanswered)}"
 
         except Exception as e:
             logger.error(f"Error filling LinkedIn form for '{job_title}': {e}")
+            error = str(e)[:200]
         finally:
-            # Always try to close the modal
+            self.form_engine.use_cover_letter(None)
+            # Always try to close the modal, discarding any half-finished application
             try:
                 self.driver.find_element(By.CSS_SELECTOR, 'button[aria-label="Dismiss"]').click()
+                self.driver.find_element(By.CSS_SELECTOR, 'button[data-control-name="discard_application_confirm_btn"]').click()
             except:
                 pass # Modal may already be closed
 
+        self._record_outcome('linkedin', job_title, company, job_url, status,
+                             time.perf_counter() - started, error, ineligible)
+
+    def _record_flow(self, result):
+        """Accumulate per-state time spent in application flows"""
+        for state, seconds in result.state_seconds.items():
+            total = self.flow_timings.setdefault(state, {'seconds': 0.0, 'visits': 0})
+            total['seconds'] += seconds
+            total['visits'] += 1
+        outcome = self.flow_timings.setdefault(f'outcome_{result.status}', {'seconds': 0.0, 'visits': 0})
+        outcome['seconds'] += result.elapsed
+        outcome['visits'] += 1
+
     def _apply_on_indeed(self):
         """Finds and applies to 'Apply now' jobs on Indeed."""
         try:
@@ -627,6 +943,22 @@ class ComprehensiveJobAutoApply:
                     job_title = card.find_element(By.CSS_SELECTOR, 'h2.jobTitle > a > span').text
                     company = card.find_element(By.CSS_SELECTOR, 'span.companyName').text
 
+                    # Pre-filter on salary shown on the card before opening the job
+                    card_text = card.text
+                    job_url = self._card_link(card, 'h2.jobTitle > a')
+                    job_id = canonical_job_id('indeed', job_url) if job_url else ''
+                    if not self._check_seen('indeed', job_id):
+                        continue
+                    if not self._check_negative_cache('indeed', job_title, job_id, job_url):
+                        continue
+                    if not self._check_location('indeed', job_title, company, job_url,
+                                                self._card_field(card, 'div.companyLocation, [data-testid="text-location"]')):
+                        continue
+                    cached_description = self._cached_description(job_id)
+                    if not self._check_salary('indeed', job_title, company, job_url,
+                                              card_text, cached_description or ''):
+                        continue
+
                     # Click the card to open the details pane
                     card.click()
                     time.sleep(2)
@@ -635,15 +967,25 @@ class ComprehensiveJobAutoApply:
                     details_pane = WebDriverWait(self.driver, 10).until(
                         EC.presence_of_element_located((By.ID, "vjs-container"))
                     )
+
+                    # Salary is often only in the description; check it before clicking Apply
+                    description = self._job_description(job_id, job_url, '#jobDescriptionText', cached_description)
+                    if not self._check_salary('indeed', job_title, company, job_url, card_text, description):
+                        continue
                     
                     # Check for the "Apply now" button
-                    apply_button = details_pane.find_element(By.XPATH, ".//button[contains(@class, 'indeed-apply-button')] | .//span[contains(text(), 'Apply now')]")
-                    
+                    apply_buttons = details_pane.find_elements(By.XPATH, ".//button[contains(@class, 'indeed-apply-button')] | .//span[contains(text(), 'Apply now')]")
+                    if not apply_buttons:
+                        self._remember_negative('indeed', job_id, NO_EASY_APPLY, job_url)
+                        logger.info(f"[{i+1}/{len(job_cards)}] Job is not 'Apply now', skipping.")
+                        continue
+
                     logger.info(f"[{i+1}/{len(job_cards)}] Applying to: {job_title} at {company}")
-                    apply_button.click()
+                    self._prefetch_cover_letter(job_id, job_title, company, description)
+                    apply_buttons[0].click()
                     
                     # The application form opens in a new iframe
-                    self._fill_indeed_form(job_title, company)
+                    self._fill_indeed_form(job_title, company, job_url)
 
                 except NoSuchElementException:
                     logger.info(f"[{i+1}/{len(job_cards)}] Job is not 'Apply now', skipping.")
@@ -659,44 +1001,45 @@ class ComprehensiveJobAutoApply:
         except Exception as e:
             logger.error(f"Error finding Indeed job cards: {e}")
 
-    def _fill_indeed_form(self, job_title: str, company: str):
-        """Fills out the Indeed application form, which appears in an iframe."""
+    def _fill_indeed_form(self, job_title: str, company: str, job_url: str):
+        """Fills out the Indeed application form, which appears in an iframe, and records the verified outcome."""
+        started = time.perf_counter()
+        status, error, ineligible = FAILED, '', False
         try:
             # Switch to the application iframe
             WebDriverWait(self.driver, 10).until(
                 EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[title='Job application form']"))
             )
 
-            # Indeed forms vary. We'll look for a "Continue" button and click it until it's gone.
-            for _ in range(5): # Max 5 pages
-                try:
-                    continue_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Continue')]")
-                    continue_button.click()
-                    time.sleep(2)
-                except NoSuchElementException:
-                    # No more "Continue" buttons, assume we are on the final page.
-                    logger.info("Application submitted or reached final step.")
-                    self.applications_submitted.append({'platform': 'Indeed', 'title': job_title, 'company': company})
-                    break
+            # Indeed forms vary; the flow follows Continue/Review/Submit until confirmation or a dead end
+            result = self.indeed_flow.run(self.driver)
+            self._record_flow(result)
+            status, error, ineligible = result.status, result.reason, bool(result.unanswered)
+            if result.unanswered:
+                error = f"{error}: {', '.join(result.unanswered)}"
 
         except TimeoutException:
             logger.error(f"Indeed application iframe did not appear for '{job_title}'.")
+            error = 'application form did not appear'
         except Exception as e:
             logger.error(f"Error filling Indeed form for '{job_title}': {e}")
+            error = str(e)[:200]
         finally:
+            self.form_engine.use_cover_letter(None)
             # IMPORTANT: Switch back to the main content from the iframe
             self.driver.switch_to.default_content()
 
+        self._record_outcome('indeed', job_title, company, job_url, status,
+                             time.perf_counter() - started, error, ineligible)
+
     def send_email_notification(self):
         """Send email notification with application summary."""
-        if not self.gmail_service:
+        if not self.notifier:
             logger.info("Email service not configured or disabled. Skipping notification.")
             return
 
         try:
-            message = MIMEMultipart()
-            message['to'] = self.personal_info['email']
-            message['subject'] = f"Job Application Summary - {datetime.now().strftime('%Y-%m-%d')}"
+            subject = f"Job Application Summary - {datetime.now().strftime('%Y-%m-%d')}"
 
             total_apps = len(self.applications_submitted) + len(self.applications_failed)
             success_rate = (len(self.applications_submitted) / total_apps * 100) if total_apps > 0 else 0
@@ -705,9 +1048,12 @@ class ComprehensiveJobAutoApply:
 Job Automation Summary
 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-SUCCESSFUL APPLICATIONS: {len(self.applications_submitted)}
+SUCCESSFUL APPLICATIONS (CONFIRMED): {len(self.applications_submitted)}
 {self._format_apps_for_email(self.applications_submitted)}
 
+SUBMITTED BUT UNVERIFIED: {len(self.applications_unverified)}
+{self._format_apps_for_email(self.applications_unverified)}
+
 FAILED/SKIPPED SEARCHES: {len(self.applications_failed)}
 {self._format_apps_for_email(self.applications_failed, is_failure=True)}
 
@@ -716,11 +1062,8 @@ Success Rate: {success_rate:.1f}%
 ---
 Automated by Gemini Code Assist Bot
             """
-            message.attach(MIMEText(body, 'plain'))
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
-
-            self.gmail_service.users().messages().send(userId='me', body={'raw': raw_message}).execute()
-            logger.info("Email notification sent successfully.")
+            if self.notifier.send(self.personal_info['email'], subject, body):
+                logger.info("Email notification sent successfully.")
 
         except Exception as e:
             logger.error(f"Error sending email notification: {e}")
@@ -734,11 +1077,38 @@ Automated by Gemini Code Assist Bot
             if is_failure:
                 lines.append(f"  - {app['platform_name']}: {app.get('error', 'Unknown error')}")
             else:
-                lines.append(f"  - {app['title']} at {app['company']} ({app['platform']})")
+                lines.append(f"  - {app['title']} at {app['company']} ({app.get('platform_name', app['platform'])})")
         return "\n".join(lines) + "\n"
 
+    def _performance_summary(self) -> Dict[str, Any]:
+        """Page-load and parser timings, reported separately"""
+        loads = self.page_load_times
+        summary = {
+            'pages_loaded': len(loads),
+            'avg_page_load_ms': (sum(loads) / len(loads) * 1000) if loads else 0.0,
+            'total_page_load_seconds': sum(loads),
+        }
+        if self.driver_startup:
+            summary['driver_startup'] = self.driver_startup
+        if self.parser_pool:
+            self.parser_pool.drain()
+            summary['parser'] = self.parser_pool.throughput()
+        if self.page_cache:
+            summary['page_cache'] = self.page_cache.summary()
+        if self.negative_cache:
+            summary['negative_cache'] = self.negative_cache.summary()
+        if self.cover_letters:
+            summary['cover_letters'] = self.cover_letters.summary()
+        if self.flow_timings:
+            summary['application_flow'] = {
+                state: {**totals, 'avg_ms': totals['seconds'] / totals['visits'] * 1000}
+                for state, totals in self.flow_timings.items()
+            }
+        return summary
+
     def save_log(self):
         """Save comprehensive log"""
+        performance = self._performance_summary()
         log_data = {
             'run_timestamp': datetime.now().isoformat(),
             'config': {
@@ -748,12 +1118,21 @@ Automated by Gemini Code Assist Bot
             },
             'jobs_visited': self.jobs_visited,
             'applications_submitted': self.applications_submitted,
+            'applications_unverified': self.applications_unverified,
             'applications_failed': self.applications_failed,
+            'jobs_skipped': self.jobs_skipped,
+            'jobs_parsed': [job.to_dict() for job in self.jobs_parsed],
+            'performance': performance,
             'summary': {
                 'total_searches': len(self.jobs_visited),
                 'platforms_visited': len(set([j['platform'] for j in self.jobs_visited])),
                 'successful_applications': len(self.applications_submitted),
-                'failed_searches': len(self.applications_failed)
+                'unverified_applications': len(self.applications_unverified),
+                'failed_searches': len(self.applications_failed),
+                'jobs_skipped': len(self.jobs_skipped),
+                'duplicate_postings_skipped': sum(self.duplicates_skipped.values()),
+                'duplicates_by_platform': dict(self.duplicates_skipped),
+                'jobs_parsed': len(self.jobs_parsed)
             }
         }
 
@@ -787,16 +1166,23 @@ Automated by Gemini Code Assist Bot
             logger.info(f"Max per run: {max_searches}")
             logger.info(f"Delay between searches: {self.automation_settings.get('delay_between_searches', 10)}s\n")
 
-            # Visit each search
-            for idx, search_info in enumerate(search_urls, 1):
-                logger.info(f"\n[{idx}/{len(search_urls)}] Processing...")
+            # Visit each search; config edits are applied between searches
+            pending = list(search_urls)
+            visited_urls = set()
+            searches_done = 0
+            while pending:
+                search_info = pending.pop(0)
+                searches_done += 1
+                logger.info(f"\n[{searches_done}/{searches_done + len(pending)}] Processing...")
                 self.visit_job_search(search_info)
+                visited_urls.add(search_info['url'])
 
                 # Delay between searches
-                if idx < len(search_urls):
+                if pending:
                     delay = self.automation_settings.get('delay_between_searches', 10)
                     logger.info(f"Waiting {delay} seconds before next search...\n")
                     time.sleep(delay)
+                    pending = self._reload_config(pending, visited_urls, searches_done)
 
             # Save results
             log_file = self.save_log()
@@ -811,7 +1197,31 @@ Automated by Gemini Code Assist Bot
             logger.info(f"Total searches: {len(self.jobs_visited)}")
             logger.info(f"Platforms visited: {len(set([j['platform'] for j in self.jobs_visited]))}")
             logger.info(f"Successful applications: {len(self.applications_submitted)}")
+            logger.info(f"Unverified applications: {len(self.applications_unverified)}")
             logger.info(f"Failed searches/errors: {len(self.applications_failed)}")
+            logger.info(f"Jobs skipped by filters: {len(self.jobs_skipped)}")
+            logger.info(f"Duplicate postings skipped across searches: {sum(self.duplicates_skipped.values())} "
+                        f"({len(self.seen_job_ids)} unique postings seen)")
+            logger.info(f"Job records parsed offline: {len(self.jobs_parsed)}")
+            performance = self._performance_summary()
+            logger.info(f"Avg page load: {performance['avg_page_load_ms']:.0f}ms over {performance['pages_loaded']} pages")
+            if 'parser' in performance:
+                parser = performance['parser']
+                logger.info(f"Parser: {parser['pages_parsed']} pages, {parser['avg_parse_ms']:.0f}ms avg, "
+                            f"{parser['pages_per_sec']:.1f} pages/s per worker ({parser['workers']} workers)")
+            if 'page_cache' in performance:
+                cache = performance['page_cache']
+                logger.info(f"Detail page cache: {cache['hits']} hits, {cache['misses']} misses "
+                            f"({cache['hit_rate'] * 100:.0f}% hit rate), {cache['entries']} entries")
+            if 'negative_cache' in performance:
+                negative = performance['negative_cache']
+                logger.info(f"Negative cache: {negative['hits']}/{negative['lookups']} cards skipped before clicking "
+                            f"({negative['hit_rate'] * 100:.0f}% hit rate), {negative['added']} postings added")
+            if 'cover_letters' in performance:
+                letters = performance['cover_letters']
+                logger.info(f"Cover letters: {letters['rendered']} rendered ({letters['avg_render_ms']:.0f}ms avg, "
+                            f"off the apply path), {letters['cache_hits']} reused, "
+                            f"{letters['avg_wait_ms']:.0f}ms avg wait at upload")
             logger.info(f"Log file: {log_file}")
             logger.info("="*70 + "\n")
 
@@ -825,14 +1235,23 @@ Automated by Gemini Code Assist Bot
         finally:
             logger.info("\nClosing browser in 5 seconds...")
             time.sleep(5)
+            if self.parser_pool:
+                self.parser_pool.shutdown()
+            if self.page_cache:
+                self.page_cache.close()
+            if self.cover_letters:
+                self.cover_letters.shutdown()
             self.driver.quit()
             logger.info("Browser closed. Automation ended.\n")
 
 
 if __name__ == "__main__":
+    configure_logging()
     try:
         bot = ComprehensiveJobAutoApply(config_file='config/config.json')
         bot.run()
+    except ConfigError as e:
+        logger.error(str(e))
     except Exception as e:
         logger.error(f"A fatal error occurred during bot execution: {e}")
         import traceback
@@ -7,8 +7,9 @@ Sends email notifications via Gmail API
 import os
 import time
 import json
-import pickle
 import logging
+import sqlite3
+import uuid
 from datetime import datetime
 from typing import List, Dict, Optional
 
@@ -18,35 +19,34 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-
-# Gmail API imports
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import base64
-
-# Beautiful Soup for parsing
-from bs4 import BeautifulSoup
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/job_automation.log'),
-        logging.StreamHandler()
-    ]
-)
+
+from salary_parser import parse_salary, is_below_minimum
+from form_engine import AnswerBase, FormEngine
+from job_ids import canonical_job_id
+from negative_cache import NegativeCache, NO_EASY_APPLY, INELIGIBLE, APPLIED
+from easy_apply_flow import EasyApplyFlow, LINKEDIN_FLOW, INDEED_FLOW, SUBMITTED, UNVERIFIED, FAILED
+from gmail_notifier import GmailNotifier
+from driver_resolver import ChromeDriverResolver, start_chrome
+from settings import load_settings
+
 logger = logging.getLogger(__name__)
 
 
+def configure_logging(log_file: str = 'logs/job_automation.log'):
+    """Log to the console and to log_file (called by entry points, not on import)"""
+    os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler()
+        ]
+    )
+
+
 class JobAutoApply:
     """Main job application automation class"""
 
@@ -59,19 +59,39 @@ class JobAutoApply:
         """
         logger.info("Initializing Job Auto-Apply Bot")
 
-        # Load configuration
-        with open(config_file, 'r') as f:
-            self.config = json.load(f)
+        # Load and validate configuration (placeholders come from .env when present)
+        self.config = load_settings(config_file, '.env' if os.path.exists('.env') else None).as_dict()
 
         # Personal information
         self.personal_info = self.config['personal_info']
         self.job_preferences = self.config['job_preferences']
 
-        # Gmail API setup (only if email notifications are enabled)
+        # Form engine answers application questions from personal_info and application_answers
+        self.form_engine = FormEngine(
+            AnswerBase.from_config(self.config),
+            resume_path=self.personal_info.get('resume_path'),
+            cover_letter_path=self.personal_info.get('cover_letter_path')
+        )
+        self.linkedin_flow = EasyApplyFlow(LINKEDIN_FLOW, self.form_engine)
+        self.indeed_flow = EasyApplyFlow(INDEED_FLOW, self.form_engine)
+
+        # Verified outcomes go to the same applications database as the all-platforms bot
+        self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S') + '_' + str(uuid.uuid4())[:8]
+        self.db_path = 'logs/job_applications.db'
+        self._init_database()
+
+        # Postings earlier runs found to be external-apply, ineligible or already applied
+        automation_settings = self.config.get('automation_settings', {})
+        self.negative_cache = (
+            NegativeCache(self.db_path, automation_settings.get('negative_cache_ttl_days'))
+            if automation_settings.get('negative_cache_enabled', True) else None
+        )
+
+        # Gmail notifications (only if enabled); the API client is set up on the first send
         if self.config.get('automation_settings', {}).get('send_email_notifications', False):
-            self.gmail_service = self._setup_gmail_api()
+            self.notifier = self._setup_notifier()
         else:
-            self.gmail_service = None
+            self.notifier = None
             logger.info("Email notifications disabled - skipping Gmail API setup")
 
         # Selenium WebDriver setup
@@ -79,34 +99,96 @@ class JobAutoApply:
 
         # Application tracking
         self.applications_submitted = []
+        self.applications_unverified = []
         self.applications_failed = []
 
-        logger.info("Job Auto-Apply Bot initialized successfully")
-
-    def _setup_gmail_api(self):
-        """Set up Gmail API for sending notifications"""
-        SCOPES = ['https://www.googleapis.com/auth/gmail.send']
-        creds = None
+        # Postings seen by any search this run (titles and locations overlap across searches)
+        self.seen_job_ids = set()
+        self.duplicates_skipped = 0
 
-        # Token file stores user's access and refresh tokens
-        if os.path.exists('config/token.pickle'):
-            with open('config/token.pickle', 'rb') as token:
-                creds = pickle.load(token)
-
-        # If no valid credentials, let user log in
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'config/credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
+        logger.info("Job Auto-Apply Bot initialized successfully")
 
-            # Save credentials for next run
-            with open('config/token.pickle', 'wb') as token:
-                pickle.dump(creds, token)
+    def _init_database(self):
+        """Create the applications table (shared with job_apply_all_platforms.py) if needed"""
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS applications (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT,
+                    platform TEXT,
+                    platform_name TEXT,
+                    job_title TEXT,
+                    company TEXT,
+                    location TEXT,
+                    url TEXT UNIQUE,
+                    page_title TEXT,
+                    status TEXT,
+                    error_message TEXT,
+                    timestamp TEXT,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    duration_seconds REAL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_url ON applications(url)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_timestamp ON applications(timestamp)')
+            # Databases created by older versions of the all-platforms bot lack the duration column
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(applications)')}
+            if 'duration_seconds' not in columns:
+                conn.execute('ALTER TABLE applications ADD COLUMN duration_seconds REAL')
+            conn.commit()
+        finally:
+            conn.close()
 
-        return build('gmail', 'v1', credentials=creds)
+    def _save_outcome_to_db(self, entry: Dict):
+        """Save a verified application outcome with its duration"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('''
+                INSERT INTO applications
+                (session_id, platform, platform_name, job_title, company, url, status, error_message,
+                 timestamp, duration_seconds)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    session_id = excluded.session_id,
+                    status = excluded.status,
+                    error_message = excluded.error_message,
+                    timestamp = excluded.timestamp,
+                    duration_seconds = excluded.duration_seconds
+            ''', (
+                self.session_id,
+                entry['platform'].lower(),
+                entry['platform'],
+                entry['job_title'],
+                entry['company'],
+                entry.get('url') or None,  # NULL, not '', so link-less postings do not collide
+                entry['status'],
+                entry.get('error', ''),
+                entry['timestamp'],
+                entry['duration_seconds']
+            ))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error saving application outcome: {e}")
+
+    def _setup_notifier(self) -> Optional[GmailNotifier]:
+        """Set up Gmail notifications, authorizing now if no token is cached (the API client loads on first send)"""
+        notifier = GmailNotifier()
+        if not notifier.available:
+            logger.warning("Gmail API packages or credentials missing - email notifications disabled")
+            return None
+        if not notifier.authorized:
+            # Authorize now: the first send comes at the end of the run, when nobody may be
+            # around to complete the browser consent
+            logger.info("No Gmail token cached yet - opening the browser to authorize Gmail")
+            try:
+                notifier.authorize()
+            except Exception as e:
+                logger.warning(f"Gmail authorization failed ({e}) - email notifications disabled")
+                return None
+        return notifier
 
     def _setup_selenium(self) -> webdriver.Chrome:
         """Set up Selenium WebDriver for Chrome"""
@@ -148,17 +230,13 @@ class JobAutoApply:
         }
         chrome_options.add_experimental_option("prefs", prefs)
 
-        # Create WebDriver with ChromeDriver
-        # Try local chromedriver first, fall back to webdriver-manager
-        local_chromedriver = os.path.join(os.getcwd(), 'chromedriver-win64', 'chromedriver.exe')
-        if os.path.exists(local_chromedriver):
-            service = Service(local_chromedriver)
-            logger.info(f"Using local chromedriver: {local_chromedriver}")
-        else:
-            service = Service(ChromeDriverManager().install())
-            logger.info("Using webdriver-manager to download chromedriver")
-
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Cached driver resolution: webdriver-manager only runs when Chrome's version changes
+        automation_settings = self.config.get('automation_settings', {})
+        resolver = ChromeDriverResolver(
+            driver_path=automation_settings.get('chromedriver_path'),
+            driver_version=automation_settings.get('chromedriver_version')
+        )
+        driver, _ = start_chrome(chrome_options, resolver)
 
         # Execute script to hide webdriver property
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -238,6 +316,21 @@ class JobAutoApply:
 
             for i, job_card in enumerate(job_cards[:10]):  # Apply to first 10
                 try:
+                    job_url = self._card_url(job_card, 'a.job-card-container__link, a.job-card-list__title')
+                    job_id = canonical_job_id('linkedin', job_url) if job_url else ''
+                    if self._already_seen(job_id):
+                        logger.info(f"Job {i+1}: Already seen in an earlier search this run, skipping")
+                        continue
+
+                    cached_reason = self._negative_reason(job_id)
+                    if cached_reason:
+                        logger.info(f"Job {i+1}: Cached as '{cached_reason}', skipping")
+                        continue
+
+                    if self._below_salary_min(job_card.text):
+                        logger.info(f"Job {i+1}: Salary below salary_min, skipping")
+                        continue
+
                     # Click job card
                     job_card.click()
                     time.sleep(2)
@@ -249,8 +342,9 @@ class JobAutoApply:
                     )
 
                     if easy_apply_buttons:
-                        self._apply_linkedin_easy_apply(job_card)
+                        self._apply_linkedin_easy_apply(job_card, job_id, job_url)
                     else:
+                        self._remember_negative(job_id, 'linkedin', NO_EASY_APPLY, job_url)
                         logger.info(f"Job {i+1}: No Easy Apply button, skipping")
 
                 except Exception as e:
@@ -260,13 +354,16 @@ class JobAutoApply:
         except Exception as e:
             logger.error(f"Error finding job cards: {e}")
 
-    def _apply_linkedin_easy_apply(self, job_card):
+    def _apply_linkedin_easy_apply(self, job_card, job_id: str, job_url: str):
         """
         Apply to LinkedIn job using Easy Apply
 
         Args:
             job_card: Selenium WebElement of job card
+            job_id: Canonical job ID of the posting
+            job_url: Posting URL
         """
+        started = None
         try:
             # Get job title and company
             job_title = job_card.find_element(
@@ -279,6 +376,7 @@ class JobAutoApply:
             ).text
 
             logger.info(f"Applying to: {job_title} at {company}")
+            started = time.perf_counter()
 
             # Click Easy Apply button
             easy_apply_button = self.driver.find_element(
@@ -286,81 +384,79 @@ class JobAutoApply:
                 "//button[contains(., 'Easy Apply')]"
             )
             easy_apply_button.click()
-            time.sleep(2)
 
-            # Fill application form
-            self._fill_linkedin_application()
-
-            # Track successful application
-            self.applications_submitted.append({
-                'platform': 'LinkedIn',
-                'job_title': job_title,
-                'company': company,
-                'timestamp': datetime.now().isoformat()
-            })
-
-            logger.info(f"Successfully applied to {job_title} at {company}")
+            # Fill application form and record only what the flow could verify
+            result = self._fill_linkedin_application()
+            self._record_outcome('LinkedIn', job_title, company, job_url, result, time.perf_counter() - started)
+            started = None  # Recorded; an error below must not record the application again
+            self._remember_outcome(job_id, 'linkedin', job_url, result)
 
         except Exception as e:
             logger.error(f"Error during Easy Apply: {e}")
-            self.applications_failed.append({
-                'platform': 'LinkedIn',
-                'error': str(e),
-                'timestamp': datetime.now().isoformat()
-            })
+            if started is None:
+                # The card could not be read, so nothing was attempted
+                self.applications_failed.append({
+                    'platform': 'LinkedIn',
+                    'status': FAILED,
+                    'error': str(e),
+                    'timestamp': datetime.now().isoformat()
+                })
+            else:
+                self._record_outcome('LinkedIn', job_title, company, job_url, None,
+                                     time.perf_counter() - started, error=str(e))
+
+    def _record_outcome(self, platform: str, job_title: str, company: str, job_url: str, result,
+                        duration: float, error: Optional[str] = None):
+        """
+        Track an application under its verified status, in memory and in the database
+
+        Args:
+            platform: Platform display name
+            job_title: Job title
+            company: Company name
+            job_url: Posting URL ('' if the card had no link)
+            result: FlowResult from the application flow, or None if the form never opened
+            duration: Seconds from clicking Apply to the final state
+            error: Exception that aborted the application, recorded as the failure reason
+        """
+        entry = {
+            'platform': platform,
+            'job_title': job_title,
+            'company': company,
+            'url': job_url,
+            'status': result.status if result else FAILED,
+            'duration_seconds': round(duration, 3),
+            'timestamp': datetime.now().isoformat()
+        }
+        if entry['status'] == SUBMITTED:
+            self.applications_submitted.append(entry)
+            logger.info(f"Successfully applied to {job_title} at {company} ({duration:.1f}s)")
+        elif entry['status'] == UNVERIFIED:
+            self.applications_unverified.append(entry)
+            logger.warning(f"Submitted {job_title} at {company} but saw no confirmation")
+        else:
+            entry['error'] = error or (result.reason if result else 'application form did not open')
+            self.applications_failed.append(entry)
+            logger.warning(f"Application to {job_title} at {company} failed: {entry['error']}")
+        self._save_outcome_to_db(entry)
 
     def _fill_linkedin_application(self):
-        """Fill LinkedIn Easy Apply application form"""
+        """
+        Fill LinkedIn Easy Apply application form
+
+        Returns:
+            FlowResult of the application flow, or None if the modal never opened
+        """
         try:
             # Wait for modal to appear
             WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, 'div.jobs-easy-apply-modal'))
             )
 
-            # Fill phone number if requested
-            try:
-                phone_field = self.driver.find_element(By.CSS_SELECTOR, 'input[id*="phoneNumber"]')
-                phone_field.clear()
-                phone_field.send_keys(self.personal_info['phone'])
-            except NoSuchElementException:
-                pass
-
-            # Upload resume if requested
-            try:
-                resume_upload = self.driver.find_element(By.CSS_SELECTOR, 'input[type="file"]')
-                resume_path = os.path.abspath(self.personal_info['resume_path'])
-                resume_upload.send_keys(resume_path)
-                time.sleep(2)
-            except NoSuchElementException:
-                pass
-
-            # Click through multi-page application
-            max_pages = 5
-            for page in range(max_pages):
-                try:
-                    # Look for "Next" button
-                    next_button = self.driver.find_element(
-                        By.XPATH,
-                        "//button[contains(@aria-label, 'Continue to next step') or contains(., 'Next')]"
-                    )
-                    next_button.click()
-                    time.sleep(2)
-
-                except NoSuchElementException:
-                    # No "Next" button, look for "Review" or "Submit"
-                    try:
-                        submit_button = self.driver.find_element(
-                            By.XPATH,
-                            "//button[contains(@aria-label, 'Submit application') or contains(., 'Submit')]"
-                        )
-                        submit_button.click()
-                        time.sleep(3)
-                        logger.info("Application submitted successfully")
-                        break
-
-                    except NoSuchElementException:
-                        logger.warning("Could not find Submit button")
-                        break
+            # Drive the modal through step -> review -> submit -> confirmation
+            result = self.linkedin_flow.run(self.driver)
+            logger.info(f"Application flow ended in '{result.state}' after {result.steps} steps "
+                        f"({result.elapsed:.1f}s)")
 
             # Close modal
             try:
@@ -372,8 +468,11 @@ class JobAutoApply:
             except:
                 pass
 
+            return result
+
         except TimeoutException:
             logger.error("Application modal did not load in time")
+            return None
 
     def apply_indeed_jobs(self):
         """Apply to jobs on Indeed"""
@@ -447,6 +546,21 @@ class JobAutoApply:
 
             for i, job_card in enumerate(job_cards[:10]):
                 try:
+                    job_url = self._card_url(job_card, 'h2.jobTitle a')
+                    job_id = canonical_job_id('indeed', job_url) if job_url else ''
+                    if self._already_seen(job_id):
+                        logger.info(f"Job {i+1}: Already seen in an earlier search this run, skipping")
+                        continue
+
+                    cached_reason = self._negative_reason(job_id)
+                    if cached_reason:
+                        logger.info(f"Job {i+1}: Cached as '{cached_reason}', skipping")
+                        continue
+
+                    if self._below_salary_min(job_card.text):
+                        logger.info(f"Job {i+1}: Salary below salary_min, skipping")
+                        continue
+
                     # Click job card
                     job_card.click()
                     time.sleep(2)
@@ -458,8 +572,9 @@ class JobAutoApply:
                     )
 
                     if easily_apply_buttons:
-                        self._apply_indeed_job(job_card)
+                        self._apply_indeed_job(job_card, job_id, job_url)
                     else:
+                        self._remember_negative(job_id, 'indeed', NO_EASY_APPLY, job_url)
                         logger.info(f"Job {i+1}: No Easily apply button")
 
                 except Exception as e:
@@ -469,19 +584,23 @@ class JobAutoApply:
         except Exception as e:
             logger.error(f"Error searching Indeed: {e}")
 
-    def _apply_indeed_job(self, job_card):
+    def _apply_indeed_job(self, job_card, job_id: str, job_url: str):
         """
         Apply to Indeed job
 
         Args:
             job_card: Selenium WebElement of job card
+            job_id: Canonical job ID of the posting
+            job_url: Posting URL
         """
+        started = None
         try:
             # Get job details
             job_title = job_card.find_element(By.CSS_SELECTOR, 'h2.jobTitle').text
             company = job_card.find_element(By.CSS_SELECTOR, 'span.companyName').text
 
             logger.info(f"Applying to: {job_title} at {company}")
+            started = time.perf_counter()
 
             # Click apply button
             apply_button = self.driver.find_element(
@@ -489,56 +608,75 @@ class JobAutoApply:
                 "//button[contains(., 'Easily apply') or contains(@id, 'applyButton')]"
             )
             apply_button.click()
-            time.sleep(2)
-
-            # Fill application (simplified - Indeed varies widely)
-            self._fill_indeed_application()
 
-            self.applications_submitted.append({
-                'platform': 'Indeed',
-                'job_title': job_title,
-                'company': company,
-                'timestamp': datetime.now().isoformat()
-            })
-
-            logger.info(f"Successfully applied to {job_title} at {company}")
+            # Fill application (Indeed varies widely) and record only what the flow could verify
+            result = self._fill_indeed_application()
+            self._record_outcome('Indeed', job_title, company, job_url, result, time.perf_counter() - started)
+            started = None  # Recorded; an error below must not record the application again
+            self._remember_outcome(job_id, 'indeed', job_url, result)
 
         except Exception as e:
             logger.error(f"Error during Indeed application: {e}")
+            if started is not None:
+                self._record_outcome('Indeed', job_title, company, job_url, None,
+                                     time.perf_counter() - started, error=str(e))
 
     def _fill_indeed_application(self):
-        """Fill Indeed application form"""
-        try:
-            # Upload resume if prompted
-            try:
-                resume_upload = self.driver.find_element(By.CSS_SELECTOR, 'input[type="file"]')
-                resume_path = os.path.abspath(self.personal_info['resume_path'])
-                resume_upload.send_keys(resume_path)
-                time.sleep(2)
-            except NoSuchElementException:
-                pass
-
-            # Fill phone if requested
-            try:
-                phone_field = self.driver.find_element(By.CSS_SELECTOR, 'input[name*="phone"]')
-                phone_field.clear()
-                phone_field.send_keys(self.personal_info['phone'])
-            except NoSuchElementException:
-                pass
-
-            # Submit application
-            try:
-                submit_button = self.driver.find_element(
-                    By.XPATH,
-                    "//button[contains(., 'Submit') or contains(., 'Continue')]"
-                )
-                submit_button.click()
-                time.sleep(3)
-            except NoSuchElementException:
-                logger.warning("Could not find submit button")
+        """
+        Fill Indeed application form
 
+        Returns:
+            FlowResult of the application flow, or None on error
+        """
+        try:
+            # Fill resume, phone and any answerable questions on each step until confirmed or stuck
+            return self.indeed_flow.run(self.driver)
         except Exception as e:
             logger.error(f"Error filling Indeed application: {e}")
+            return None
+
+    def _card_url(self, job_card, selector: str) -> str:
+        """Return the posting link of a job card, or '' if it has none"""
+        links = job_card.find_elements(By.CSS_SELECTOR, selector)
+        return (links[0].get_attribute('href') or '') if links else ''
+
+    def _already_seen(self, job_id: str) -> bool:
+        """Mark a posting as seen this run; returns True if an earlier search already saw it"""
+        if not job_id:
+            return False
+        if job_id in self.seen_job_ids:
+            self.duplicates_skipped += 1
+            return True
+        self.seen_job_ids.add(job_id)
+        return False
+
+    def _negative_reason(self, job_id: str) -> Optional[str]:
+        """Return why an earlier run skipped this posting, or None"""
+        return self.negative_cache.get(job_id) if self.negative_cache and job_id else None
+
+    def _remember_negative(self, job_id: str, platform: str, reason: str, job_url: str):
+        """Add a posting to the negative cache so later runs skip it before clicking"""
+        if self.negative_cache and job_id:
+            self.negative_cache.add(job_id, platform, reason, job_url)
+
+    def _remember_outcome(self, job_id: str, platform: str, job_url: str, result):
+        """Cache submitted postings as applied and unanswerable ones as ineligible"""
+        if result and result.status in (SUBMITTED, UNVERIFIED):
+            self._remember_negative(job_id, platform, APPLIED, job_url)
+        elif result and result.unanswered:
+            self._remember_negative(job_id, platform, INELIGIBLE, job_url)
+
+    def _below_salary_min(self, text: str) -> bool:
+        """
+        Check whether the salary in job card text is below job_preferences.salary_min
+
+        Args:
+            text: Job card text
+
+        Returns:
+            True if a salary was found and its maximum is below salary_min
+        """
+        return is_below_minimum(parse_salary(text or ''), self.job_preferences.get('salary_min'))
 
     def _scroll_page(self, scrolls: int = 3):
         """
@@ -553,45 +691,39 @@ class JobAutoApply:
 
     def send_email_notification(self):
         """Send email notification with application summary"""
-        if not self.gmail_service:
+        if not self.notifier:
             logger.info("Email notifications disabled - skipping email")
             return
 
         try:
-            message = MIMEMultipart()
-            message['to'] = self.personal_info['email']
-            message['subject'] = f"Job Application Summary - {datetime.now().strftime('%Y-%m-%d')}"
+            subject = f"Job Application Summary - {datetime.now().strftime('%Y-%m-%d')}"
+
+            total = len(self.applications_submitted) + len(self.applications_unverified) + len(self.applications_failed)
+            success_rate = len(self.applications_submitted) / total * 100 if total else 0.0
 
             # Create email body
             body = f"""
 Job Application Automation Summary
 Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
-SUCCESSFUL APPLICATIONS: {len(self.applications_submitted)}
+SUCCESSFUL APPLICATIONS (CONFIRMED): {len(self.applications_submitted)}
 {self._format_applications(self.applications_submitted)}
 
+SUBMITTED BUT UNVERIFIED: {len(self.applications_unverified)}
+{self._format_applications(self.applications_unverified)}
+
 FAILED APPLICATIONS: {len(self.applications_failed)}
 {self._format_applications(self.applications_failed)}
 
-Total Applications: {len(self.applications_submitted) + len(self.applications_failed)}
-Success Rate: {len(self.applications_submitted) / (len(self.applications_submitted) + len(self.applications_failed)) * 100:.1f}%
+Total Applications: {total}
+Success Rate: {success_rate:.1f}%
 
 ---
 Automated by Job Auto-Apply Bot
             """
 
-            message.attach(MIMEText(body, 'plain'))
-
-            # Encode message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode('utf-8')
-
-            # Send email
-            self.gmail_service.users().messages().send(
-                userId='me',
-                body={'raw': raw_message}
-            ).execute()
-
-            logger.info("Email notification sent successfully")
+            if self.notifier.send(self.personal_info['email'], subject, body):
+                logger.info("Email notification sent successfully")
 
         except Exception as e:
             logger.error(f"Error sending email notification: {e}")
@@ -603,7 +735,9 @@ Automated by Job Auto-Apply Bot
 
         formatted = ""
         for app in applications:
-            if 'job_title' in app:
+            if 'job_title' in app and app.get('error'):
+                formatted += f"  - {app['job_title']} at {app['company']}: {app['error']} ({app['platform']})\n"
+            elif 'job_title' in app:
                 formatted += f"  - {app['job_title']} at {app['company']} ({app['platform']})\n"
             else:
                 formatted += f"  - Error: {app['error']} ({app['platform']})\n"
@@ -615,11 +749,14 @@ Automated by Job Auto-Apply Bot
         log_data = {
             'timestamp': datetime.now().isoformat(),
             'successful': self.applications_submitted,
+            'unverified': self.applications_unverified,
             'failed': self.applications_failed,
             'summary': {
-                'total': len(self.applications_submitted) + len(self.applications_failed),
+                'total': len(self.applications_submitted) + len(self.applications_unverified) + len(self.applications_failed),
                 'successful': len(self.applications_submitted),
-                'failed': len(self.applications_failed)
+                'unverified': len(self.applications_unverified),
+                'failed': len(self.applications_failed),
+                'duplicate_postings_skipped': self.duplicates_skipped
             }
         }
 
@@ -650,6 +787,13 @@ Automated by Job Auto-Apply Bot
 
             logger.info("Job application automation completed")
             logger.info(f"Total applications submitted: {len(self.applications_submitted)}")
+            logger.info(f"Submitted but unverified: {len(self.applications_unverified)}")
+            logger.info(f"Duplicate postings skipped across searches: {self.duplicates_skipped} "
+                        f"({len(self.seen_job_ids)} unique postings seen)")
+            if self.negative_cache:
+                negative = self.negative_cache.summary()
+                logger.info(f"Negative cache: {negative['hits']}/{negative['lookups']} cards skipped before clicking "
+                            f"({negative['hit_rate'] * 100:.0f}% hit rate), {negative['added']} postings added")
 
         except Exception as e:
             logger.error(f"Fatal error in automation: {e}")
@@ -661,6 +805,8 @@ Automated by Job Auto-Apply Bot
 
 
 if __name__ == "__main__":
+    configure_logging()
+
     # Run the automation
     bot = JobAutoApply(config_file='config/config.json')
     bot.run()
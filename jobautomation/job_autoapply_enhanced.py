@@ -17,13 +17,14 @@ except ImportError:
     from config_loader import load_config
     print_config_summary = None
 
+from driver_resolver import ChromeDriverResolver, start_chrome
+
 # Selenium imports
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
@@ -144,15 +145,12 @@ class EnhancedJobAutoApply:
         }
         chrome_options.add_experimental_option("prefs", prefs)
 
-        local_chromedriver = os.path.join(os.getcwd(), 'chromedriver-win64', 'chromedriver.exe')
-        if os.path.exists(local_chromedriver):
-            service = Service(local_chromedriver)
-            logger.info(f"Using local chromedriver: {local_chromedriver}")
-        else:
-            from webdriver_manager.chrome import ChromeDriverManager
-            service = Service(ChromeDriverManager().install())
-
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        automation_settings = self.config.get('automation_settings', {})
+        resolver = ChromeDriverResolver(
+            driver_path=automation_settings.get('chromedriver_path'),
+            driver_version=automation_settings.get('chromedriver_version')
+        )
+        driver, _ = start_chrome(chrome_options, resolver)
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
         return driver
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Job Automation Command Line
+Single entry point for the job bots. Each subcommand imports only what it needs, so
+only `run` pays for Selenium and the bot modules:
+
+    python job_bot.py run [--bot all|classic]   Run a bot (opens the browser)
+    python job_bot.py stats                      Application counts from the database
+    python job_bot.py plan [--urls]              Searches the next run would visit
+    python job_bot.py import FILE                Mark postings from CSV/JSONL to be skipped
+"""
+
+import os
+import sys
+import csv
+import json
+import logging
+import argparse
+import sqlite3
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = 'config/config.json'
+DEFAULT_ENV = '.env'
+DEFAULT_DB = 'logs/job_applications.db'
+
+
+def _env_file(path: str) -> Optional[str]:
+    return path if path and os.path.exists(path) else None
+
+
+def cmd_run(args) -> int:
+    """Run the all-platforms bot or the classic LinkedIn/Indeed bot"""
+    if args.bot == 'classic':
+        import job_autoapply as bot_module
+        bot_class = bot_module.JobAutoApply
+    else:
+        import job_apply_all_platforms as bot_module
+        bot_class = bot_module.ComprehensiveJobAutoApply
+    bot_module.configure_logging()
+
+    from settings import ConfigError
+    try:
+        bot = bot_class(config_file=args.config)
+    except (ConfigError, FileNotFoundError) as e:
+        logger.error(str(e))
+        return 1
+    bot.run()
+    return 0
+
+
+def cmd_stats(args) -> int:
+    """Print application counts by status and platform, overall and for the last 24 hours"""
+    if not os.path.exists(args.db):
+        print(f"No database at {args.db} (run the bot first)")
+        return 1
+
+    since = (datetime.now() - timedelta(hours=24)).isoformat()
+    conn = sqlite3.connect(args.db)
+    try:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'applications'").fetchone():
+            print(f"No applications recorded in {args.db}")
+            return 1
+        total = conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
+        by_status = conn.execute('''
+            SELECT coalesce(status, ''), COUNT(*), SUM(timestamp >= ?)
+            FROM applications GROUP BY 1 ORDER BY 2 DESC
+        ''', (since,)).fetchall()
+        by_platform = conn.execute('''
+            SELECT coalesce(nullif(platform_name, ''), platform, 'Unknown'), COUNT(*), SUM(status = 'submitted')
+            FROM applications GROUP BY 1 ORDER BY 2 DESC
+        ''').fetchall()
+    finally:
+        conn.close()
+
+    print("=" * 60)
+    print(" JOB AUTOMATION STATISTICS")
+    print("=" * 60)
+    print(f"Total records: {total}\n")
+    print(f"{'Status':<20} {'All time':>10} {'Last 24h':>10}")
+    for status, count, recent in by_status:
+        print(f"{status or '(none)':<20} {count:>10} {recent or 0:>10}")
+    print(f"\n{'Platform':<30} {'Records':>10} {'Submitted':>10}")
+    for platform, count, submitted in by_platform:
+        print(f"{platform:<30} {count:>10} {submitted or 0:>10}")
+    return 0
+
+
+def cmd_plan(args) -> int:
+    """Print the searches the next run would visit, without starting a browser"""
+    from settings import ConfigError, load_settings
+    from search_plan import build_search_plan
+
+    try:
+        settings = load_settings(args.config, _env_file(args.env), export_env=False)
+    except (ConfigError, FileNotFoundError) as e:
+        print(e)
+        return 1
+
+    searches = build_search_plan(settings.platforms, settings.job_preferences.job_titles,
+                                 settings.job_preferences.locations)
+    limit = settings.automation.max_searches_per_run
+    planned = searches[:limit] if limit else searches
+
+    if args.json:
+        print(json.dumps({'generated': len(searches), 'max_searches_per_run': limit,
+                          'searches': planned}, indent=2))
+        return 0
+
+    counts = {}
+    for search in planned:
+        counts[search['platform_name']] = counts.get(search['platform_name'], 0) + 1
+    print(f"{len(searches)} searches generated from {len(settings.enabled_platforms)} platforms, "
+          f"{len(settings.job_preferences.job_titles)} titles and "
+          f"{len(settings.job_preferences.locations)} locations")
+    print(f"Next run visits {len(planned)} (max_searches_per_run: {limit or 'unlimited'}), "
+          f"~{len(planned) * settings.automation.delay_between_searches / 60:.0f} min of delays\n")
+    for name, count in counts.items():
+        print(f"  {name:<30} {count:>5}")
+    if args.urls:
+        print()
+        for search in planned:
+            print(f"  [{search['platform']}] {search['title']} | {search['location']}\n    {search['url']}")
+    return 0
+
+
+def _read_postings(path: str) -> List[dict]:
+    """Rows with at least a url from a CSV (header row) or JSONL file"""
+    if path.lower().endswith(('.jsonl', '.ndjson')):
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+
+def cmd_import(args) -> int:
+    """Add postings from a file to the negative cache so the bots skip them"""
+    from job_ids import canonical_job_id
+    from negative_cache import NegativeCache, DEFAULT_TTL_DAYS
+
+    try:
+        rows = _read_postings(args.file)
+    except (OSError, ValueError) as e:
+        print(f"Cannot read {args.file}: {e}")
+        return 1
+
+    os.makedirs(os.path.dirname(args.db) or '.', exist_ok=True)
+    cache = NegativeCache(args.db)
+    imported = skipped = 0
+    for row in rows:
+        url = (row.get('url') or '').strip() if isinstance(row, dict) else ''
+        platform = (row.get('platform') or args.platform or '').strip().lower() if url else ''
+        if not url or not platform:
+            skipped += 1
+            continue
+        reason = row.get('reason') if row.get('reason') in DEFAULT_TTL_DAYS else args.reason
+        cache.add(canonical_job_id(platform, url), platform, reason, url)
+        imported += 1
+
+    print(f"Imported {imported} postings into {args.db} ({skipped} rows without url/platform skipped)")
+    return 0 if imported or not rows else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from negative_cache import APPLIED, CLOSED, INELIGIBLE, NO_EASY_APPLY
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Run a job bot')
+    run.add_argument('--bot', choices=('all', 'classic'), default='all',
+                     help='all: every configured platform (default); classic: LinkedIn and Indeed')
+    run.add_argument('--config', default=DEFAULT_CONFIG, help='Configuration file')
+    run.set_defaults(func=cmd_run)
+
+    stats = commands.add_parser('stats', help='Show application statistics')
+    stats.add_argument('--db', default=DEFAULT_DB, help='Applications database')
+    stats.set_defaults(func=cmd_stats)
+
+    plan = commands.add_parser('plan', help='Show the searches the next run would visit')
+    plan.add_argument('--config', default=DEFAULT_CONFIG, help='Configuration file')
+    plan.add_argument('--env', default=DEFAULT_ENV, help='.env file (used if present)')
+    plan.add_argument('--urls', action='store_true', help='List every search URL')
+    plan.add_argument('--json', action='store_true', help='Print the plan as JSON')
+    plan.set_defaults(func=cmd_plan)
+
+    importer = commands.add_parser('import', help='Mark postings (CSV or JSONL with url, platform) to skip')
+    importer.add_argument('file', help='CSV with a header row, or JSONL')
+    importer.add_argument('--platform', help='Platform for rows without a platform column')
+    importer.add_argument('--reason', choices=(APPLIED, CLOSED, INELIGIBLE, NO_EASY_APPLY), default=APPLIED,
+                          help='Skip reason (default: applied)')
+    importer.add_argument('--db', default=DEFAULT_DB, help='Applications database')
+    importer.set_defaults(func=cmd_import)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command != 'run':
+        logging.basicConfig(level=logging.WARNING, format='%(levelname)s - %(message)s')
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
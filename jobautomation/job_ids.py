@@ -0,0 +1,79 @@
+"""
+Canonical Job IDs for Job Automation
+Maps the many URL shapes a posting appears under to one stable key per posting
+"""
+
+import re
+import hashlib
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+
+# Native posting IDs embedded in platform URLs
+_NATIVE_ID_PATTERNS = {
+    'linkedin': [
+        (None, re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d{6,})')),
+        ('currentJobId', None),
+    ],
+    'indeed': [
+        ('jk', None),
+        ('vjk', None),
+    ],
+    'glassdoor': [
+        ('jl', None),
+        ('jobListingId', None),
+    ],
+    'dice': [
+        (None, re.compile(r'/job-detail/([0-9a-f-]{36})', re.IGNORECASE)),
+    ],
+    'ziprecruiter': [
+        ('jid', None),
+    ],
+}
+
+# Query parameters that never identify a posting (tracking, paging, UI state)
+_TRACKING_PARAMS = frozenset({
+    'refid', 'trackingid', 'trk', 'position', 'pagenum', 'from', 'tk', 'ref', 'src',
+    'source', 'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'gclid', 'fbclid', 'ebp', 'eid', 'lipi', 'sid',
+})
+
+
+@lru_cache(maxsize=8192)
+def canonical_job_id(platform: str, url: str) -> str:
+    """
+    Build a canonical ID for a job posting
+
+    Uses the platform's native posting ID when the URL carries one
+    (e.g. 'linkedin:3812345678', 'indeed:5f1c2b...'); otherwise falls back to
+    a short hash of the URL with tracking parameters and the fragment removed,
+    the host lowercased and query parameters sorted. The path keeps its case,
+    since some sites use case-sensitive posting slugs.
+
+    Args:
+        platform: Platform key from PLATFORM_CONFIGS
+        url: Any URL the posting was seen under
+
+    Returns:
+        Canonical job ID string of the form '<platform>:<id>', or '' without a URL
+        (postings without a link must not share one ID)
+    """
+    if not url:
+        return ''
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=False)
+
+    for param, pattern in _NATIVE_ID_PATTERNS.get(platform, []):
+        if param:
+            for key, value in params:
+                if key == param and value:
+                    return f"{platform}:{value}"
+        else:
+            match = pattern.search(url)
+            if match:
+                return f"{platform}:{match.group(1).lower()}"
+
+    kept = sorted((k, v) for k, v in params if k.lower() not in _TRACKING_PARAMS)
+    normalized = f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{urlencode(kept)}"
+    digest = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+    return f"{platform}:{digest}"
@@ -0,0 +1,50 @@
+"""
+Job Record for Job Automation
+Compact representation of a job posting extracted from a results page
+"""
+
+import sys
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Optional
+
+from job_ids import canonical_job_id
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    A job posting seen on a results page
+
+    Uses __slots__ to keep per-record memory small, and interns the platform and
+    company strings since the same few values repeat across thousands of records.
+    Records parsed in a worker process are interned again when unpickled, so the
+    copies the bot keeps share strings across pages.
+    """
+    platform: str
+    title: str
+    company: str = ''
+    location: str = ''
+    url: str = ''
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    job_id: str = ''
+
+    def __post_init__(self):
+        self._intern()
+        if not self.job_id:
+            self.job_id = canonical_job_id(self.platform, self.url or f"{self.title}|{self.company}")
+
+    def __setstate__(self, state):
+        # Unpickling skips __post_init__; interned strings do not survive the process boundary.
+        # The default pickled state of a __slots__ object is (None, {slot: value}).
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._intern()
+
+    def _intern(self):
+        self.platform = sys.intern(self.platform)
+        self.company = sys.intern(self.company)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary"""
+        return asdict(self)
@@ -0,0 +1,319 @@
+"""
+Listing Extractors for Job Automation
+Plugin registry of per-platform extractors that turn a results page into Job records
+
+To add a platform, subclass ListingExtractor (or LinkPatternExtractor), set its
+selectors, and decorate it with @register_extractor('<platform key>').
+"""
+
+import re
+from typing import Dict, List, Optional, Type
+from urllib.parse import urljoin
+
+from job_record import Job
+from salary_parser import parse_salary
+
+
+# Registry of extractors, keyed by PLATFORM_CONFIGS platform key
+EXTRACTORS: Dict[str, 'ListingExtractor'] = {}
+
+
+def register_extractor(platform: str):
+    """Class decorator that registers an extractor instance for a platform"""
+    def decorator(cls: Type['ListingExtractor']) -> Type['ListingExtractor']:
+        instance = cls()
+        instance.platform = platform
+        EXTRACTORS[platform] = instance
+        return cls
+    return decorator
+
+
+def get_extractor(platform: str) -> Optional['ListingExtractor']:
+    """Return the registered extractor for a platform, or None"""
+    return EXTRACTORS.get(platform)
+
+
+def _clean(value: str) -> str:
+    return ' '.join(value.split())
+
+
+class ListingExtractor:
+    """
+    Extract job cards with XPath selectors
+
+    Subclasses set 'card' to locate each job card on the page, and 'title',
+    'company', 'location' and 'link' relative to the card. Each field may be
+    a union ('a | b') to cover markup variants.
+    """
+    platform = ''
+    card = ''
+    title = ''
+    company = ''
+    location = ''
+    link = ''
+
+    def _first(self, node, xpath: str) -> str:
+        if not xpath:
+            return ''
+        found = node.xpath(xpath)
+        if not found:
+            return ''
+        first = found[0]
+        return _clean(first if isinstance(first, str) else first.text_content())
+
+    def cards(self, doc) -> list:
+        """Return the card elements on a parsed page"""
+        return doc.xpath(self.card)
+
+    def extract(self, doc, page_url: str) -> List[Job]:
+        """
+        Extract Job records from a parsed results page
+
+        Args:
+            doc: lxml.html document root
+            page_url: URL the page was captured from (for resolving relative links)
+
+        Returns:
+            List of Job records, without duplicates
+        """
+        jobs = []
+        seen = set()
+        for card in self.cards(doc):
+            title = self._first(card, self.title)
+            if not title:
+                continue
+            link = self._first(card, self.link)
+            salary = parse_salary(_clean(card.text_content()))
+            job = Job(
+                platform=self.platform,
+                title=title,
+                company=self._first(card, self.company),
+                location=self._first(card, self.location),
+                url=urljoin(page_url, link) if link else '',
+                salary_min=salary.min_annual if salary else None,
+                salary_max=salary.max_annual if salary else None,
+            )
+            if job.job_id not in seen:
+                seen.add(job.job_id)
+                jobs.append(job)
+        return jobs
+
+
+class LinkPatternExtractor(ListingExtractor):
+    """
+    Extract jobs from pages without stable card markup
+
+    Every anchor whose href matches 'link_pattern' is a job; the card is the
+    anchor's nearest list item, article or div ancestor. Title defaults to the
+    first heading inside the anchor, falling back to the anchor text.
+    """
+    link_pattern = re.compile(r'/jobs?/')
+    title = './/h2 | .//h3 | .//h4'
+    link = '@href'
+
+    def cards(self, doc) -> list:
+        cards = []
+        for anchor in doc.xpath('//a[@href]'):
+            if self.link_pattern.search(anchor.get('href', '')):
+                cards.append(anchor)
+        return cards
+
+    def extract(self, doc, page_url: str) -> List[Job]:
+        jobs = []
+        seen = set()
+        for anchor in self.cards(doc):
+            container = next(anchor.iterancestors('li', 'article', 'div'), anchor)
+            title = self._first(anchor, self.title) or _clean(anchor.text_content())
+            if not title:
+                continue
+            salary = parse_salary(_clean(container.text_content()))
+            job = Job(
+                platform=self.platform,
+                title=title,
+                company=self._first(container, self.company),
+                location=self._first(container, self.location),
+                url=urljoin(page_url, anchor.get('href')),
+                salary_min=salary.min_annual if salary else None,
+                salary_max=salary.max_annual if salary else None,
+            )
+            if job.job_id not in seen:
+                seen.add(job.job_id)
+                jobs.append(job)
+        return jobs
+
+
+# --- Card-based extractors ---
+
+@register_extractor('linkedin')
+class LinkedInExtractor(ListingExtractor):
+    card = "//div[contains(@class, 'job-search-card')] | //div[contains(@class, 'job-card-container')]"
+    title = ".//h3[contains(@class, 'base-search-card__title')] | .//a[contains(@class, 'job-card-list__title')]"
+    company = ".//h4[contains(@class, 'base-search-card__subtitle')] | .//*[contains(@class, 'job-card-container__primary-description')]"
+    location = ".//span[contains(@class, 'job-search-card__location')] | .//li[contains(@class, 'job-card-container__metadata-item')]"
+    link = ".//a[contains(@class, 'base-card__full-link')]/@href | .//a[contains(@class, 'job-card-list__title')]/@href"
+
+
+@register_extractor('indeed')
+class IndeedExtractor(ListingExtractor):
+    card = "//div[contains(@class, 'job_seen_beacon')]"
+    title = ".//h2[contains(@class, 'jobTitle')]//span[@title] | .//h2[contains(@class, 'jobTitle')]//span"
+    company = ".//span[@data-testid='company-name'] | .//span[contains(@class, 'companyName')]"
+    location = ".//div[@data-testid='text-location'] | .//div[contains(@class, 'companyLocation')]"
+    link = ".//h2[contains(@class, 'jobTitle')]//a/@href"
+
+
+@register_extractor('dice')
+class DiceExtractor(ListingExtractor):
+    card = "//dhi-search-card | //div[@data-cy='search-card'] | //div[@data-testid='job-search-serp-card']"
+    title = ".//a[@data-cy='card-title-link'] | .//a[@data-testid='job-search-job-detail-link']"
+    company = ".//a[@data-cy='search-result-company-name'] | .//a[contains(@href, '/company-profile/')]"
+    location = ".//span[@data-cy='search-result-location'] | .//p[contains(@class, 'location')]"
+    link = ".//a[@data-cy='card-title-link']/@href | .//a[@data-testid='job-search-job-detail-link']/@href"
+
+
+@register_extractor('ziprecruiter')
+class ZipRecruiterExtractor(ListingExtractor):
+    card = "//article[contains(@class, 'job_result')] | //div[contains(@class, 'job_result_two_pane')]"
+    title = ".//h2 | .//a[contains(@class, 'job_link')]"
+    company = ".//a[@data-testid='job-card-company'] | .//*[contains(@class, 'company_name')]"
+    location = ".//a[@data-testid='job-card-location'] | .//*[contains(@class, 'company_location')]"
+    link = ".//h2//a/@href | .//a[contains(@class, 'job_link')]/@href"
+
+
+@register_extractor('glassdoor')
+class GlassdoorExtractor(ListingExtractor):
+    card = "//li[@data-test='jobListing']"
+    title = ".//a[@data-test='job-title'] | .//a[contains(@class, 'JobCard_jobTitle')]"
+    company = ".//*[contains(@class, 'EmployerProfile_compactEmployerName')] | .//div[contains(@class, 'EmployerProfile')]//span"
+    location = ".//div[@data-test='emp-location']"
+    link = ".//a[@data-test='job-title']/@href | .//a[contains(@class, 'JobCard_jobTitle')]/@href"
+
+
+@register_extractor('builtin')
+class BuiltInExtractor(ListingExtractor):
+    card = "//div[@data-id='job-card']"
+    title = ".//a[@data-id='job-card-title']"
+    company = ".//a[@data-id='company-title']"
+    location = ".//i[contains(@class, 'fa-location-dot')]/following::span[1]"
+    link = ".//a[@data-id='job-card-title']/@href"
+
+
+@register_extractor('monster')
+class MonsterExtractor(ListingExtractor):
+    card = "//article[@data-testid='svx_jobCard'] | //div[contains(@class, 'job-cardstyle')]"
+    title = ".//a[@data-testid='jobTitle'] | .//h3"
+    company = ".//span[@data-testid='company'] | .//*[contains(@class, 'company')]"
+    location = ".//span[@data-testid='jobDetailLocation'] | .//*[contains(@class, 'location')]"
+    link = ".//a[@data-testid='jobTitle']/@href | .//a/@href"
+
+
+@register_extractor('careerbuilder')
+class CareerBuilderExtractor(ListingExtractor):
+    card = "//li[contains(@class, 'data-results-content-parent')]"
+    title = ".//div[contains(@class, 'data-results-title')]"
+    company = ".//div[contains(@class, 'data-details')]/span[1]"
+    location = ".//div[contains(@class, 'data-details')]/span[2]"
+    link = ".//a[contains(@class, 'data-results-content')]/@href"
+
+
+@register_extractor('weworkremotely')
+class WeWorkRemotelyExtractor(ListingExtractor):
+    card = "//section[contains(@class, 'jobs')]//li[.//a[contains(@href, '/remote-jobs/')]]"
+    title = ".//span[contains(@class, 'title')] | .//h4[contains(@class, 'new-listing__header__title')]"
+    company = ".//span[contains(@class, 'company')][1] | .//p[contains(@class, 'new-listing__company-name')]"
+    location = ".//span[contains(@class, 'region')] | .//p[contains(@class, 'new-listing__company-headquarters')]"
+    link = ".//a[contains(@href, '/remote-jobs/') and not(contains(@href, '/company/'))]/@href"
+
+
+@register_extractor('flexjobs')
+class FlexJobsExtractor(ListingExtractor):
+    card = "//div[@data-testid='job-card'] | //li[contains(@class, 'job')]"
+    title = ".//a[contains(@href, '/publicjobs/')] | .//h5 | .//a[contains(@class, 'job-title')]"
+    company = ".//*[contains(@class, 'company')]"
+    location = ".//*[contains(@class, 'location')]"
+    link = ".//a[contains(@href, '/publicjobs/')]/@href | .//a[contains(@class, 'job-title')]/@href"
+
+
+@register_extractor('theladders')
+class TheLaddersExtractor(ListingExtractor):
+    card = "//div[contains(@class, 'job-card-container')] | //div[contains(@class, 'job-list-pagination-job-card')]"
+    title = ".//a[contains(@class, 'job-card-title')] | .//a[contains(@class, 'clipped-text')]"
+    company = ".//*[contains(@class, 'job-card-company-name')] | .//*[contains(@class, 'company')]"
+    location = ".//*[contains(@class, 'location')]"
+    link = ".//a[contains(@class, 'job-card-title')]/@href | .//a[contains(@class, 'clipped-text')]/@href"
+
+
+# --- Link-pattern extractors (sites without stable card markup) ---
+
+@register_extractor('jobright_ai')
+class JobRightExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/jobs/info/')
+    company = ".//*[contains(@class, 'company-name')]"
+    location = ".//*[contains(@class, 'location')]"
+
+
+@register_extractor('remotive')
+class RemotiveExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/remote-jobs/[^/]+/[^/?]+-\d+')
+    company = ".//*[contains(@class, 'company')]"
+    location = ".//*[contains(@class, 'location')]"
+
+
+@register_extractor('letsworkremotely')
+class LetsWorkRemotelyExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/remote-jobs/(?!search)[^/?]+')
+    company = ".//*[contains(@class, 'company')]"
+
+
+@register_extractor('toptal')
+class ToptalExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/jobs/[^/?]+-\d+')
+
+
+@register_extractor('hired')
+class HiredExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/job/[^/?]+')
+    company = ".//*[contains(@class, 'company')]"
+
+
+@register_extractor('wellfound')
+class WellfoundExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/jobs/\d+-')
+    company = ".//a[contains(@href, '/company/')]//h2 | .//a[contains(@href, '/company/')]"
+    location = ".//span[contains(@class, 'location')]"
+
+
+@register_extractor('angellist')
+class AngelListExtractor(WellfoundExtractor):
+    pass
+
+
+@register_extractor('flexa')
+class FlexaExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/jobs/[^/?]+')
+    company = ".//*[contains(@class, 'company')]"
+
+
+@register_extractor('zapier')
+class ZapierExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'jobs\.lever\.co/zapier/|/jobs/[0-9a-f-]{36}|/jobs/[^/?]+-\d+')
+    location = ".//*[contains(@class, 'location')]"
+
+
+@register_extractor('nodesk')
+class NoDeskExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/remote-jobs/(?!search)[^/?]+/?$')
+    company = ".//h3 | .//*[contains(@class, 'company')]"
+
+
+@register_extractor('dynamitejobs')
+class DynamiteJobsExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/company/[^/]+/remote-job/')
+    company = ".//*[contains(@class, 'company')]"
+
+
+@register_extractor('remote_co')
+class RemoteCoExtractor(LinkPatternExtractor):
+    link_pattern = re.compile(r'/job/[^/?]+')
+    company = ".//*[contains(@class, 'company')]"
+    location = ".//*[contains(@class, 'location')]"
@@ -0,0 +1,308 @@
+"""
+Location Normalizer for Job Automation
+Classifies job card locations as remote/hybrid/onsite and matches them against
+job_preferences.locations using a bundled offline gazetteer
+"""
+
+import os
+import re
+import mmap
+import struct
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent / 'data'
+GAZETTEER_TSV = DATA_DIR / 'gazetteer.tsv'
+GAZETTEER_INDEX = DATA_DIR / 'gazetteer.idx'
+
+# --- Compact index format ---
+# Header: magic + record count. Records: fixed-width, sorted by name so lookups
+# are a binary search directly over the memory-mapped file.
+_MAGIC = b'GAZ1'
+_HEADER = struct.Struct('<4sI')
+_NAME_BYTES = 56
+_RECORD = struct.Struct(f'<{_NAME_BYTES}s1s2s2s3x')
+_KIND_CODES = {'country': b'C', 'state': b'S', 'state_code': b'A', 'city': b'T'}
+_KIND_NAMES = {v: k for k, v in _KIND_CODES.items()}
+
+REMOTE = 'remote'
+HYBRID = 'hybrid'
+ONSITE = 'onsite'
+UNKNOWN = 'unknown'
+
+# Precompiled work-mode patterns
+_MODE_PATTERNS = [
+    (HYBRID, re.compile(r'\bhybrid\b', re.IGNORECASE)),
+    (REMOTE, re.compile(r'\b(?:remote|work from home|wfh|anywhere|distributed)\b', re.IGNORECASE)),
+    (ONSITE, re.compile(r'\b(?:on[- ]?site|in[- ]office|in[- ]person)\b', re.IGNORECASE)),
+]
+_MODE_WORDS = re.compile(
+    r'\b(?:fully|100%|hybrid|remote|work from home|wfh|anywhere|distributed|'
+    r'on[- ]?site|in[- ]office|in[- ]person|only|first|friendly|eligible|within|in|from)\b',
+    re.IGNORECASE
+)
+_SPLIT = re.compile(r'\s*(?:,|;|/|\||·|•|\s-\s|\(|\))\s*')
+_STATE_CODE = re.compile(r'^[A-Z]{2}$')
+_MATCH_CACHE_SIZE = 4096  # Per LocationPreferences; cleared when full
+
+
+class Place(NamedTuple):
+    """A gazetteer entry"""
+    name: str
+    kind: str
+    state: str
+    country: str
+
+
+class Location(NamedTuple):
+    """A normalized location"""
+    mode: str
+    city: str
+    state: str
+    country: str
+    raw: str
+
+
+def _key(name: str) -> bytes:
+    """Normalize a place name to its fixed-width index key"""
+    normalized = ' '.join(name.lower().replace('.', '').split())
+    return normalized.encode('utf-8')[:_NAME_BYTES]
+
+
+def build_index(tsv_path: Path = GAZETTEER_TSV, index_path: Path = GAZETTEER_INDEX) -> int:
+    """
+    Compile the gazetteer TSV into the sorted fixed-width binary index
+
+    Args:
+        tsv_path: Source TSV (name, kind, state, country)
+        index_path: Output index file
+
+    Returns:
+        Number of records written
+    """
+    records = []
+    with open(tsv_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip() or line.startswith('#'):
+                continue
+            name, kind, state, country = line.rstrip('\n').split('\t')
+            records.append((_key(name), _KIND_CODES[kind],
+                            state.encode('ascii').ljust(2), country.encode('ascii').ljust(2)))
+    records.sort()
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, len(records)))
+        for record in records:
+            f.write(_RECORD.pack(*record))
+    os.replace(tmp_path, index_path)
+    logger.info(f"Built gazetteer index with {len(records)} places: {index_path}")
+    return len(records)
+
+
+class Gazetteer:
+    """Memory-mapped, binary-searched view of the compiled gazetteer index"""
+
+    def __init__(self, tsv_path: Path = GAZETTEER_TSV, index_path: Path = GAZETTEER_INDEX):
+        """
+        Open the gazetteer, rebuilding the index if it is missing or older than the TSV
+
+        Args:
+            tsv_path: Bundled gazetteer TSV
+            index_path: Compiled index location
+        """
+        if not index_path.exists() or index_path.stat().st_mtime < tsv_path.stat().st_mtime:
+            build_index(tsv_path, index_path)
+
+        self._file = open(index_path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a gazetteer index: {index_path}")
+
+    def _name_at(self, i: int) -> bytes:
+        offset = _HEADER.size + i * _RECORD.size
+        return self._map[offset:offset + _NAME_BYTES].rstrip(b'\0')
+
+    def lookup(self, name: str) -> List[Place]:
+        """
+        Find all places with a given name
+
+        Args:
+            name: Place name or code (case and periods ignored)
+
+        Returns:
+            Matching places (several for ambiguous names like 'Portland')
+        """
+        key = _key(name)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        places = []
+        while lo < self.count and self._name_at(lo) == key:
+            _, kind, state, country = _RECORD.unpack_from(self._map, _HEADER.size + lo * _RECORD.size)
+            places.append(Place(name, _KIND_NAMES[kind], state.decode('ascii').strip(),
+                                country.decode('ascii').strip()))
+            lo += 1
+        return places
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+_gazetteer: Optional[Gazetteer] = None
+
+
+def get_gazetteer() -> Gazetteer:
+    """Return the shared gazetteer, opening it on first use"""
+    global _gazetteer
+    if _gazetteer is None:
+        _gazetteer = Gazetteer()
+    return _gazetteer
+
+
+def _detect_mode(text: str) -> Optional[str]:
+    for mode, pattern in _MODE_PATTERNS:
+        if pattern.search(text):
+            return mode
+    return None
+
+
+@lru_cache(maxsize=8192)
+def normalize_location(text: str) -> Location:
+    """
+    Normalize free-form location text
+
+    Examples: 'Atlanta, GA (Hybrid)' -> hybrid, Atlanta, GA, US;
+    'Remote - United States' -> remote, US; 'Portland, OR' -> onsite, Portland, OR, US.
+
+    Args:
+        text: Card or preference location text
+
+    Returns:
+        Location with work mode, city, state and country ('' when unknown)
+    """
+    raw = (text or '').strip()
+    mode = _detect_mode(raw)
+    gazetteer = get_gazetteer()
+
+    city = state = country = ''
+    city_candidates: List[Place] = []
+    parts = [p for p in _SPLIT.split(_MODE_WORDS.sub(' ', raw)) if p and p.strip()]
+
+    for part in (p.strip() for p in parts):
+        places = gazetteer.lookup(part)
+        if not places:
+            continue
+        codes = [p for p in places if p.kind == 'state_code']
+        if codes and _STATE_CODE.match(part) and (city_candidates or city):
+            # Two-letter codes only count as states after a city ("Atlanta, GA")
+            state, country = codes[0].state, codes[0].country
+            continue
+
+        named = [p for p in places if p.kind != 'state_code']
+        if not named:
+            continue
+        by_kind = {p.kind: p for p in named}
+        if 'city' in by_kind and not city:
+            city_candidates = [p for p in named if p.kind == 'city']
+            city = part
+        elif 'state' in by_kind and not state:
+            state, country = by_kind['state'].state, by_kind['state'].country
+        elif 'country' in by_kind and not country:
+            country = by_kind['country'].country
+
+    if city_candidates:
+        match = next((p for p in city_candidates if not state or p.state == state), None)
+        if match:
+            state = state or match.state
+            country = country or match.country
+
+    if mode is None:
+        mode = ONSITE if (city or state or country) else UNKNOWN
+    return Location(mode, city.title() if city else '', state, country, raw)
+
+
+class LocationPreferences:
+    """
+    Compiled job_preferences.locations
+
+    Entries are either work modes ('Remote', 'Hybrid', 'Onsite') or places
+    ('Atlanta, GA', 'Georgia', 'United States'). Remote jobs need 'Remote' (or no
+    mode entries at all); hybrid and onsite jobs must be in a listed place, or in a
+    listed mode when no places are given.
+    """
+
+    def __init__(self, locations: Iterable[str]):
+        """
+        Compile location preferences
+
+        Args:
+            locations: job_preferences.locations from config
+        """
+        self.modes = set()
+        self.places: List[Location] = []
+        for entry in locations or []:
+            mode = _detect_mode(entry)
+            if mode:
+                self.modes.add(mode)
+            normalized = normalize_location(entry)
+            if normalized.city or normalized.state or normalized.country:
+                self.places.append(normalized)
+        self.countries = {p.country for p in self.places if p.country}
+        # Kept on the instance so preferences rebuilt on config reload take their cache with them
+        self._results: Dict[str, Tuple[bool, Location]] = {}
+
+    def _place_matches(self, location: Location) -> bool:
+        for place in self.places:
+            if place.city:
+                if location.city == place.city and (not place.state or location.state == place.state):
+                    return True
+            elif place.state:
+                if location.state == place.state:
+                    return True
+            elif place.country and location.country == place.country:
+                return True
+        return False
+
+    def matches(self, text: str) -> Tuple[bool, Location]:
+        """
+        Check a card location against the preferences
+
+        Unparseable or empty locations always match so nothing is filtered on bad data.
+
+        Args:
+            text: Location text from a job card
+
+        Returns:
+            Tuple of (matches, normalized location)
+        """
+        result = self._results.get(text)
+        if result is None:
+            if len(self._results) >= _MATCH_CACHE_SIZE:
+                self._results.clear()
+            result = self._results[text] = self._matches(text)
+        return result
+
+    def _matches(self, text: str) -> Tuple[bool, Location]:
+        location = normalize_location(text)
+        if location.mode == UNKNOWN:
+            return True, location
+        if location.mode == REMOTE:
+            if self.modes and REMOTE not in self.modes:
+                return False, location
+            # Remote jobs only need to be open to one of our countries, when stated
+            return (not location.country or not self.countries or location.country in self.countries), location
+        if self.places:
+            return self._place_matches(location), location
+        return (not self.modes or location.mode in self.modes), location
@@ -0,0 +1,141 @@
+"""
+Negative Posting Cache for Job Automation
+Remembers postings that cannot or should not be applied to (no Easy Apply, closed,
+ineligible, already applied), keyed by canonical job ID with per-reason TTLs
+"""
+
+import time
+import sqlite3
+import logging
+from typing import Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# --- Skip reasons ---
+NO_EASY_APPLY = 'no_easy_apply'    # External apply only; the apply method of a posting never changes
+CLOSED = 'closed'                  # No longer accepting applications
+INELIGIBLE = 'ineligible'          # Required questions we cannot answer yet
+APPLIED = 'applied'                # Already submitted from an earlier run
+
+DEFAULT_TTL_DAYS = {
+    NO_EASY_APPLY: 30,
+    CLOSED: 90,
+    INELIGIBLE: 7,   # Short, so newly added application_answers get another chance
+    APPLIED: 180,
+}
+
+
+class NegativeEntry(NamedTuple):
+    """A cached reason to skip a posting"""
+    platform: str
+    reason: str
+    expires_at: float
+
+
+class NegativeCache:
+    """
+    Persistent negative cache of job postings
+
+    Unexpired rows are loaded into memory once so card filtering is a dictionary lookup;
+    new entries are written through to the applications database.
+    """
+
+    def __init__(self, db_path: str = 'logs/job_applications.db',
+                 ttl_days: Optional[Dict[str, float]] = None):
+        """
+        Initialize the cache
+
+        Args:
+            db_path: SQLite database holding the negative_cache table
+            ttl_days: Per-reason TTL overrides in days (see DEFAULT_TTL_DAYS)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = {reason: days * 86400 for reason, days in {**DEFAULT_TTL_DAYS, **(ttl_days or {})}.items()}
+        self.stats = {'lookups': 0, 'hits': 0, 'added': 0, 'purged': 0}
+        self.hits_by_reason: Dict[str, int] = {}
+        self._entries: Dict[str, NegativeEntry] = {}
+        self._load()
+
+    def _load(self):
+        """Create the table, drop expired rows and load the rest into memory"""
+        now = time.time()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS negative_cache (
+                job_id TEXT PRIMARY KEY,
+                platform TEXT,
+                reason TEXT,
+                url TEXT,
+                created_at REAL,
+                expires_at REAL
+            )
+        ''')
+        cursor.execute('DELETE FROM negative_cache WHERE expires_at <= ?', (now,))
+        self.stats['purged'] = cursor.rowcount
+        for job_id, platform, reason, expires_at in cursor.execute(
+                'SELECT job_id, platform, reason, expires_at FROM negative_cache'):
+            self._entries[job_id] = NegativeEntry(platform, reason, expires_at)
+        conn.commit()
+        conn.close()
+        logger.info(f"Negative cache loaded: {len(self._entries)} postings "
+                    f"({self.stats['purged']} expired entries purged)")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, job_id: str) -> Optional[str]:
+        """
+        Look up why a posting should be skipped
+
+        Args:
+            job_id: Canonical job ID
+
+        Returns:
+            The cached skip reason, or None if the posting should be tried
+        """
+        self.stats['lookups'] += 1
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[job_id]
+            return None
+        self.stats['hits'] += 1
+        self.hits_by_reason[entry.reason] = self.hits_by_reason.get(entry.reason, 0) + 1
+        return entry.reason
+
+    def add(self, job_id: str, platform: str, reason: str, url: str = ''):
+        """
+        Record a posting to skip on future runs
+
+        Args:
+            job_id: Canonical job ID
+            platform: Platform key
+            reason: One of NO_EASY_APPLY, CLOSED, INELIGIBLE, APPLIED
+            url: Posting URL, kept for inspection
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds.get(reason, self.ttl_seconds[NO_EASY_APPLY])
+        self._entries[job_id] = NegativeEntry(platform, reason, expires_at)
+        self.stats['added'] += 1
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('''
+                INSERT OR REPLACE INTO negative_cache (job_id, platform, reason, url, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (job_id, platform, reason, url, now, expires_at))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error saving to negative cache: {e}")
+
+    def summary(self) -> Dict[str, float]:
+        """Cache statistics including hit rate and hits per reason"""
+        lookups = self.stats['lookups']
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'hit_rate': (self.stats['hits'] / lookups) if lookups else 0.0,
+            'hits_by_reason': dict(self.hits_by_reason),
+        }
@@ -0,0 +1,308 @@
+"""
+Job Detail Page Cache for Job Automation
+Compressed, content-addressed on-disk cache of job detail HTML and extracted text,
+keyed by canonical job ID with TTL expiry and size-bounded LRU eviction
+"""
+
+import os
+import time
+import gzip
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import Counter
+from typing import Dict, NamedTuple, Optional
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage(NamedTuple):
+    """A cached job detail page"""
+    job_id: str
+    url: str
+    html: str
+    text: str
+    fetched_at: float
+
+
+class _IndexEntry(NamedTuple):
+    url: str
+    html_hash: str
+    text_hash: str
+    size: int
+    fetched_at: float
+
+
+class DetailPageCache:
+    """
+    On-disk cache of job detail pages
+
+    Blobs are stored once per content hash (identical pages share storage) and compressed
+    with zstd when available, otherwise gzip. An in-memory index mirrors the SQLite index
+    table for O(1) lookups by canonical job ID. The size budget counts each blob once,
+    however many entries share it.
+    """
+
+    def __init__(self, cache_dir: str = 'logs/page_cache', ttl_seconds: int = 7 * 24 * 3600,
+                 max_bytes: int = 200 * 1024 * 1024):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory for blobs and the index database
+            ttl_seconds: Entries older than this are treated as missing
+            max_bytes: Compressed size budget; least recently used entries are evicted beyond it
+        """
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.codec = 'zst' if ZSTD_AVAILABLE else 'gz'
+        self.stats = {'hits': 0, 'misses': 0, 'expired': 0, 'stores': 0, 'evictions': 0}
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'), check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                job_id TEXT PRIMARY KEY,
+                url TEXT,
+                html_hash TEXT,
+                text_hash TEXT,
+                size INTEGER,
+                fetched_at REAL,
+                last_access REAL
+            )
+        ''')
+        self._conn.commit()
+
+        # In-memory mirror of the index, ordered by last access (oldest first)
+        self._index: Dict[str, _IndexEntry] = {}
+        self._refs: Counter = Counter()
+        self._blob_sizes: Dict[str, int] = {}  # Compressed size of each referenced blob
+        rows = self._conn.execute(
+            'SELECT job_id, url, html_hash, text_hash, size, fetched_at FROM pages ORDER BY last_access'
+        ).fetchall()
+        for job_id, url, html_hash, text_hash, size, fetched_at in rows:
+            self._index[job_id] = _IndexEntry(url, html_hash, text_hash, size, fetched_at)
+            self._refs.update((html_hash, text_hash))
+        for digest in self._refs:
+            try:
+                self._blob_sizes[digest] = os.path.getsize(self._blob_path(digest))
+            except OSError:
+                self._blob_sizes[digest] = 0
+        self._total_bytes = sum(self._blob_sizes.values())
+
+    # --- Blob storage ---
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.{self.codec}")
+
+    def _compress(self, data: bytes) -> bytes:
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdCompressor(level=10).compress(data)
+        return gzip.compress(data, compresslevel=6)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if ZSTD_AVAILABLE:
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def _write_blob(self, content: str) -> tuple:
+        """Store content under its hash; returns (digest, compressed size on disk)"""
+        raw = content.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self._compress(raw))
+            os.replace(tmp_path, path)
+        return digest, os.path.getsize(path)
+
+    def _read_blob(self, digest: str) -> Optional[str]:
+        try:
+            with open(self._blob_path(digest), 'rb') as f:
+                return self._decompress(f.read()).decode('utf-8')
+        except (OSError, ValueError) as e:
+            logger.warning(f"Cache blob {digest[:12]} unreadable: {e}")
+            return None
+
+    def _retain_blob(self, digest: str, size: int):
+        """Add a blob reference; the blob's size counts toward the budget on its first one"""
+        if self._refs[digest] == 0:
+            self._blob_sizes[digest] = size
+            self._total_bytes += size
+        self._refs[digest] += 1
+
+    def _release_blobs(self, entry: _IndexEntry):
+        """Drop an entry's blob references and delete blobs nothing else uses"""
+        for digest in (entry.html_hash, entry.text_hash):
+            self._refs[digest] -= 1
+            if self._refs[digest] <= 0:
+                del self._refs[digest]
+                self._total_bytes -= self._blob_sizes.pop(digest, 0)
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+
+    # --- Index operations ---
+
+    def _lookup(self, job_id: str) -> Optional[_IndexEntry]:
+        """O(1) index lookup that applies TTL and refreshes LRU order"""
+        entry = self._index.get(job_id)
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+
+        now = time.time()
+        if now - entry.fetched_at > self.ttl_seconds:
+            self.stats['expired'] += 1
+            self.stats['misses'] += 1
+            self._remove(job_id)
+            return None
+
+        # Move to most-recently-used position
+        self._index[job_id] = self._index.pop(job_id)
+        self._conn.execute('UPDATE pages SET last_access = ? WHERE job_id = ?', (now, job_id))
+        self._conn.commit()
+        self.stats['hits'] += 1
+        return entry
+
+    def _remove(self, job_id: str):
+        entry = self._index.pop(job_id, None)
+        if entry is None:
+            return
+        self._conn.execute('DELETE FROM pages WHERE job_id = ?', (job_id,))
+        self._conn.commit()
+        self._release_blobs(entry)
+
+    def _evict(self):
+        """Evict least recently used entries until within max_bytes"""
+        while self._total_bytes > self.max_bytes and self._index:
+            oldest = next(iter(self._index))
+            self._remove(oldest)
+            self.stats['evictions'] += 1
+
+    # --- Public API ---
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def contains(self, job_id: str) -> bool:
+        """Check for a fresh entry without counting a hit or miss"""
+        entry = self._index.get(job_id)
+        return entry is not None and time.time() - entry.fetched_at <= self.ttl_seconds
+
+    def get(self, job_id: str) -> Optional[CachedPage]:
+        """
+        Get a cached detail page
+
+        Args:
+            job_id: Canonical job ID
+
+        Returns:
+            CachedPage, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._lookup(job_id)
+            if entry is None:
+                return None
+            html = self._read_blob(entry.html_hash)
+            text = self._read_blob(entry.text_hash)
+            if html is None or text is None:
+                self._remove(job_id)
+                return None
+            return CachedPage(job_id, entry.url, html, text, entry.fetched_at)
+
+    def get_text(self, job_id: str) -> Optional[str]:
+        """
+        Get only the extracted text of a cached page (skips decompressing the HTML)
+
+        Args:
+            job_id: Canonical job ID
+
+        Returns:
+            Extracted text, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._lookup(job_id)
+            if entry is None:
+                return None
+            return self._read_blob(entry.text_hash)
+
+    def put(self, job_id: str, url: str, html: str, text: str = ''):
+        """
+        Store a detail page
+
+        Args:
+            job_id: Canonical job ID
+            url: URL the page was fetched from
+            html: Page or pane HTML
+            text: Extracted description text
+        """
+        if not job_id:
+            return  # A posting without an ID (no link) would overwrite every other one
+        with self._lock:
+            try:
+                html_hash, html_size = self._write_blob(html or '')
+                text_hash, text_size = self._write_blob(text or '')
+            except OSError as e:
+                logger.error(f"Failed to write page cache entry for {job_id}: {e}")
+                return
+
+            now = time.time()
+            size = html_size + (text_size if text_hash != html_hash else 0)
+            self._retain_blob(html_hash, html_size)
+            self._retain_blob(text_hash, text_size)
+            previous = self._index.pop(job_id, None)
+            if previous is not None:
+                self._release_blobs(previous)
+
+            self._index[job_id] = _IndexEntry(url, html_hash, text_hash, size, now)
+            self._conn.execute('''
+                INSERT OR REPLACE INTO pages (job_id, url, html_hash, text_hash, size, fetched_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (job_id, url, html_hash, text_hash, size, now, now))
+            self._conn.commit()
+            self.stats['stores'] += 1
+            self._evict()
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired entries
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cutoff = time.time() - self.ttl_seconds
+            expired = [job_id for job_id, entry in self._index.items() if entry.fetched_at < cutoff]
+            for job_id in expired:
+                self._remove(job_id)
+            return len(expired)
+
+    def summary(self) -> Dict[str, float]:
+        """Cache statistics including hit rate and on-disk size"""
+        lookups = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self._index),
+            'bytes': self._total_bytes,
+            'hit_rate': (self.stats['hits'] / lookups) if lookups else 0.0,
+            'codec': self.codec,
+        }
+
+    def close(self):
+        """Close the index database"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,164 @@
+"""
+Offline HTML Parsing Pipeline for Job Automation
+Parses captured page_source in a worker process pool so the browser thread never waits on extraction
+"""
+
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+from listing_extractors import get_extractor
+
+logger = logging.getLogger(__name__)
+
+
+def parse_listing_page(platform: str, page_url: str, html: str) -> Dict[str, Any]:
+    """
+    Parse a captured results page into Job records using the platform's registered extractor
+
+    Runs inside a worker process; must stay a module-level function so it can be pickled.
+
+    Args:
+        platform: Platform key from PLATFORM_CONFIGS
+        page_url: URL the page was captured from
+        html: Captured page_source
+
+    Returns:
+        Dictionary with 'records' (list of Job) and worker-side 'parse_seconds'
+    """
+    started = time.perf_counter()
+    records = []
+
+    extractor = get_extractor(platform)
+    if html and extractor:
+        records = extractor.extract(lxml.html.fromstring(html), page_url)
+
+    return {
+        'platform': platform,
+        'url': page_url,
+        'records': records,
+        'parse_seconds': time.perf_counter() - started,
+    }
+
+
+class ParserPool:
+    """
+    Process pool that parses captured results pages off the browser thread
+
+    The bot calls submit_listing right after a page loads and moves on to the next
+    navigation. Each result goes to on_result when one is given, otherwise it is kept
+    in results for drain().
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 on_result: Optional[Callable[[Dict[str, Any]], None]] = None):
+        """
+        Initialize the parser pool
+
+        Args:
+            max_workers: Worker processes (defaults to CPU count minus one, minimum 1)
+            on_result: Callback invoked with each parse result (results are then not kept)
+        """
+        if not LXML_AVAILABLE:
+            raise RuntimeError("lxml is not installed. Run: pip install -r requirements.txt")
+
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.on_result = on_result
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+        self.results: List[Dict[str, Any]] = []
+        self.stats = {
+            'pages_submitted': 0,
+            'pages_parsed': 0,
+            'parse_errors': 0,
+            'records_extracted': 0,
+            'bytes_parsed': 0,
+            'parse_seconds': 0.0,
+        }
+
+    def submit_listing(self, platform: str, page_url: str, html: str) -> Future:
+        """Queue a results page for parsing and return immediately"""
+        return self._submit(parse_listing_page, platform, page_url, html)
+
+    def _submit(self, func, platform: str, page_url: str, html: str) -> Future:
+        future = self._executor.submit(func, platform, page_url, html)
+        with self._lock:
+            self.stats['pages_submitted'] += 1
+            self.stats['bytes_parsed'] += len(html or '')
+            self._pending.append(future)
+        future.add_done_callback(self._collect)
+        return future
+
+    def _collect(self, future: Future):
+        """Record a finished parse (runs on the executor's callback thread)"""
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"Page parse failed: {e}")
+            with self._lock:
+                self.stats['parse_errors'] += 1
+            return
+
+        with self._lock:
+            self.stats['pages_parsed'] += 1
+            self.stats['parse_seconds'] += result['parse_seconds']
+            self.stats['records_extracted'] += len(result['records'])
+            if not self.on_result:
+                self.results.append(result)
+
+        if self.on_result:
+            try:
+                self.on_result(result)
+            except Exception as e:
+                logger.error(f"Parse result handler failed: {e}")
+
+    def drain(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait for all queued pages to finish parsing
+
+        Args:
+            timeout: Maximum seconds to wait per page
+
+        Returns:
+            Parse results collected so far (empty when an on_result callback is set)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass  # Already counted in _collect
+        return list(self.results)
+
+    def throughput(self) -> Dict[str, Any]:
+        """
+        Parser throughput, measured from worker-side parse time only
+
+        Returns:
+            Stats dictionary including pages/sec and MB/sec of parse CPU time
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        seconds = stats['parse_seconds']
+        stats['workers'] = self.max_workers
+        stats['avg_parse_ms'] = (seconds / stats['pages_parsed'] * 1000) if stats['pages_parsed'] else 0.0
+        stats['pages_per_sec'] = (stats['pages_parsed'] / seconds) if seconds else 0.0
+        stats['mb_per_sec'] = (stats['bytes_parsed'] / 1_000_000 / seconds) if seconds else 0.0
+        return stats
+
+    def shutdown(self):
+        """Drain outstanding work and stop the worker processes"""
+        self.drain()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,215 @@
+"""
+Salary Parser for Job Automation
+Extracts salary ranges from job card and description text and normalizes them to annual amounts
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+
+# Multipliers used to annualize a pay rate
+PERIOD_MULTIPLIERS = {
+    'hour': 2080,
+    'day': 260,
+    'week': 52,
+    'month': 12,
+    'year': 1,
+}
+
+# Aliases seen on job boards, mapped to a canonical period
+_PERIOD_ALIASES = {
+    'hourly': 'hour', 'hour': 'hour', 'hr': 'hour',
+    'daily': 'day', 'day': 'day',
+    'weekly': 'week', 'week': 'week', 'wk': 'week',
+    'monthly': 'month', 'month': 'month', 'mo': 'month',
+    'yearly': 'year', 'year': 'year', 'yr': 'year', 'annually': 'year', 'annum': 'year',
+}
+
+_CURRENCY_SYMBOLS = {
+    '$': 'USD', '£': 'GBP', '€': 'EUR',
+    'US$': 'USD', 'CA$': 'CAD', 'C$': 'CAD', 'AU$': 'AUD', 'A$': 'AUD',
+}
+
+# Plausible annual salary bounds; anything outside is treated as a false match
+_MIN_ANNUAL = 10_000
+_MAX_ANNUAL = 2_000_000
+
+# A range topping out at or below this value is an hourly rate when no period is given.
+# A single amount without a period is never taken as hourly ("$25 gift card").
+_HOURLY_CEILING = 500
+
+# --- Precompiled patterns (built once at import, reused for every card) ---
+# Country-prefixed dollars come first, or "CA$90,000" would match from the bare "$" as USD
+_CURRENCY = r'(?:\b(?:US|CA|AU|C|A)\$|[$£€]|\b(?:USD|CAD|GBP|EUR|AUD)\b)'
+_AMOUNT = r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?'
+_PERIOD = (
+    r'(?:\s*(?:/|per\s+|an?\s+)?\s*'
+    r'(?:hourly|hour|hr|daily|day|weekly|week|wk|monthly|month|mo|'
+    r'yearly|year|yr|annually|annum)\b)'
+)
+
+SALARY_PATTERN = re.compile(
+    rf'(?P<cur1>{_CURRENCY})?\s*(?P<low>{_AMOUNT})\s*(?P<lk>[kK]\b)?(?P<plus>\s*\+)?'
+    rf'(?P<p1>{_PERIOD})?'
+    rf'(?:\s*(?:-|–|—|to)\s*(?P<cur2>{_CURRENCY})?\s*(?P<high>{_AMOUNT})\s*(?P<hk>[kK]\b)?)?'
+    rf'(?P<p2>{_PERIOD})?',
+    re.IGNORECASE
+)
+# Wording that leaves one end of a single amount open: "Up to $80K", "from $90,000"
+_UP_TO_BEFORE = re.compile(r'\b(?:up\s+to|max(?:imum)?|no\s+more\s+than)\s*:?\s*$', re.IGNORECASE)
+_FROM_BEFORE = re.compile(r'\b(?:from|starting\s+(?:at|from)|at\s+least|min(?:imum)?)\s*:?\s*$', re.IGNORECASE)
+_PERIOD_WORD = re.compile(r'[a-z]+$', re.IGNORECASE)
+_QUICK_CHECK = re.compile(r'[$£€]|\d\s*[kK]\b|\b(?:USD|CAD|GBP|EUR|AUD)\b')
+
+# Amounts that are money but not pay: "$50 million", "raised $2M", "$500 referral bonus"
+_SCALE_AFTER = re.compile(r'\s*(?:million|billion|trillion|mil|bn|mm|m|b)\b', re.IGNORECASE)
+_NOT_PAY_AFTER = re.compile(
+    r'^[\s\w-]{0,20}?\b(?:bonus|gift|card|stipend|credit|reimburse\w*|referral|equity|'
+    r'funding|raised|investment|valuation|revenue|arr|budget|allowance)\b',
+    re.IGNORECASE
+)
+_NOT_PAY_BEFORE = re.compile(
+    r'\b(?:raised|raise|raising|funding|funded|series\s+[a-e]|seed|valued|valuation|revenue|'
+    r'arr|investment|invested|budget|bonus|stipend|allowance|gift)\b[^.;]{0,25}$',
+    re.IGNORECASE
+)
+
+
+class Salary(NamedTuple):
+    """Parsed salary range normalized to annual amounts (None: open-ended on that side)"""
+    min_annual: Optional[int]
+    max_annual: Optional[int]
+    currency: str
+    period: str
+    raw: str
+
+
+def _to_number(amount: str, thousands: Optional[str]) -> float:
+    """Convert an amount string such as '120,000' or '120' plus a K suffix to a number"""
+    value = float(amount.replace(',', ''))
+    if thousands:
+        value *= 1000
+    return value
+
+
+def _canonical_period(text: Optional[str]) -> Optional[str]:
+    """Map a matched period fragment ('/yr', 'an hour', 'annually') to a canonical period"""
+    if not text:
+        return None
+    word = _PERIOD_WORD.search(text.strip())
+    return _PERIOD_ALIASES.get(word.group(0).lower()) if word else None
+
+
+def _currency_code(text: Optional[str]) -> Optional[str]:
+    """Map a currency symbol or code to an ISO code"""
+    if not text:
+        return None
+    code = text.upper()
+    return _CURRENCY_SYMBOLS.get(code, code)
+
+
+def _is_pay_context(text: str, match: re.Match) -> bool:
+    """Reject amounts scaled to millions or surrounded by funding, bonus or perk wording"""
+    after = text[match.end():match.end() + 40]
+    if _SCALE_AFTER.match(after) or _NOT_PAY_AFTER.match(after):
+        return False
+    return not _NOT_PAY_BEFORE.search(text[max(0, match.start() - 40):match.start()])
+
+
+def _from_match(match: re.Match) -> Optional[Salary]:
+    """Build a Salary from a regex match, or None if it does not look like pay"""
+    cur = _currency_code(match.group('cur1') or match.group('cur2'))
+    period = _canonical_period(match.group('p2') or match.group('p1'))
+    low_k = match.group('lk')
+    high_k = match.group('hk')
+
+    # Require a currency marker, or a K suffix together with a pay period,
+    # so that "5 years" or "401k" are not mistaken for salaries
+    if not cur and not ((low_k or high_k) and period):
+        return None
+
+    high_raw = match.group('high')
+    # "$120-150K" applies the K suffix to both ends of the range
+    low = _to_number(match.group('low'), low_k or (high_k if high_raw else None))
+    high = _to_number(high_raw, high_k or low_k) if high_raw else low
+    if high < low:
+        low, high = high, low
+
+    if period is None:
+        if high > _HOURLY_CEILING:
+            period = 'year'
+        elif high_raw:
+            period = 'hour'
+        else:
+            return None  # A lone small amount without a period is not a pay rate
+
+    multiplier = PERIOD_MULTIPLIERS[period]
+    min_annual = int(round(low * multiplier))
+    max_annual = int(round(high * multiplier))
+
+    if min_annual < _MIN_ANNUAL or max_annual > _MAX_ANNUAL:
+        return None
+
+    # "$100,000+" and "from $90K" have no top, "Up to $80K" has no bottom
+    if not high_raw:
+        before = match.string[max(0, match.start() - 20):match.start()]
+        if match.group('plus') or _FROM_BEFORE.search(before):
+            max_annual = None
+        elif _UP_TO_BEFORE.search(before):
+            min_annual = None
+
+    return Salary(min_annual, max_annual, cur or 'USD', period, match.group(0).strip())
+
+
+@lru_cache(maxsize=4096)
+def parse_salary(text: str) -> Optional[Salary]:
+    """
+    Parse the most salary-like range found in job card or description text
+
+    Handles ranges ("$120,000 - $150,000 a year"), K suffixes ("$120K/yr"),
+    hourly rates ("$55 - $70 an hour"), open-ended amounts ("$100,000+", "Up to
+    $80K") and currency symbols or codes ("CA$", "A$", "CAD"). Amounts in
+    funding, bonus or perk wording ("raised $50 million", "$25 gift card") are
+    skipped, and a match with an explicit period and a range beats one without.
+
+    Args:
+        text: Free-form text from a job card or description
+
+    Returns:
+        Salary normalized to annual amounts, or None if no salary was found
+    """
+    if not text or not _QUICK_CHECK.search(text):
+        return None
+
+    best, best_score = None, -1
+    for match in SALARY_PATTERN.finditer(text):
+        salary = _from_match(match)
+        if not salary or not _is_pay_context(text, match):
+            continue
+        score = bool(match.group('p1') or match.group('p2')) * 2 + bool(match.group('high'))
+        if score > best_score:
+            best, best_score = salary, score
+            if score == 3:
+                break
+    return best
+
+
+def is_below_minimum(salary: Optional[Salary], salary_min: Optional[int], currency: str = 'USD') -> bool:
+    """
+    Check whether a parsed salary falls below the configured floor
+
+    Jobs without a parsed salary are never rejected, and neither are salaries in a
+    different currency than salary_min (amounts are not converted).
+
+    Args:
+        salary: Parsed salary (or None)
+        salary_min: Minimum acceptable annual salary from job_preferences
+        currency: Currency salary_min is expressed in
+
+    Returns:
+        True if the top of the range is below salary_min (never for an open top)
+    """
+    if salary is None or not salary_min or salary.currency != currency or salary.max_annual is None:
+        return False
+    return salary.max_annual < int(salary_min)
@@ -0,0 +1,149 @@
+"""
+Search Plan for Job Automation
+Platform search URL templates and the expansion of enabled platforms, job titles and
+locations into search URLs. Needs no browser, so plans can be built and inspected
+without importing Selenium.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Mapping
+from urllib.parse import quote_plus
+
+logger = logging.getLogger(__name__)
+
+# --- Platform Configuration ---
+# This dictionary drives the search logic for each platform.
+# To add a new platform, add an entry here and enable it in config.json.
+PLATFORM_CONFIGS = {
+    'dice': {
+        'url_template': 'https://www.dice.com/jobs?q={title}&location={location}&radius=30',
+        'name': 'Dice.com'
+    },
+    'ziprecruiter': {
+        'url_template': 'https://www.ziprecruiter.com/jobs/search?search={title}&location={location}',
+        'name': 'ZipRecruiter'
+    },
+    'glassdoor': {
+        'url_template': 'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={title}',
+        'name': 'Glassdoor'
+    },
+    'indeed': {
+        'url_template': 'https://www.indeed.com/jobs?q={title}&l={location}',
+        'name': 'Indeed'
+    },
+    'linkedin': {
+        'url_template': 'https://www.linkedin.com/jobs/search/?keywords={title}&location={location}',
+        'name': 'LinkedIn'
+    },
+    'builtin': {
+        'url_template': 'https://builtin.com/jobs?search={title}',
+        'name': 'BuiltIn'
+    },
+    'jobright_ai': {
+        'url_template': 'https://jobright.ai/jobs?q={title}&location={location}',
+        'name': 'JobRight.AI'
+    },
+    'weworkremotely': {
+        'url_template': 'https://weworkremotely.com/remote-jobs/search?term={title}',
+        'name': 'WeWorkRemotely'
+    },
+    'remotive': {
+        'url_template': 'https://remotive.com/remote-jobs/software-dev', # This one doesn't take search terms in URL
+        'name': 'Remotive.io'
+    },
+    'letsworkremotely': {
+        'url_template': 'https://letsworkremotely.com/remote-jobs/search?term={title}',
+        'name': 'LetsWorkRemotely'
+    },
+    'toptal': {
+        'url_template': 'https://www.toptal.com/jobs',
+        'name': 'Toptal'
+    },
+    'hired': {
+        'url_template': 'https://hired.com/jobs',
+        'name': 'Hired.com'
+    },
+    'wellfound': { # Formerly AngelList
+        'url_template': 'https://wellfound.com/jobs?query={title}',
+        'name': 'Wellfound (AngelList)'
+    },
+    'theladders': {
+        'url_template': 'https://www.theladders.com/jobs/search-jobs?keywords={title}',
+        'name': 'TheLadders.com'
+    },
+    'flexa': {
+        'url_template': 'https://flexa.careers/search?query={title}',
+        'name': 'Flexa.com'
+    },
+    'zapier': {
+        'url_template': 'https://zapier.com/jobs',
+        'name': 'Zapier Jobs'
+    },
+    'nodesk': {
+        'url_template': 'https://nodesk.co/remote-jobs/search/?query={title}',
+        'name': 'NoDesk.co'
+    },
+    'dynamitejobs': {
+        'url_template': 'https://dynamitejobs.com/remote-jobs?q={title}',
+        'name': 'DynamiteJobs.com'
+    },
+    'monster': {
+        'url_template': 'https://www.monster.com/jobs/search?q={title}&where={location}',
+        'name': 'Monster.com'
+    },
+    'careerbuilder': {
+        'url_template': 'https://www.careerbuilder.com/jobs?keywords={title}&location={location}',
+        'name': 'CareerBuilder'
+    },
+    'remote_co': {
+        'url_template': 'https://remote.co/remote-jobs/search/?search_keywords={title}',
+        'name': 'Remote.co'
+    },
+    'flexjobs': {
+        'url_template': 'https://www.flexjobs.com/search?search={title}&location={location}',
+        'name': 'FlexJobs'
+    },
+    'angellist': {
+        'url_template': 'https://angel.co/jobs?query={title}',
+        'name': 'AngelList'
+    }
+}
+
+
+def build_search_plan(platforms: Mapping[str, bool], job_titles: Iterable[str],
+                      locations: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Expand the enabled platforms into one search per title and location
+
+    Args:
+        platforms: Platform key -> enabled, in config order
+        job_titles: Job titles to search for
+        locations: Locations to search in
+
+    Returns:
+        Searches ({'platform', 'platform_name', 'title', 'location', 'url'}) in
+        platform, title, location order
+    """
+    job_titles, locations = list(job_titles), list(locations)
+    searches = []
+    for platform_key, enabled in platforms.items():
+        if not enabled:
+            continue
+        if platform_key not in PLATFORM_CONFIGS:
+            logger.warning(f"Platform '{platform_key}' is enabled but not configured in PLATFORM_CONFIGS, skipping.")
+            continue
+
+        config = PLATFORM_CONFIGS[platform_key]
+        for title in job_titles:
+            for location in locations:
+                searches.append({
+                    'platform': platform_key,
+                    'platform_name': config['name'],
+                    'title': title,
+                    'location': location,
+                    'url': config['url_template'].format(
+                        title=quote_plus(title),
+                        location=quote_plus(location)
+                    )
+                })
+    return searches
@@ -0,0 +1,501 @@
+"""
+Compiled Settings for Job Automation
+Compiles .env plus config.json into a validated, typed and frozen Settings object once,
+and caches it by file mtime and content hash so repeated loads are a stat() call.
+ConfigWatcher polls the same files during long runs and reports which changes can be
+applied without restarting.
+"""
+
+import os
+import re
+import json
+import hashlib
+import logging
+import threading
+from collections import abc
+from dataclasses import MISSING, dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union, get_args, get_origin, get_type_hints
+
+logger = logging.getLogger(__name__)
+
+# ${VAR_NAME}, optionally inside a JSON string ("${VAR_NAME}")
+PLACEHOLDER = re.compile(r'"\$\{([^}]+)\}"|\$\{([^}]+)\}')
+
+
+class ConfigError(ValueError):
+    """Configuration could not be compiled; `errors` lists every problem found"""
+
+    def __init__(self, source: str, errors: List[str]):
+        self.source = source
+        self.errors = errors
+        super().__init__(f"Invalid configuration in {source}:\n" + '\n'.join(f"  - {e}" for e in errors))
+
+
+@dataclass(frozen=True)
+class PersonalInfo:
+    name: str
+    email: str
+    phone: str = ''
+    linkedin_email: str = ''
+    linkedin_password: str = field(default='', repr=False)
+    resume_path: str = ''
+    cover_letter_path: str = ''
+    cover_letter_template: str = ''
+
+
+@dataclass(frozen=True)
+class JobPreferences:
+    job_titles: Tuple[str, ...] = ()
+    locations: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    experience_level: Tuple[str, ...] = ()
+    remote_preference: str = ''
+    salary_min: int = 0
+
+
+@dataclass(frozen=True)
+class AutomationSettings:
+    """Defaults match the ones the bots fall back to when a key is absent"""
+    max_applications_per_run: int = 25
+    delay_between_applications: float = 10
+    max_searches_per_run: int = 25
+    delay_between_searches: float = 10
+    manual_interaction_time: float = 45
+    headless_browser: bool = False
+    save_screenshots: bool = True
+    send_email_notifications: bool = False
+    easy_apply_enabled: bool = False
+    offline_parsing: bool = True
+    parser_workers: Optional[int] = None
+    page_cache_enabled: bool = True
+    page_cache_ttl_days: float = 7
+    page_cache_max_mb: float = 200
+    location_filter_enabled: bool = True
+    generate_cover_letters: bool = True
+    cover_letter_format: str = 'pdf'
+    negative_cache_enabled: bool = True
+    negative_cache_ttl_days: Optional[Mapping[str, float]] = None
+    config_reload_enabled: bool = True
+    chromedriver_path: str = ''
+    chromedriver_version: str = ''
+
+
+@dataclass(frozen=True)
+class Filters:
+    exclude_companies: Tuple[str, ...] = ()
+    exclude_keywords: Tuple[str, ...] = ()
+    required_keywords: Tuple[str, ...] = ()
+
+
+# Sections validated against a dataclass; 'required' sections must be present
+SECTIONS = {
+    'personal_info': (PersonalInfo, True),
+    'job_preferences': (JobPreferences, True),
+    'automation_settings': (AutomationSettings, False),
+    'filters': (Filters, False),
+}
+
+# Settings that may change during a run, by section (None: every key). Anything else
+# (credentials, browser, caches, notifications) only takes effect on restart.
+RELOADABLE = {
+    'platforms': None,
+    'job_preferences': ('job_titles', 'locations', 'keywords', 'salary_min'),
+    'automation_settings': ('max_searches_per_run', 'delay_between_searches',
+                            'delay_between_applications', 'manual_interaction_time'),
+}
+
+CHOICES = {
+    ('automation_settings', 'cover_letter_format'): ('pdf', 'txt'),
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Validated configuration
+
+    Typed sections are frozen dataclasses; as_dict() returns a fresh, mutable copy of
+    the whole config (including sections without a schema, like application_answers)
+    for code that works with the dictionary form.
+    """
+    personal_info: PersonalInfo
+    job_preferences: JobPreferences
+    automation: AutomationSettings
+    filters: Filters
+    platforms: Mapping[str, bool]
+    source: str
+    fingerprint: str
+    _json: str = field(repr=False, compare=False)
+
+    @property
+    def enabled_platforms(self) -> Tuple[str, ...]:
+        """Enabled platforms, in config order"""
+        return tuple(name for name, enabled in self.platforms.items() if enabled)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """A new, mutable copy of the validated configuration dictionary"""
+        return json.loads(self._json)
+
+
+def parse_env_file(text: str) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines (comments, blank lines and surrounding quotes handled)
+
+    Args:
+        text: Contents of a .env file
+
+    Returns:
+        Variables in file order
+    """
+    env_vars = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#') or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        key = key.strip()
+        if key.startswith('export '):
+            key = key[len('export '):].strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        env_vars[key] = value
+    return env_vars
+
+
+def _substitute(text: str, env_vars: Dict[str, str], used_environ: Dict[str, Optional[str]],
+                errors: List[str]) -> str:
+    """Replace placeholders with JSON literals (numbers and booleans unquoted, strings escaped)"""
+
+    def replace(match):
+        quoted = match.group(1) is not None
+        name = match.group(1) or match.group(2)
+        value = env_vars.get(name)
+        if value is None:
+            value = os.environ.get(name)
+            used_environ[name] = value
+        if value is None:
+            errors.append(f"Environment variable '{name}' is not set (add it to .env)")
+            return '""' if quoted else 'null'
+        if quoted:
+            return json.dumps(value)  # Stays a string; typed settings are converted later
+        try:
+            literal = json.loads(value.lower() if value.lower() in ('true', 'false') else value)
+        except ValueError:
+            literal = None
+        return json.dumps(literal if isinstance(literal, (bool, int, float)) else value)
+
+    return PLACEHOLDER.sub(replace, text)
+
+
+def _coerce(value: Any, kind: Any, path: str, errors: List[str]) -> Any:
+    """Check value against a type hint, converting numeric and boolean strings"""
+    origin, args = get_origin(kind), get_args(kind)
+    if origin is Union:  # Optional[...]
+        if value is None:
+            return None
+        return _coerce(value, next(arg for arg in args if arg is not type(None)), path, errors)
+
+    if kind is bool:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in ('true', 'false', 'yes', 'no', '1', '0'):
+            return value.lower() in ('true', 'yes', '1')
+        errors.append(f"{path}: expected true or false, got {value!r}")
+    elif kind in (int, float):
+        if isinstance(value, str):
+            try:
+                value = float(value) if kind is float else int(value)
+            except ValueError:
+                pass
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if kind is int and value != int(value):
+                errors.append(f"{path}: expected a whole number, got {value!r}")
+            elif value < 0:
+                errors.append(f"{path}: must not be negative, got {value!r}")
+            else:
+                return int(value) if kind is int else value
+        else:
+            errors.append(f"{path}: expected a number, got {value!r}")
+    elif kind is str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return str(value)
+        errors.append(f"{path}: expected a string, got {value!r}")
+    elif origin is tuple:
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            return tuple(value)
+        errors.append(f"{path}: expected a list of strings, got {value!r}")
+    elif origin in (dict, abc.Mapping):
+        if isinstance(value, dict):
+            item_kind = args[1] if args else Any
+            return MappingProxyType({
+                key: item if item_kind is Any else _coerce(item, item_kind, f"{path}.{key}", errors)
+                for key, item in value.items()
+            })
+        errors.append(f"{path}: expected an object, got {value!r}")
+    else:
+        return value
+    return None
+
+
+def _build_section(cls, name: str, data: Any, required: bool, errors: List[str]):
+    """Validate one config section into its dataclass, writing coerced values back into data"""
+    if data is None:
+        if required:
+            errors.append(f"Missing required section: {name}")
+        data = {}
+    elif not isinstance(data, dict):
+        errors.append(f"{name}: expected an object, got {type(data).__name__}")
+        data = {}
+
+    hints = get_type_hints(cls)
+    values = {}
+    for spec in fields(cls):
+        path = f"{name}.{spec.name}"
+        if spec.name not in data:
+            if spec.default is MISSING and spec.default_factory is MISSING:
+                errors.append(f"Missing required setting: {path}")
+            continue
+        value = _coerce(data[spec.name], hints[spec.name], path, errors)
+        choices = CHOICES.get((name, spec.name))
+        if choices and value not in choices:
+            errors.append(f"{path}: must be one of {', '.join(choices)}, got {value!r}")
+        values[spec.name] = value
+        # The dictionary form carries the converted values too
+        if isinstance(value, MappingProxyType):
+            data[spec.name] = dict(value)
+        elif isinstance(value, tuple):
+            data[spec.name] = list(value)
+        else:
+            data[spec.name] = value
+    return values
+
+
+def compile_settings(config_text: str, env_text: str = '', source: str = 'config.json',
+                     used_environ: Optional[Dict[str, Optional[str]]] = None) -> Settings:
+    """
+    Compile config text and .env text into Settings
+
+    Args:
+        config_text: config.json contents, possibly with ${VAR} placeholders
+        env_text: .env contents (variables missing there are read from the environment)
+        source: Name used in error messages
+        used_environ: Filled with the environment variables the result depends on
+
+    Returns:
+        Validated Settings
+
+    Raises:
+        ConfigError: Listing every missing variable, missing setting and bad value
+    """
+    errors: List[str] = []
+    used_environ = {} if used_environ is None else used_environ
+    text = _substitute(config_text, parse_env_file(env_text), used_environ, errors)
+    try:
+        config = json.loads(text)
+    except ValueError as e:
+        raise ConfigError(source, errors + [f"Not valid JSON after substitution: {e}"])
+    if not isinstance(config, dict):
+        raise ConfigError(source, errors + ["Top level must be a JSON object"])
+
+    sections = {
+        name: _build_section(cls, name, config.get(name), required, errors)
+        for name, (cls, required) in SECTIONS.items()
+    }
+
+    platforms = config.get('platforms', {})
+    if not isinstance(platforms, dict):
+        errors.append(f"platforms: expected an object, got {type(platforms).__name__}")
+        platforms = {}
+    for name, enabled in platforms.items():
+        platforms[name] = _coerce(enabled, bool, f"platforms.{name}", errors)
+
+    if errors:
+        raise ConfigError(source, errors)
+
+    canonical = json.dumps(config, sort_keys=True)
+    return Settings(
+        personal_info=PersonalInfo(**sections['personal_info']),
+        job_preferences=JobPreferences(**sections['job_preferences']),
+        automation=AutomationSettings(**sections['automation_settings']),
+        filters=Filters(**sections['filters']),
+        platforms=MappingProxyType(dict(platforms)),
+        source=source,
+        fingerprint=hashlib.sha256(canonical.encode('utf-8')).hexdigest(),
+        _json=json.dumps(config),
+    )
+
+
+class _Entry:
+    __slots__ = ('stamps', 'digest', 'used_environ', 'settings')
+
+    def __init__(self, stamps, digest, used_environ, settings):
+        self.stamps = stamps
+        self.digest = digest
+        self.used_environ = used_environ
+        self.settings = settings
+
+
+_cache: Dict[Tuple[str, str], _Entry] = {}
+_cache_lock = threading.Lock()
+
+
+def _stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def load_settings(config_path: str = 'config/config.json', env_file: Optional[str] = '.env',
+                  export_env: bool = True) -> Settings:
+    """
+    Load compiled settings, reusing the cached result while the files are unchanged
+
+    Unchanged mtimes and sizes return the cached object without reading anything;
+    touched files are re-read and hashed, and only recompiled if their contents differ.
+
+    Args:
+        config_path: config.json (placeholders allowed)
+        env_file: .env file; None to use only the process environment
+        export_env: Also put the .env variables into os.environ (existing ones win,
+            as with python-dotenv)
+
+    Returns:
+        Validated, frozen Settings
+
+    Raises:
+        FileNotFoundError: If either file is missing
+        ConfigError: If the configuration is invalid
+    """
+    config_path = os.path.abspath(config_path)
+    env_path = os.path.abspath(env_file) if env_file else ''
+    key = (config_path, env_path)
+    stamps = (_stamp(config_path), _stamp(env_path) if env_path else None)
+
+    if stamps[0] is None:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    if env_path and stamps[1] is None:
+        raise FileNotFoundError(
+            f"Environment file not found: {env_path}\n"
+            f"Please copy .env.example to .env and fill in your credentials."
+        )
+
+    def environ_unchanged(entry: _Entry) -> bool:
+        return all(os.environ.get(name) == value for name, value in entry.used_environ.items())
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None and entry.stamps == stamps and environ_unchanged(entry):
+            return entry.settings
+
+        with open(config_path, 'rb') as f:
+            config_bytes = f.read()
+        env_bytes = b''
+        if env_path:
+            with open(env_path, 'rb') as f:
+                env_bytes = f.read()
+        digest = hashlib.sha256(config_bytes + b'\0' + env_bytes).hexdigest()
+
+        if entry is not None and entry.digest == digest and environ_unchanged(entry):
+            entry.stamps = stamps  # Touched but not changed
+            return entry.settings
+
+        env_text = env_bytes.decode('utf-8-sig')
+        used_environ: Dict[str, Optional[str]] = {}
+        settings = compile_settings(config_bytes.decode('utf-8-sig'), env_text, config_path, used_environ)
+        if export_env:
+            for name, value in parse_env_file(env_text).items():
+                os.environ.setdefault(name, value)
+        _cache[key] = _Entry(stamps, digest, used_environ, settings)
+        logger.info(f"Compiled configuration from {config_path}")
+        return settings
+
+
+def clear_cache():
+    """Forget every compiled configuration"""
+    with _cache_lock:
+        _cache.clear()
+
+
+class ConfigReload(NamedTuple):
+    """A configuration change found by ConfigWatcher.poll()"""
+    settings: Settings
+    changed: Tuple[str, ...]           # Reloadable settings that changed, as 'section.key'
+    restart_required: Tuple[str, ...]  # Changed settings that need a restart
+
+
+def diff_settings(old: Dict[str, Any], new: Dict[str, Any]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Compare two configuration dictionaries
+
+    Returns:
+        (reloadable changes, changes that need a restart), as 'section.key' paths
+    """
+    changed, restart_required = [], []
+    for section in sorted(set(old) | set(new)):
+        before, after = old.get(section), new.get(section)
+        if before == after:
+            continue
+        if section not in RELOADABLE or not isinstance(before or {}, dict) or not isinstance(after or {}, dict):
+            restart_required.append(section)
+            continue
+        before, after = before or {}, after or {}
+        allowed = RELOADABLE[section]
+        for key in sorted(set(before) | set(after)):
+            if before.get(key) != after.get(key):
+                path = f"{section}.{key}"
+                (changed if allowed is None or key in allowed else restart_required).append(path)
+    return tuple(changed), tuple(restart_required)
+
+
+class ConfigWatcher:
+    """
+    Detects edits to config.json and .env during a long run
+
+    Polling is a stat() of both files (see load_settings), cheap enough to call at
+    every search boundary. An edit that does not compile is logged once and ignored,
+    so the run continues with the last good configuration.
+    """
+
+    def __init__(self, config_path: str = 'config/config.json', env_file: Optional[str] = '.env'):
+        """
+        Initialize the watcher with the current configuration
+
+        Args:
+            config_path: config.json to watch
+            env_file: .env file to watch (None for none)
+        """
+        self.config_path = config_path
+        self.env_file = env_file
+        self.settings = load_settings(config_path, env_file)
+        self.reloads = 0
+        self._last_error: Optional[str] = None
+
+    def poll(self) -> Optional[ConfigReload]:
+        """
+        Check for a changed configuration
+
+        Returns:
+            The change, or None if nothing changed or the new config is invalid
+        """
+        try:
+            settings = load_settings(self.config_path, self.env_file)
+        except (ConfigError, OSError) as e:
+            if str(e) != self._last_error:
+                logger.warning(f"Ignoring config change, keeping the running configuration: {e}")
+                self._last_error = str(e)
+            return None
+        self._last_error = None
+        if settings.fingerprint == self.settings.fingerprint:
+            self.settings = settings
+            return None
+
+        changed, restart_required = diff_settings(self.settings.as_dict(), settings.as_dict())
+        self.settings = settings
+        self.reloads += 1
+        return ConfigReload(settings, changed, restart_required)
@@ -4,109 +4,43 @@ Loads .env file and substitutes variables in config.json
 """
 
 import os
-import json
-import re
-from pathlib import Path
+
+from settings import load_settings, parse_env_file
 
 
 def load_env_file(env_path=".env"):
     """Load environment variables from .env file without python-dotenv"""
-    env_vars = {}
-
     if not os.path.exists(env_path):
         raise FileNotFoundError(
             f"Environment file not found: {env_path}\n"
             f"Please copy .env.example to .env and fill in your credentials."
         )
 
-    with open(env_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                env_vars[key] = value
+    with open(env_path, 'r', encoding='utf-8-sig') as f:
+        env_vars = parse_env_file(f.read())
 
     print(f"[OK] Loaded {len(env_vars)} environment variables from {env_path}")
     return env_vars
 
 
-def substitute_env_vars(text, env_vars):
-    """Replace ${VAR_NAME} with environment variable values"""
-    # Pattern to match "${VAR_NAME}" (with quotes) or ${VAR_NAME} (without)
-    pattern = r'"?\$\{([^}]+)\}"?'
-
-    def replace_var(match):
-        var_name = match.group(1)
-        value = env_vars.get(var_name)
-
-        if value is None:
-            raise ValueError(
-                f"Environment variable '{var_name}' not found in .env file.\n"
-                f"Please add it to .env"
-            )
-
-        # Check if pattern had quotes (by checking what was matched)
-        matched_text = match.group(0)
-        has_quotes = matched_text.startswith('"')
-
-        # Return JSON-safe value
-        if value.lower() in ('true', 'false'):
-            return value.lower()
-        elif value.isdigit():
-            return value
-        else:
-            # Escape quotes in string values
-            value = value.replace('"', '\\"')
-            # Only add quotes if original didn't have them
-            if has_quotes:
-                return f'"{value}"'
-            else:
-                return value
-
-    return re.sub(pattern, replace_var, text)
-
-
 def load_config(config_path="config/config.json", env_file=".env"):
     """
     Load configuration with environment variable substitution
 
+    Compiled and validated by settings.load_settings, which returns the cached
+    result while neither file has changed.
+
     Args:
         config_path: Path to config JSON file
         env_file: Path to .env file
 
     Returns:
         dict: Configuration dictionary with substituted values
-    """
-    # Load environment variables
-    env_vars = load_env_file(env_file)
 
-    # Load config file
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config_text = f.read()
-
-    # Substitute environment variables
-    config_text = substitute_env_vars(config_text, env_vars)
-
-    # Parse JSON
-    config = json.loads(config_text)
+    Raises:
+        ConfigError: If the configuration is missing settings or has invalid values
+    """
+    config = load_settings(config_path, env_file).as_dict()
     print(f"[OK] Loaded configuration from {config_path}")
 
     return config
@@ -0,0 +1,6 @@
+"""Test configuration: the job automation modules are flat scripts run from this directory"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
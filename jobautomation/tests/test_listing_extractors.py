@@ -0,0 +1,221 @@
+"""Listing extractors against saved results pages (tests/fixtures)"""
+
+import os
+import sys
+import pickle
+
+import pytest
+
+lxml_html = pytest.importorskip('lxml.html')
+
+from job_record import Job
+from listing_extractors import EXTRACTORS, get_extractor
+from page_parser import parse_listing_page
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def extract(platform: str, fixture: str, page_url: str):
+    return get_extractor(platform).extract(lxml_html.fromstring(load_fixture(fixture)), page_url)
+
+
+def test_linkedin_cards():
+    jobs = extract('linkedin', 'linkedin_search.html', 'https://www.linkedin.com/jobs/search/?keywords=python')
+
+    assert [job.title for job in jobs] == ['Senior Python Developer', 'Backend Engineer (Python)']
+    first, second = jobs
+    assert first.company == 'Acme Corp'
+    assert first.location == 'Austin, TX'
+    assert first.job_id == 'linkedin:3812345678'
+    assert first.url.startswith('https://www.linkedin.com/jobs/view/senior-python-developer-at-acme-corp-3812345678')
+    assert (first.salary_min, first.salary_max) == (120000, 150000)
+    assert second.company == 'Globex'
+    assert second.job_id == 'linkedin:3819876543'
+    assert second.salary_min is None and second.salary_max is None
+
+
+def test_linkedin_repeated_posting_is_extracted_once():
+    # The promoted copy has different tracking parameters but the same posting ID
+    jobs = extract('linkedin', 'linkedin_search.html', 'https://www.linkedin.com/jobs/search/')
+    assert [job.job_id for job in jobs].count('linkedin:3812345678') == 1
+
+
+def test_indeed_cards():
+    jobs = extract('indeed', 'indeed_search.html', 'https://www.indeed.com/jobs?q=python&l=Remote')
+
+    assert len(jobs) == 2
+    hourly, annual = jobs
+    assert hourly.title == 'Python Developer'
+    assert hourly.company == 'Initech'
+    assert hourly.location == 'Remote'
+    assert hourly.url.startswith('https://www.indeed.com/rc/clk?jk=5f1c2b3a4d5e6f70')
+    assert hourly.job_id == 'indeed:5f1c2b3a4d5e6f70'
+    assert (hourly.salary_min, hourly.salary_max) == (45 * 2080, 55 * 2080)
+
+    # Older markup: companyName / companyLocation classes instead of data-testid
+    assert annual.title == 'Senior Software Engineer - Data Platform'
+    assert annual.company == 'Umbrella Health'
+    assert annual.location == 'Hybrid work in Denver, CO 80202'
+    assert annual.job_id == 'indeed:a1b2c3d4e5f60718'
+    assert (annual.salary_min, annual.salary_max) == (140000, 175000)
+
+
+def test_link_pattern_extractor():
+    jobs = extract('remotive', 'remotive_search.html', 'https://remotive.com/remote-jobs/software-dev')
+
+    # Category links in the navigation do not match the posting pattern
+    assert [job.title for job in jobs] == ['Staff Python Engineer', 'Django Developer']
+    staff, django = jobs
+    assert staff.url == 'https://remotive.com/remote-jobs/software-dev/staff-python-engineer-1893421'
+    assert staff.company == 'Hooli'
+    assert staff.location == 'USA Only'
+    assert (staff.salary_min, staff.salary_max) == (160000, 190000)
+    # Title falls back to the anchor text when the anchor has no heading
+    assert django.company == 'Pied Piper'
+    assert django.location == 'Worldwide'
+
+
+# One saved results page per remaining extractor: (fixture, page URL, expected
+# (title, company, location, URL) per job, first job's annual salary range)
+SAVED_PAGES = {
+    'dice': ('dice_search.html', 'https://www.dice.com/jobs?q=python', [
+        ('Senior Python Developer', 'Acme Corp', 'Austin, TX',
+         'https://www.dice.com/job-detail/3d9c8a1e-5b2f-4c7a-9e41-2f6b8d0c1a77?searchlink=search%2F'),
+        ('Data Engineer', 'Globex', 'Remote',
+         'https://www.dice.com/job-detail/7a1b2c3d-4e5f-4a6b-8c7d-9e0f1a2b3c4d'),
+    ], (130000, 150000)),
+    'ziprecruiter': ('ziprecruiter_search.html', 'https://www.ziprecruiter.com/jobs-search?search=python', [
+        ('Python Developer', 'Initech', 'Remote',
+         'https://www.ziprecruiter.com/c/Initech/Job/Python-Developer/-in-Remote?jid=a1b2c3d4e5f6a7b8'),
+        ('Backend Engineer', 'Umbrella Health', 'Denver, CO',
+         'https://www.ziprecruiter.com/c/Umbrella/Job/Backend-Engineer/-in-Denver,CO?jid=0f9e8d7c6b5a4f3e'),
+    ], (110000, 140000)),
+    'glassdoor': ('glassdoor_search.html', 'https://www.glassdoor.com/Job/python-jobs-SRCH_KO0,6.htm', [
+        ('Python Developer', 'Hooli', 'San Francisco, CA',
+         'https://www.glassdoor.com/job-listing/python-developer-hooli-JV_IC1147401_KO0,16_KE17,22.htm?jl=1009123456789'),
+        ('Platform Engineer', 'Pied Piper', 'Palo Alto, CA',
+         'https://www.glassdoor.com/job-listing/platform-engineer-pied-piper-JV_KO0,17_KE18,28.htm?jl=1009987654321'),
+    ], (150000, 180000)),
+    'builtin': ('builtin_search.html', 'https://builtin.com/jobs?search=python', [
+        ('Senior Python Engineer', 'Acme Corp', 'Chicago, IL', 'https://builtin.com/job/senior-python-engineer/2841937'),
+        ('Data Engineer', 'Globex', 'Remote', 'https://builtin.com/job/data-engineer/2840011'),
+    ], (135000, 165000)),
+    'monster': ('monster_search.html', 'https://www.monster.com/jobs/search?q=python', [
+        ('Python Developer', 'Initech', 'Austin, TX',
+         'https://www.monster.com/job-openings/python-developer-austin-tx--6f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0'),
+        ('QA Automation Engineer', 'Vandelay Industries', 'New York, NY',
+         'https://www.monster.com/job-openings/qa-automation-engineer-new-york-ny--0a1b2c3d-4e5f-6a7b-8c9d-0e1f2a3b4c5d'),
+    ], (120000, 140000)),
+    'careerbuilder': ('careerbuilder_search.html', 'https://www.careerbuilder.com/jobs?keywords=python', [
+        ('Python Software Engineer', 'Stark Industries', 'Boston, MA',
+         'https://www.careerbuilder.com/job/J3N7Q86Y1BC7XKMB2K3'),
+        ('DevOps Engineer', 'Wayne Enterprises', 'Gotham, NJ', 'https://www.careerbuilder.com/job/J3R1M46XYZWQ8BCD9F0'),
+    ], (95000, 120000)),
+    'weworkremotely': ('weworkremotely_search.html', 'https://weworkremotely.com/categories/remote-back-end-programming-jobs', [
+        ('Senior Python Engineer', 'Hooli', 'Anywhere in the World',
+         'https://weworkremotely.com/remote-jobs/hooli-senior-python-engineer'),
+        ('Go Developer', 'Globex', 'USA Only', 'https://weworkremotely.com/remote-jobs/globex-go-developer'),
+    ], (None, None)),
+    'flexjobs': ('flexjobs_search.html', 'https://www.flexjobs.com/search?search=python', [
+        ('Remote Python Developer', 'Initech', 'US National',
+         'https://www.flexjobs.com/publicjobs/remote-python-developer-2145887'),
+        ('Senior Backend Engineer', 'Umbrella Health', 'Canada',
+         'https://www.flexjobs.com/publicjobs/senior-backend-engineer-2146001'),
+    ], (None, None)),
+    'theladders': ('theladders_search.html', 'https://www.theladders.com/jobs/search-jobs?keywords=python', [
+        ('Senior Python Developer', 'Acme Corp', 'Austin, TX',
+         'https://www.theladders.com/job/senior-python-developer-acme-corp-austin-tx_68231457'),
+        ('Staff Engineer', 'Globex', 'Remote', 'https://www.theladders.com/job/staff-engineer-globex-remote_68239911'),
+    ], (140000, 170000)),
+    'jobright_ai': ('jobright_ai_search.html', 'https://jobright.ai/jobs/search?value=python', [
+        ('Python Developer', 'Initech', 'Remote', 'https://jobright.ai/jobs/info/66f1a2b3c4d5e6f708192a3b'),
+        ('Machine Learning Engineer', 'Hooli', 'Seattle, WA', 'https://jobright.ai/jobs/info/66f1a2b3c4d5e6f708192a3c'),
+    ], (120000, 150000)),
+    'letsworkremotely': ('letsworkremotely_search.html', 'https://letsworkremotely.com/remote-jobs/search?q=python', [
+        ('Backend Python Engineer', 'Initech', '',
+         'https://letsworkremotely.com/remote-jobs/backend-python-engineer-initech'),
+        ('Frontend Developer', 'Globex', '', 'https://letsworkremotely.com/remote-jobs/frontend-developer-globex'),
+    ], (100000, 130000)),
+    'toptal': ('toptal_search.html', 'https://www.toptal.com/freelance-jobs/developers/jobs', [
+        ('Senior Python Developer', '', '',
+         'https://www.toptal.com/freelance-jobs/developers/jobs/senior-python-developer-482913'),
+        ('React Native Developer', '', '',
+         'https://www.toptal.com/freelance-jobs/developers/jobs/react-native-developer-482977'),
+    ], (60 * 2080, 90 * 2080)),
+    'hired': ('hired_search.html', 'https://hired.com/jobs?q=python', [
+        ('Python Engineer', 'Acme Corp', '', 'https://hired.com/job/python-engineer-at-acme-corp-291044'),
+        ('Site Reliability Engineer', 'Globex', '', 'https://hired.com/job/site-reliability-engineer-at-globex-291101'),
+    ], (130000, 160000)),
+    'wellfound': ('wellfound_search.html', 'https://wellfound.com/role/python-developer', [
+        ('Senior Python Engineer', 'Hooli', 'Remote \u2022 United States',
+         'https://wellfound.com/jobs/2918374-senior-python-engineer'),
+        ('Backend Engineer', 'Pied Piper', 'Palo Alto', 'https://wellfound.com/jobs/2918402-backend-engineer'),
+    ], (150000, 190000)),
+    'angellist': ('wellfound_search.html', 'https://angel.co/role/python-developer', [
+        ('Senior Python Engineer', 'Hooli', 'Remote \u2022 United States',
+         'https://angel.co/jobs/2918374-senior-python-engineer'),
+        ('Backend Engineer', 'Pied Piper', 'Palo Alto', 'https://angel.co/jobs/2918402-backend-engineer'),
+    ], (150000, 190000)),
+    'flexa': ('flexa_search.html', 'https://flexa.careers/jobs?q=python', [
+        ('Senior Python Engineer', 'Acme Corp', '', 'https://flexa.careers/jobs/senior-python-engineer-acme'),
+        ('Data Analyst', 'Globex', '', 'https://flexa.careers/jobs/data-analyst-globex'),
+    ], (70000, 85000)),
+    'zapier': ('zapier_search.html', 'https://zapier.com/jobs', [
+        ('Senior Software Engineer, Python', '', 'Remote - Americas',
+         'https://jobs.lever.co/zapier/6c2f9a1e-3b4d-4e5f-a6b7-c8d9e0f1a2b3'),
+        ('Product Designer', '', 'Remote - EMEA', 'https://jobs.lever.co/zapier/1a2b3c4d-5e6f-4a7b-8c9d-0e1f2a3b4c5d'),
+    ], (150000, 200000)),
+    'nodesk': ('nodesk_search.html', 'https://nodesk.co/remote-jobs/python/', [
+        ('Python Developer', 'Hooli', '', 'https://nodesk.co/remote-jobs/hooli-python-developer/'),
+        ('DevOps Engineer', 'Globex', '', 'https://nodesk.co/remote-jobs/globex-devops-engineer/'),
+    ], (110000, 140000)),
+    'dynamitejobs': ('dynamitejobs_search.html', 'https://dynamitejobs.com/remote-jobs?q=python', [
+        ('Python Automation Engineer', 'Initech', '',
+         'https://dynamitejobs.com/company/initech/remote-job/python-automation-engineer'),
+        ('Customer Success Manager', 'Globex', '',
+         'https://dynamitejobs.com/company/globex/remote-job/customer-success-manager'),
+    ], (80000, 100000)),
+    'remote_co': ('remote_co_search.html', 'https://remote.co/remote-jobs/developer/', [
+        ('Senior Python Developer', 'Acme Corp', 'US Only', 'https://remote.co/job/senior-python-developer-acme-corp/'),
+        ('Technical Writer', 'Globex', 'Worldwide', 'https://remote.co/job/technical-writer-globex/'),
+    ], (125000, 145000)),
+}
+COVERED_ABOVE = {'linkedin', 'indeed', 'remotive'}
+
+
+def test_every_registered_extractor_has_a_saved_page():
+    assert set(EXTRACTORS) == set(SAVED_PAGES) | COVERED_ABOVE
+
+
+@pytest.mark.parametrize('platform', sorted(SAVED_PAGES))
+def test_saved_results_page(platform):
+    fixture, page_url, expected, salary = SAVED_PAGES[platform]
+    jobs = extract(platform, fixture, page_url)
+
+    assert [(job.title, job.company, job.location, job.url) for job in jobs] == expected
+    assert (jobs[0].salary_min, jobs[0].salary_max) == salary
+    assert all(job.platform == platform and job.job_id.startswith(f'{platform}:') for job in jobs)
+    assert len({job.job_id for job in jobs}) == len(jobs)
+
+
+def test_unknown_platform_yields_no_records():
+    result = parse_listing_page('nosuchboard', 'https://example.com/jobs', load_fixture('indeed_search.html'))
+    assert result['records'] == []
+
+
+def test_parsed_records_are_interned_after_unpickling():
+    # Records cross the worker process boundary pickled, as ParserPool results do
+    result = parse_listing_page('indeed', 'https://www.indeed.com/jobs?q=python', load_fixture('indeed_search.html'))
+    first = pickle.loads(pickle.dumps(result))['records']
+    second = pickle.loads(pickle.dumps(result))['records']
+
+    assert first == result['records']
+    assert all(isinstance(job, Job) for job in first)
+    for a, b in zip(first, second):
+        assert a.company is b.company
+        assert a.platform is b.platform is sys.intern('indeed')
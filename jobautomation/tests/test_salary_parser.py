@@ -0,0 +1,54 @@
+"""Salary parsing and the salary_min filter"""
+
+from salary_parser import parse_salary, is_below_minimum
+
+
+def annual(text: str):
+    salary = parse_salary(text)
+    return (salary.min_annual, salary.max_annual, salary.period) if salary else None
+
+
+def test_ranges_and_periods():
+    assert annual('$120,000 - $150,000 a year') == (120000, 150000, 'year')
+    assert annual('$120-150K') == (120000, 150000, 'year')
+    assert annual('$45 - $55 an hour') == (45 * 2080, 55 * 2080, 'hour')
+    assert annual('Pay: $55/hr') == (55 * 2080, 55 * 2080, 'hour')
+    # A small range without a period is an hourly rate
+    assert annual('$45 - $55') == (45 * 2080, 55 * 2080, 'hour')
+
+
+def test_amounts_that_are_not_pay():
+    assert parse_salary('We raised $50 million in our Series B') is None
+    assert parse_salary('Enjoy a $25 gift card on your first day') is None
+    assert parse_salary('$75,000 budget for home office equipment') is None
+    assert parse_salary('401k match and 5 years of experience') is None
+
+
+def test_salary_beats_earlier_money_mentions():
+    assert annual('$1,500 referral bonus. Salary $95,000 - $110,000') == (95000, 110000, 'year')
+    assert annual('We raised $2M seed. The role pays $130k - $160k per year') == (130000, 160000, 'year')
+
+
+def test_other_currencies_are_not_compared_with_salary_min():
+    salary = parse_salary('£45,000 - £55,000 per annum')
+    assert salary.currency == 'GBP'
+    assert not is_below_minimum(salary, 100000)
+    assert is_below_minimum(parse_salary('$45,000 - $55,000 a year'), 100000)
+
+
+def test_country_prefixed_dollars():
+    salary = parse_salary('CA$90,000 - CA$110,000')
+    assert (salary.min_annual, salary.max_annual, salary.currency) == (90000, 110000, 'CAD')
+    assert not is_below_minimum(salary, 100000)
+    assert parse_salary('A$120k').currency == 'AUD'
+    assert parse_salary('AU$120k - AU$140k per year').currency == 'AUD'
+    assert parse_salary('C$45 - C$55 an hour').currency == 'CAD'
+    assert parse_salary('US$95,000').currency == 'USD'
+
+
+def test_open_ended_amounts():
+    assert annual('$100,000+') == (100000, None, 'year')
+    assert annual('Salary from $90,000') == (90000, None, 'year')
+    assert annual('Up to $80K') == (None, 80000, 'year')
+    assert not is_below_minimum(parse_salary('$100,000+'), 150000)
+    assert is_below_minimum(parse_salary('Up to $80K'), 100000)
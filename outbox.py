@@ -0,0 +1,508 @@
+"""
+Durable Email Outbox
+
+SQLite-backed queue that lets sends survive failures and crashes. Every message has
+a unique idempotency key, a status, an attempt count and a next-attempt time. A
+drain worker claims due messages in batches, gives each a single send attempt and
+reschedules failures with jittered exponential backoff instead of sleeping in the
+sender. Enqueueing a batch again (for example re-running it after a crash) inserts
+nothing new, so only messages that are still pending are ever sent.
+
+A crash between the server accepting a message and the outbox recording it leaves
+the row in 'sending'. Once its claim expires it is marked 'unknown' and not resent,
+unless requeue_interrupted is set; resends reuse a Message-ID derived from the
+idempotency key, so mail providers can recognise the duplicate.
+"""
+
+import json
+import time
+import random
+import smtplib
+import sqlite3
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+from prepared_message import PreparedMessage, MessageTooLarge
+from rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    from email_automation import EmailAutomation
+
+logger = logging.getLogger(__name__)
+
+# --- Message statuses ---
+PENDING = 'pending'    # Waiting for its next attempt
+SENDING = 'sending'    # Claimed by a drain worker
+SENT = 'sent'          # Accepted by the SMTP server
+FAILED = 'failed'      # Permanent error or out of attempts
+UNKNOWN = 'unknown'    # Worker died mid-send; may or may not have been delivered
+
+
+class OutboxMessage(NamedTuple):
+    """A claimed outbox row joined with its content"""
+    id: int
+    idempotency_key: str
+    recipient: str
+    cc: List[str]
+    bcc: List[str]
+    attempts: int
+    content_id: str
+    subject: str
+    body: str
+    html_body: Optional[str]
+    attachments: List[str]
+
+
+def content_hash(subject: str, body: str, html_body: Optional[str] = None,
+                 attachments: Optional[List[str]] = None) -> str:
+    """Stable ID for message content, shared by every recipient of a batch"""
+    payload = json.dumps([subject, body, html_body, list(attachments or [])])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32]
+
+
+def is_permanent_error(error: Exception) -> bool:
+    """
+    Whether retrying a send can never succeed
+
+    5xx replies (including a 535 login rejection) and oversized messages are
+    permanent; 4xx replies, dropped connections and timeouts are transient.
+    """
+    if isinstance(error, MessageTooLarge):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class Outbox:
+    """
+    Persistent outbox of emails with retry scheduling
+
+    Content is stored once per distinct message and referenced by every recipient
+    row, so a large batch costs one body plus one small row per recipient.
+    """
+
+    def __init__(
+        self,
+        db_path: str = 'email_outbox.db',
+        max_attempts: int = 8,
+        base_delay: float = 30.0,
+        max_delay: float = 3600.0,
+        claim_timeout: float = 900.0,
+        requeue_interrupted: bool = False
+    ):
+        """
+        Initialize the outbox and create its tables.
+
+        Args:
+            db_path: SQLite database file
+            max_attempts: Attempts before a message is marked failed
+            base_delay: Delay before the second attempt, doubled per attempt
+            max_delay: Cap on the retry delay in seconds
+            claim_timeout: Seconds after which a claimed but unfinished message is
+                considered interrupted; size drain batches to finish well within it
+            requeue_interrupted: Resend interrupted messages instead of marking them unknown
+        """
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.claim_timeout = claim_timeout
+        self.requeue_interrupted = requeue_interrupted
+        self._init_database()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _init_database(self):
+        """Create the outbox tables"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS outbox_content (
+                content_id TEXT PRIMARY KEY,
+                subject TEXT,
+                body TEXT,
+                html_body TEXT,
+                attachments TEXT,
+                created_at REAL
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                batch_id TEXT,
+                content_id TEXT NOT NULL REFERENCES outbox_content(content_id),
+                recipient TEXT NOT NULL,
+                cc TEXT,
+                bcc TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                claimed_at REAL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                sent_at REAL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_outbox_batch ON outbox (batch_id)')
+        conn.commit()
+        conn.close()
+
+    def _store_content(self, cursor: sqlite3.Cursor, subject: str, body: str,
+                       html_body: Optional[str], attachments: Optional[List[str]]) -> str:
+        content_id = content_hash(subject, body, html_body, attachments)
+        cursor.execute('''
+            INSERT OR IGNORE INTO outbox_content (content_id, subject, body, html_body, attachments, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (content_id, subject, body, html_body, json.dumps(list(attachments or [])), time.time()))
+        return content_id
+
+    def enqueue(
+        self,
+        idempotency_key: str,
+        recipient: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        attachments: Optional[List[str]] = None,
+        batch_id: Optional[str] = None
+    ) -> bool:
+        """
+        Queue one message for sending.
+
+        Args:
+            idempotency_key: Unique key; enqueueing the same key again is a no-op
+            recipient: Recipient's email address
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
+            cc: Optional list of CC recipients
+            bcc: Optional list of BCC recipients
+            attachments: Optional list of file paths, read when the message is sent
+            batch_id: Optional batch the message belongs to
+
+        Returns:
+            True if the message was queued, False if the key already existed
+        """
+        now = time.time()
+        conn = self._connect()
+        cursor = conn.cursor()
+        content_id = self._store_content(cursor, subject, body, html_body, attachments)
+        cursor.execute('''
+            INSERT OR IGNORE INTO outbox
+                (idempotency_key, batch_id, content_id, recipient, cc, bcc, status,
+                 next_attempt_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (idempotency_key, batch_id, content_id, recipient, json.dumps(cc or []),
+              json.dumps(bcc or []), PENDING, now, now, now))
+        queued = cursor.rowcount == 1
+        conn.commit()
+        conn.close()
+        return queued
+
+    def enqueue_batch(
+        self,
+        batch_id: str,
+        recipients: List[str],
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None
+    ) -> int:
+        """
+        Queue one message for many recipients, keyed by batch and recipient.
+
+        Re-running the same batch_id after a crash only queues recipients that were
+        never queued; those already sent or pending are left alone.
+
+        Args:
+            batch_id: Identifies the batch; reuse it to resume, change it to resend
+            recipients: Recipient addresses (validated by the caller)
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
+
+        Returns:
+            Number of newly queued messages
+        """
+        now = time.time()
+        conn = self._connect()
+        cursor = conn.cursor()
+        content_id = self._store_content(cursor, subject, body, html_body, None)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO outbox
+                (idempotency_key, batch_id, content_id, recipient, cc, bcc, status,
+                 next_attempt_at, created_at, updated_at)
+            VALUES (?, ?, ?, ?, '[]', '[]', ?, ?, ?, ?)
+        ''', [(f'{batch_id}:{recipient.lower()}', batch_id, content_id, recipient, PENDING, now, now, now)
+              for recipient in recipients])
+        queued = cursor.rowcount
+        conn.commit()
+        conn.close()
+        return queued
+
+    def _recover_interrupted(self, cursor: sqlite3.Cursor, now: float):
+        """Resolve messages whose worker died mid-send"""
+        status = PENDING if self.requeue_interrupted else UNKNOWN
+        cursor.execute('''
+            UPDATE outbox SET status = ?, last_error = 'interrupted while sending', updated_at = ?
+            WHERE status = ? AND claimed_at < ?
+        ''', (status, now, SENDING, now - self.claim_timeout))
+        if cursor.rowcount:
+            logger.warning(f"Outbox: {cursor.rowcount} interrupted message(s) marked {status}")
+
+    def claim(self, limit: int, batch_id: Optional[str] = None,
+              due_by: Optional[float] = None) -> List[OutboxMessage]:
+        """
+        Atomically claim up to `limit` due messages for sending.
+
+        Args:
+            limit: Maximum messages to claim
+            batch_id: Only claim messages from this batch
+            due_by: Only claim messages due by this time (default: now)
+
+        Returns:
+            Claimed messages, oldest due first
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')  # One claimer at a time across processes
+            self._recover_interrupted(cursor, now)
+            query = '''
+                SELECT o.id, o.idempotency_key, o.recipient, o.cc, o.bcc, o.attempts,
+                       c.content_id, c.subject, c.body, c.html_body, c.attachments
+                FROM outbox o JOIN outbox_content c ON c.content_id = o.content_id
+                WHERE o.status = ? AND o.next_attempt_at <= ?
+            '''
+            params: List[Any] = [PENDING, now if due_by is None else min(now, due_by)]
+            if batch_id is not None:
+                query += ' AND o.batch_id = ?'
+                params.append(batch_id)
+            query += ' ORDER BY o.next_attempt_at, o.id LIMIT ?'
+            params.append(limit)
+            rows = cursor.execute(query, params).fetchall()
+            cursor.executemany('UPDATE outbox SET status = ?, claimed_at = ?, updated_at = ? WHERE id = ?',
+                               [(SENDING, now, now, row[0]) for row in rows])
+            conn.commit()
+        finally:
+            conn.close()
+        return [OutboxMessage(row[0], row[1], row[2], json.loads(row[3]), json.loads(row[4]), row[5],
+                              row[6], row[7], row[8], row[9], json.loads(row[10])) for row in rows]
+
+    def retry_delay(self, attempts: int) -> float:
+        """Jittered exponential backoff after `attempts` failed attempts"""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        return random.uniform(delay / 2, delay)
+
+    def mark_sent(self, message_id: int):
+        """Record a successful send"""
+        now = time.time()
+        conn = self._connect()
+        conn.execute('''
+            UPDATE outbox SET status = ?, attempts = attempts + 1, sent_at = ?, updated_at = ?, last_error = NULL
+            WHERE id = ?
+        ''', (SENT, now, now, message_id))
+        conn.commit()
+        conn.close()
+
+    def mark_failed(self, message: OutboxMessage, error: str, permanent: bool = False) -> str:
+        """
+        Record a failed attempt, rescheduling it unless it is permanent or out of attempts.
+
+        Returns:
+            The message's new status (PENDING or FAILED)
+        """
+        now = time.time()
+        attempts = message.attempts + 1
+        if permanent or attempts >= self.max_attempts:
+            status, next_attempt_at = FAILED, now
+        else:
+            status, next_attempt_at = PENDING, now + self.retry_delay(attempts)
+        conn = self._connect()
+        conn.execute('''
+            UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, updated_at = ?
+            WHERE id = ?
+        ''', (status, attempts, next_attempt_at, error[:500], now, message.id))
+        conn.commit()
+        conn.close()
+        return status
+
+    def release(self, message_ids: List[int]):
+        """Return claimed messages to pending without counting an attempt"""
+        now = time.time()
+        conn = self._connect()
+        conn.executemany('UPDATE outbox SET status = ?, updated_at = ? WHERE id = ? AND status = ?',
+                         [(PENDING, now, message_id, SENDING) for message_id in message_ids])
+        conn.commit()
+        conn.close()
+
+    def drain(
+        self,
+        client: 'EmailAutomation',
+        batch_size: int = 50,
+        max_messages: Optional[int] = None,
+        batch_id: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        max_workers: int = 1,
+        progress_callback: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> dict:
+        """
+        Send due messages until none are left (or max_messages is reached).
+
+        Each message gets one attempt per drain: only messages due when the drain
+        starts are claimed, so failures rescheduled during it wait for the next drain
+        rather than being retried in place. An authentication failure stops the drain
+        and returns the unsent messages to pending untouched.
+
+        Args:
+            client: EmailAutomation whose connection pool and sender address are used
+            batch_size: Messages claimed per round trip to the database
+            max_messages: Stop after this many messages
+            batch_id: Only drain this batch
+            limiter: Optional pacing shared by all workers
+            max_workers: Concurrent senders
+            progress_callback: Called as (completed, result) after each message
+
+        Returns:
+            Counts of sent, retrying and failed messages, 'aborted', and per-message
+            'results' ({'key', 'recipient', 'status', 'seconds', 'error'})
+        """
+        results = {'sent': 0, 'retrying': 0, 'failed': 0, 'aborted': False, 'results': []}
+        drain_started = time.time()
+        prepared_cache: Dict[str, PreparedMessage] = {}
+        abort = []
+
+        def prepare(message: OutboxMessage) -> PreparedMessage:
+            # Built once per distinct content in this drain
+            if message.content_id not in prepared_cache:
+                prepared_cache[message.content_id] = PreparedMessage(
+                    client.sender_email, message.subject, message.body, message.html_body,
+                    message.attachments, max_attachment_size=client.max_attachment_size,
+                    max_message_size=client.max_message_size
+                )
+            return prepared_cache[message.content_id]
+
+        def send_one(message: OutboxMessage) -> Optional[Dict[str, Any]]:
+            if abort:
+                return None
+            if limiter:
+                limiter.acquire()
+            started = time.perf_counter()
+            error = ''
+            try:
+                if not client.validate_recipients(message.recipient, message.cc, message.bcc):
+                    raise ValueError("invalid address")
+                prepared = prepare(message)
+                message_id = f'<{hashlib.sha256(message.idempotency_key.encode()).hexdigest()[:32]}@{prepared.domain}>'
+                client.pool.send_data(
+                    client.sender_email,
+                    [message.recipient] + message.cc + message.bcc,
+                    lambda: prepared.iter_data(message.recipient, message.cc, message_id),
+                    size=prepared.size
+                )
+                self.mark_sent(message.id)
+                status = SENT
+            except smtplib.SMTPAuthenticationError as e:
+                logger.error(f"Outbox drain stopped, authentication failed: {str(e)}")
+                abort.append(e)
+                return None
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                permanent = isinstance(e, ValueError) or is_permanent_error(e)
+                status = self.mark_failed(message, error, permanent)
+                logger.warning(f"Outbox send to {message.recipient} failed (attempt {message.attempts + 1}, "
+                               f"{'giving up' if status == FAILED else 'will retry'}): {error}")
+            return {'key': message.idempotency_key, 'recipient': message.recipient, 'status': status,
+                    'seconds': time.perf_counter() - started, 'error': error}
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='outbox') as executor:
+            while not abort:
+                limit = batch_size
+                if max_messages is not None:
+                    limit = min(limit, max_messages - len(results['results']))
+                    if limit <= 0:
+                        break
+                messages = self.claim(limit, batch_id, due_by=drain_started)
+                if not messages:
+                    break
+                for message, result in zip(messages, executor.map(send_one, messages)):
+                    if result is None:
+                        continue
+                    results['results'].append(result)
+                    results[{SENT: 'sent', PENDING: 'retrying'}.get(result['status'], 'failed')] += 1
+                    if progress_callback:
+                        progress_callback(len(results['results']), result)
+                if abort:
+                    done = {result['key'] for result in results['results']}
+                    self.release([message.id for message in messages if message.idempotency_key not in done])
+
+        results['aborted'] = bool(abort)
+        logger.info(f"Outbox drain: {results['sent']} sent, {results['retrying']} rescheduled, "
+                    f"{results['failed']} failed{' (aborted)' if abort else ''}")
+        return results
+
+    def next_due(self) -> Optional[float]:
+        """Timestamp of the earliest pending message, or None if nothing is pending"""
+        conn = self._connect()
+        row = conn.execute('SELECT MIN(next_attempt_at) FROM outbox WHERE status = ?', (PENDING,)).fetchone()
+        conn.close()
+        return row[0]
+
+    def run_worker(self, client: 'EmailAutomation', poll_interval: float = 30.0,
+                   should_stop: Optional[Callable[[], bool]] = None, **drain_kwargs):
+        """
+        Drain continuously, sleeping until the next message is due.
+
+        Args:
+            client: EmailAutomation used for sending
+            poll_interval: Longest sleep between drains (picks up newly queued mail)
+            should_stop: Called between drains; the worker exits when it returns True
+            **drain_kwargs: Passed to drain()
+        """
+        while not (should_stop and should_stop()):
+            if self.drain(client, **drain_kwargs)['aborted']:
+                time.sleep(poll_interval)  # Credentials are broken; don't spin
+                continue
+            next_due = self.next_due()
+            wait = poll_interval if next_due is None else min(poll_interval, max(0.0, next_due - time.time()))
+            time.sleep(wait)
+
+    def summary(self, batch_id: Optional[str] = None) -> Dict[str, int]:
+        """Message counts by status, optionally for one batch"""
+        conn = self._connect()
+        if batch_id is None:
+            rows = conn.execute('SELECT status, COUNT(*) FROM outbox GROUP BY status').fetchall()
+        else:
+            rows = conn.execute('SELECT status, COUNT(*) FROM outbox WHERE batch_id = ? GROUP BY status',
+                                (batch_id,)).fetchall()
+        conn.close()
+        counts = {status: 0 for status in (PENDING, SENDING, SENT, FAILED, UNKNOWN)}
+        counts.update(dict(rows))
+        return counts
+
+
+def main():
+    """
+    Drain the outbox once with credentials from the environment (for cron).
+    """
+    from email_automation import EmailAutomation
+
+    with EmailAutomation() as client:
+        outbox = Outbox()
+        outbox.drain(client)
+        logger.info(f"Outbox status: {outbox.summary()}")
+
+
+if __name__ == "__main__":
+    main()
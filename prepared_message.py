@@ -0,0 +1,289 @@
+"""
+Prepared Email Messages
+
+Builds the parts every recipient shares (text, HTML, attachments) once, already
+encoded, CRLF-normalized and dot-stuffed for the SMTP DATA stream. Sending to a
+recipient only formats a small header block and streams the shared chunks, so
+CPU and memory per recipient stay flat regardless of body or attachment size.
+
+Small attachments are encoded once and kept in memory; larger ones are read and
+base64-encoded in fixed-size chunks straight into the DATA stream on each send,
+so peak memory is bounded by the chunk size rather than the file size.
+"""
+
+import os
+import re
+import base64
+import logging
+import mimetypes
+from email import policy
+from email.header import Header
+from email.mime.text import MIMEText
+from email.utils import formatdate, make_msgid, encode_rfc2231
+from typing import Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+CRLF = b'\r\n'
+_LINE_START_DOT = re.compile(rb'(?m)^\.')
+_BOUNDARY_PREFIX = '=_prepared_'
+
+# base64 turns every 57 input bytes into one 76-character line, so reading in
+# multiples of 57 keeps each encoded chunk made of whole lines
+BASE64_LINE_BYTES = 57
+STREAM_CHUNK_SIZE = BASE64_LINE_BYTES * 2048  # ~114 KiB read per chunk
+INLINE_ATTACHMENT_LIMIT = 1024 * 1024  # Files up to 1 MiB are encoded once and cached
+
+
+class MessageTooLarge(ValueError):
+    """Raised when an attachment or the whole message exceeds a configured size limit"""
+
+
+def dot_stuff(data: bytes) -> bytes:
+    """Escape lines starting with '.' for the SMTP DATA stream (RFC 5321 4.5.2)"""
+    return _LINE_START_DOT.sub(b'..', data)
+
+
+def _boundary() -> str:
+    return _BOUNDARY_PREFIX + os.urandom(12).hex()
+
+
+def _text_part(text: str, subtype: str) -> bytes:
+    """Encode a text part (headers and body) once, with CRLF line endings"""
+    part = MIMEText(text, subtype)
+    del part['MIME-Version']  # Only the top-level header block carries it
+    data = part.as_bytes(policy=policy.SMTP)
+    return dot_stuff(data if data.endswith(CRLF) else data + CRLF)
+
+
+def _attachment_headers(file_path: str) -> bytes:
+    """MIME headers for a base64 attachment part"""
+    filename = os.path.basename(file_path)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    if filename.isascii():
+        disposition = f'attachment; filename="{filename}"'
+    else:
+        disposition = f"attachment; filename*={encode_rfc2231(filename, 'utf-8')}"
+    return (f'Content-Type: {content_type}\r\n'
+            f'Content-Transfer-Encoding: base64\r\n'
+            f'Content-Disposition: {disposition}\r\n\r\n').encode('utf-8')
+
+
+def _encode_attachment(file_path: str) -> bytes:
+    """Read and base64-encode a file into 76-character CRLF lines"""
+    with open(file_path, 'rb') as f:
+        return base64.encodebytes(f.read()).replace(b'\n', CRLF)
+
+
+def encoded_length(raw_size: int) -> int:
+    """Length of the CRLF-wrapped base64 encoding of raw_size bytes"""
+    lines, remainder = divmod(raw_size, BASE64_LINE_BYTES)
+    length = lines * 78  # 76 characters + CRLF
+    if remainder:
+        length += 4 * ((remainder + 2) // 3) + 2
+    return length
+
+
+class StreamedAttachment:
+    """
+    An attachment encoded incrementally from disk each time it is iterated
+
+    Only one chunk is held in memory at a time. The file must keep the size it had
+    when the message was prepared, since that size is part of the declared message
+    size; a file that changes mid-send raises OSError and the connection is dropped.
+    """
+
+    def __init__(self, file_path: str, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        Args:
+            file_path: File to stream
+            chunk_size: Raw bytes per read (rounded down to a multiple of 57)
+        """
+        self.file_path = file_path
+        self.raw_size = os.path.getsize(file_path)
+        self.chunk_size = max(BASE64_LINE_BYTES, chunk_size - chunk_size % BASE64_LINE_BYTES)
+
+    def __len__(self) -> int:
+        return encoded_length(self.raw_size)
+
+    def __iter__(self) -> Iterator[bytes]:
+        remaining = self.raw_size
+        with open(self.file_path, 'rb') as f:
+            while remaining > 0:
+                wanted = min(self.chunk_size, remaining)
+                data = f.read(wanted)
+                if len(data) != wanted:
+                    raise OSError(f"Attachment changed while sending: {self.file_path}")
+                remaining -= len(data)
+                yield base64.encodebytes(data).replace(b'\n', CRLF)
+            if f.read(1):
+                raise OSError(f"Attachment changed while sending: {self.file_path}")
+
+
+class PreparedMessage:
+    """
+    A message body shared by many recipients
+
+    Build once per batch (or per send_email call); retries and additional recipients
+    reuse the encoded parts. Every part ends with CRLF, which doubles as the CRLF
+    that opens the next boundary delimiter. Base64 lines never start with '.', so
+    attachments need no dot-stuffing; text parts are stuffed once at build time.
+    Attachments above inline_limit are streamed from disk instead of cached.
+    """
+
+    def __init__(
+        self,
+        sender: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+        attachments: Optional[Sequence[str]] = None,
+        max_attachment_size: Optional[int] = None,
+        max_message_size: Optional[int] = None,
+        inline_limit: int = INLINE_ATTACHMENT_LIMIT
+    ):
+        """
+        Build and encode the shared parts.
+
+        Args:
+            sender: From address
+            subject: Subject line
+            body: Plain text body
+            html_body: Optional HTML alternative
+            attachments: Optional file paths; missing files are skipped with a warning
+            max_attachment_size: Largest allowed attachment in bytes, before encoding
+            max_message_size: Largest allowed encoded body (all parts) in bytes
+            inline_limit: Attachments up to this many bytes are encoded once and cached
+
+        Raises:
+            MessageTooLarge: If a size limit is exceeded
+        """
+        self.sender = sender
+        self.subject = subject if subject.isascii() else Header(subject, 'utf-8').encode(linesep='\r\n')
+        self.domain = sender.rpartition('@')[2] or 'localhost'
+
+        # text/plain alone, or a multipart/alternative of text and HTML
+        if html_body:
+            inner = _boundary()
+            alternative: List[bytes] = [
+                f'--{inner}\r\n'.encode('ascii'), _text_part(body, 'plain'),
+                f'--{inner}\r\n'.encode('ascii'), _text_part(html_body, 'html'),
+                f'--{inner}--\r\n'.encode('ascii'),
+            ]
+            body_type = f'multipart/alternative; boundary="{inner}"'
+        else:
+            alternative = [_text_part(body, 'plain')]
+            body_type = None
+
+        files = [path for path in attachments or [] if self._exists(path)]
+        if not files:
+            if body_type:
+                self.content_type, self._chunks = body_type, alternative
+            else:
+                # The text part carries its own Content-Type header; lift it to the top level
+                headers, _, payload = alternative[0].partition(CRLF + CRLF)
+                self.content_type = None
+                self._part_headers = headers + CRLF
+                self._chunks = [payload]
+            self.size = sum(len(chunk) for chunk in self._chunks)
+            self._check_size(max_message_size)
+            return
+
+        outer = _boundary()
+        self.content_type = f'multipart/mixed; boundary="{outer}"'
+        chunks: List[Union[bytes, StreamedAttachment]] = [f'--{outer}\r\n'.encode('ascii')]
+        if body_type:
+            chunks.append(f'Content-Type: {body_type}\r\n\r\n'.encode('ascii'))
+        chunks.extend(alternative)
+        for path in files:
+            raw_size = os.path.getsize(path)
+            if max_attachment_size is not None and raw_size > max_attachment_size:
+                raise MessageTooLarge(
+                    f"Attachment {path} is {raw_size} bytes (limit {max_attachment_size})"
+                )
+            chunks.append(f'--{outer}\r\n'.encode('ascii'))
+            chunks.append(_attachment_headers(path))
+            if raw_size <= inline_limit:
+                chunks.append(_encode_attachment(path))
+            else:
+                chunks.append(StreamedAttachment(path))
+            logger.info(f"Attached file: {path} ({raw_size} bytes)")
+        chunks.append(f'--{outer}--\r\n'.encode('ascii'))
+        self._chunks = chunks
+        self.size = sum(len(chunk) for chunk in chunks)
+        self._check_size(max_message_size)
+
+    def _check_size(self, max_message_size: Optional[int]):
+        if max_message_size is not None and self.size > max_message_size:
+            raise MessageTooLarge(f"Message is {self.size} bytes encoded (limit {max_message_size})")
+
+    @staticmethod
+    def _exists(path: str) -> bool:
+        if os.path.exists(path):
+            return True
+        logger.warning(f"Attachment not found: {path}")
+        return False
+
+    def headers(
+        self,
+        recipient: str,
+        cc: Optional[Sequence[str]] = None,
+        message_id: Optional[str] = None
+    ) -> bytes:
+        """
+        Format the per-recipient header block.
+
+        Args:
+            recipient: To address
+            cc: Optional Cc addresses (Bcc recipients never appear in headers)
+            message_id: Fixed Message-ID (so a resend is recognisable as the same
+                message); a fresh one is generated when omitted
+
+        Returns:
+            Header bytes ending with the blank line that separates them from the body
+        """
+        lines = [
+            f'From: {self.sender}',
+            f'To: {recipient}',
+        ]
+        if cc:
+            lines.append(f"Cc: {', '.join(cc)}")
+        lines += [
+            f'Subject: {self.subject}',
+            f'Date: {formatdate(localtime=True)}',
+            f'Message-ID: {message_id or make_msgid(domain=self.domain)}',
+            'MIME-Version: 1.0',
+        ]
+        head = ('\r\n'.join(lines) + '\r\n').encode('utf-8')
+        if self.content_type:
+            return dot_stuff(head + f'Content-Type: {self.content_type}\r\n\r\n'.encode('ascii'))
+        return dot_stuff(head + self._part_headers + CRLF)
+
+    def iter_data(
+        self,
+        recipient: str,
+        cc: Optional[Sequence[str]] = None,
+        message_id: Optional[str] = None
+    ) -> Iterator[bytes]:
+        """
+        Yield the message for one recipient as DATA-ready chunks.
+
+        The chunks are CRLF-normalized and dot-stuffed; the terminating '.' line is not
+        included. Shared chunks are yielded as-is, never copied; streamed attachments
+        are encoded chunk by chunk as the generator is consumed.
+        """
+        yield self.headers(recipient, cc, message_id)
+        for chunk in self._chunks:
+            if isinstance(chunk, StreamedAttachment):
+                yield from chunk
+            else:
+                yield chunk
+
+    def as_bytes(
+        self,
+        recipient: str,
+        cc: Optional[Sequence[str]] = None,
+        message_id: Optional[str] = None
+    ) -> bytes:
+        """Serialize the message for one recipient (dot-stuffed, for inspection; defeats streaming)"""
+        return b''.join(self.iter_data(recipient, cc, message_id))
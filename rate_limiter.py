@@ -0,0 +1,134 @@
+"""
+Rate Limiting for Batch Email Sending
+
+A token bucket smooths sends to a messages-per-second rate; an optional sliding
+60-second window enforces a hard per-minute quota. Both are thread-safe and only
+sleep when a quota is actually exhausted; async callers book a slot with
+RateLimiter.reserve() and await the returned delay instead of blocking.
+"""
+
+import time
+import bisect
+import threading
+from typing import List, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate` tokens per second"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens, minimum 1)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take one token, going into debt if none is available.
+
+        Returns:
+            Seconds the caller must wait before using the token (0 if available now)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class SlidingWindowQuota:
+    """Thread-safe hard limit of `limit` events in any `window`-second span"""
+
+    def __init__(self, limit: int, window: float = 60.0):
+        """
+        Initialize the quota.
+
+        Args:
+            limit: Maximum events per window
+            window: Window length in seconds
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        self.limit = limit
+        self.window = window
+        self._events: List[float] = []  # Booked slots, kept sorted
+        self._lock = threading.Lock()
+
+    def reserve(self, not_before: float) -> float:
+        """
+        Book the earliest slot at or after not_before (a monotonic timestamp).
+
+        Returns:
+            The monotonic time of the booked slot
+        """
+        with self._lock:
+            del self._events[:bisect.bisect_right(self._events, not_before - self.window)]
+            slot = not_before
+            # Move past any window that already holds `limit` bookings
+            while True:
+                start = bisect.bisect_right(self._events, slot - self.window)
+                end = bisect.bisect_right(self._events, slot)
+                if end - start < self.limit:
+                    break
+                slot = self._events[end - self.limit] + self.window
+            bisect.insort(self._events, slot)
+            return slot
+
+
+class RateLimiter:
+    """Combined per-second token bucket and per-minute quota"""
+
+    def __init__(self, per_second: Optional[float] = None, per_minute: Optional[int] = None):
+        """
+        Initialize the limiter; either limit may be omitted.
+
+        Args:
+            per_second: Sustained messages per second
+            per_minute: Hard cap on messages in any 60-second window
+        """
+        self.bucket = TokenBucket(per_second) if per_second else None
+        self.quota = SlidingWindowQuota(per_minute) if per_minute else None
+        self.waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Book a send slot without waiting for it.
+
+        Returns:
+            Seconds the caller must wait before sending (for asyncio.sleep in async code)
+        """
+        now = time.monotonic()
+        slot = now + (self.bucket.reserve() if self.bucket else 0.0)
+        if self.quota:
+            slot = self.quota.reserve(slot)
+        wait = max(0.0, slot - now)
+        if wait:
+            with self._lock:
+                self.waited_seconds += wait
+        return wait
+
+    def acquire(self) -> float:
+        """
+        Block until one message may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,305 @@
+"""
+SMTP Connection Pool
+
+Keeps authenticated SMTP sessions open and reuses them across sends, so a batch
+pays for one TLS handshake and login per connection instead of one per message.
+"""
+
+import time
+import queue
+import socket
+import smtplib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """An open, authenticated SMTP session and its usage counters"""
+
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.messages_sent = 0
+        self.checkouts = 0
+
+    def close(self):
+        """Quit politely, falling back to dropping the socket"""
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of persistent SMTP connections
+
+    Idle connections are health-checked with NOOP before reuse once they have sat
+    longer than noop_after seconds, replaced when the check fails, and rotated
+    after max_messages_per_connection sends so long batches never outlive a
+    server-side session limit.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_starttls: bool = True,
+        use_ssl: bool = False,
+        max_size: int = 4,
+        max_messages_per_connection: int = 100,
+        noop_after: float = 10.0,
+        max_idle: float = 240.0,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize the pool (no connections are opened until first use).
+
+        Args:
+            host: SMTP server address
+            port: SMTP port
+            username: Login user; no login when omitted
+            password: Login password
+            use_starttls: Upgrade plain connections with STARTTLS (port 587)
+            use_ssl: Connect with implicit TLS (port 465)
+            max_size: Maximum open connections
+            max_messages_per_connection: Rotate a connection after this many messages
+            noop_after: Idle seconds after which a connection is NOOP-checked before reuse
+            max_idle: Idle seconds after which a connection is discarded without checking
+            timeout: Socket timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_starttls = use_starttls and not use_ssl
+        self.use_ssl = use_ssl
+        self.max_size = max_size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.noop_after = noop_after
+        self.max_idle = max_idle
+        self.timeout = timeout
+
+        self._idle: "queue.LifoQueue[PooledConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {
+            'connections_opened': 0,
+            'connections_reused': 0,
+            'health_check_failures': 0,
+            'rotations': 0,
+            'reconnects': 0,
+            'messages_sent': 0,
+        }
+
+    def _count(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _connect(self) -> PooledConnection:
+        """Open and authenticate a new connection"""
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            # Commands and streamed DATA chunks are small writes; without this, Nagle's
+            # algorithm holds them for the server's delayed ACK (~40 ms per message)
+            server.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            server.ehlo()
+            if self.use_starttls:
+                server.starttls()
+                server.ehlo()
+            if self.username and self.password:
+                server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        self._count('connections_opened')
+        return PooledConnection(server)
+
+    def _is_healthy(self, conn: PooledConnection) -> bool:
+        """Check an idle connection before handing it out"""
+        idle = time.monotonic() - conn.last_used
+        if idle > self.max_idle:
+            return False
+        if idle < self.noop_after:
+            return True
+        try:
+            return conn.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _checkout(self) -> PooledConnection:
+        """Take a healthy idle connection or open a new one (caller holds a slot)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+                conn.checkouts += 1
+                return conn
+            if self._is_healthy(conn):
+                self._count('connections_reused')
+                conn.checkouts += 1
+                return conn
+            self._count('health_check_failures')
+            conn.close()
+
+    def _checkin(self, conn: PooledConnection, broken: bool):
+        """Return a connection to the pool, rotating or discarding it when needed"""
+        conn.last_used = time.monotonic()
+        if broken or self._closed:
+            conn.close()
+        elif conn.messages_sent >= self.max_messages_per_connection:
+            self._count('rotations')
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """
+        Borrow a connection for the duration of a with-block.
+
+        The connection is discarded instead of returned if the block raises, except for
+        server rejections (refused sender/recipients, data errors) that leave the session usable.
+        """
+        if self._closed:
+            raise RuntimeError("SMTP connection pool is closed")
+        self._slots.acquire()
+        broken = True
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+            broken = False
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+            broken = False
+            raise
+        finally:
+            if conn is not None:
+                self._checkin(conn, broken)
+            self._slots.release()
+
+    def _send_with_reconnect(self, send: Callable[[smtplib.SMTP], Dict]) -> Dict:
+        """
+        Run a send on a pooled connection.
+
+        A reused connection that turns out to be dropped by the server is replaced and
+        the send repeated once immediately; other errors propagate to the caller's
+        retry policy.
+        """
+        for attempt in (1, 2):
+            reused = False
+            try:
+                with self.connection() as conn:
+                    reused = conn.checkouts > 1
+                    refused = send(conn.server)
+                    conn.messages_sent += 1
+                self._count('messages_sent')
+                return refused
+            except (smtplib.SMTPServerDisconnected, ConnectionError) as e:
+                if attempt == 2 or not reused:
+                    raise
+                logger.info(f"Pooled SMTP connection dropped ({e}); reconnecting")
+                self._count('reconnects')
+        return {}
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], msg: Union[str, bytes]) -> Dict:
+        """
+        Send one serialized message over a pooled connection.
+
+        Args:
+            from_addr: Envelope sender
+            to_addrs: Envelope recipients
+            msg: Serialized message
+
+        Returns:
+            smtplib's refused-recipients dictionary
+        """
+        return self._send_with_reconnect(lambda server: server.sendmail(from_addr, to_addrs, msg))
+
+    def send_data(
+        self,
+        from_addr: str,
+        to_addrs: List[str],
+        data: Callable[[], Iterable[bytes]],
+        size: Optional[int] = None
+    ) -> Dict:
+        """
+        Stream a message into DATA chunk by chunk, without joining it in memory.
+
+        Args:
+            from_addr: Envelope sender
+            to_addrs: Envelope recipients
+            data: Returns a fresh iterable of CRLF-normalized, dot-stuffed chunks (called
+                again if the send is repeated on a new connection)
+            size: Approximate message size, declared with MAIL FROM when the server
+                supports SIZE so oversized messages are refused before any data is sent
+
+        Returns:
+            Refused-recipients dictionary, as with sendmail
+        """
+        def send(server: smtplib.SMTP) -> Dict:
+            options = [f'SIZE={size}'] if size and server.has_extn('size') else []
+            code, resp = server.mail(from_addr, options)
+            if code != 250:
+                raise smtplib.SMTPSenderRefused(code, resp, from_addr)
+            refused = {}
+            for addr in to_addrs:
+                code, resp = server.rcpt(addr)
+                if code not in (250, 251):
+                    refused[addr] = (code, resp)
+            if len(refused) == len(to_addrs):
+                server.rset()
+                raise smtplib.SMTPRecipientsRefused(refused)
+
+            code, resp = server.docmd('data')
+            if code != 354:
+                server.rset()
+                raise smtplib.SMTPDataError(code, resp)
+            # Hold back one chunk so the terminator goes out in the same write as the
+            # end of the message, not as a small segment of its own
+            last = b''
+            for chunk in data():
+                if chunk:
+                    if last:
+                        server.sock.sendall(last)
+                    last = chunk
+            server.sock.sendall(last + (b'.\r\n' if last.endswith(b'\r\n') else b'\r\n.\r\n'))
+            code, resp = server.getreply()
+            if code != 250:
+                raise smtplib.SMTPDataError(code, resp)
+            return refused
+
+        return self._send_with_reconnect(send)
+
+    def close(self):
+        """Close all idle connections and refuse new checkouts"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def summary(self) -> Dict[str, float]:
+        """Pool statistics including the connection reuse ratio"""
+        with self._lock:
+            stats = dict(self.stats)
+        checkouts = stats['connections_opened'] + stats['connections_reused']
+        stats['reuse_rate'] = (stats['connections_reused'] / checkouts) if checkouts else 0.0
+        stats['idle_connections'] = self._idle.qsize()
+        return stats
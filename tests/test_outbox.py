@@ -0,0 +1,53 @@
+"""Outbox re-runs and retry scheduling against the local SMTP stand-in"""
+
+import os
+
+import pytest
+
+from email_automation import EmailAutomation
+from outbox import Outbox, SENT, PENDING
+from smtp_stub import LocalSMTPServer
+
+RECIPIENTS = ['ada@example.com', 'grace@example.com', 'linus@example.com']
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    # No backoff: a failed message is due again as soon as it is rescheduled
+    return Outbox(os.path.join(tmp_path, 'outbox.db'), base_delay=0.0, max_delay=0.0)
+
+
+def client_for(server):
+    return EmailAutomation('sender@example.com', 'secret', server.host, server.port,
+                           max_retries=1, use_starttls=False)
+
+
+def test_rerunning_a_batch_sends_each_recipient_once(outbox):
+    with LocalSMTPServer() as server:
+        client = client_for(server)
+        try:
+            assert outbox.enqueue_batch('weekly', RECIPIENTS, 'Hello', 'Body') == len(RECIPIENTS)
+            assert outbox.drain(client)['sent'] == len(RECIPIENTS)
+
+            # A restarted run queues the same batch again: nothing new is queued or sent
+            assert outbox.enqueue_batch('weekly', RECIPIENTS, 'Hello', 'Body') == 0
+            results = outbox.drain(client)
+        finally:
+            client.close()
+        assert results['results'] == []
+        assert server.stats['accepted'] == len(RECIPIENTS)
+    assert outbox.summary('weekly')[SENT] == len(RECIPIENTS)
+
+
+def test_transient_failures_get_one_attempt_per_drain(outbox):
+    with LocalSMTPServer(failure_rate=1.0, fail_code=451) as server:
+        client = client_for(server)
+        try:
+            outbox.enqueue_batch('weekly', RECIPIENTS, 'Hello', 'Body')
+            results = outbox.drain(client)
+        finally:
+            client.close()
+        assert results['retrying'] == len(RECIPIENTS)
+        assert sorted(r['recipient'] for r in results['results']) == sorted(RECIPIENTS)
+        assert server.stats['rejected'] == len(RECIPIENTS)
+    assert outbox.summary('weekly')[PENDING] == len(RECIPIENTS)